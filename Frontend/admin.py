@@ -1,13 +1,111 @@
 # Frontend/admin.py
+import json
+
+from django.conf import settings
 from django.contrib import admin
-from django.utils.html import format_html
-from .models import ProjectSubmission, ContactMessage
-from django.db.models import Count, Sum, Avg
+from django.contrib.admin.helpers import ACTION_CHECKBOX_NAME
+from django.contrib.admin.utils import prepare_lookup_value
+from django.contrib.admin.views.main import IGNORED_PARAMS, ORDER_VAR, SEARCH_VAR
+from django.core.exceptions import PermissionDenied
+from django.http import JsonResponse
+from django.shortcuts import get_object_or_404
+from django.urls import path, reverse
 from django.utils import timezone
+from django.utils.html import format_html
+from .models import ArchivedRecord, BulkJob, Notification, ProjectSubmission, ContactMessage
+from . import exports, jobs, replicas, rollups, search, stats
+from .pagination import KEYSET_PARAMS, KeysetPaginationMixin
+
+
+class ExportActionsMixin:
+    """Streaming CSV / NDJSON export actions (see Frontend/exports.py)"""
+    
+    def export_csv(self, request, queryset):
+        return exports.export_response(queryset, "csv")
+    export_csv.short_description = "Export selected as CSV"
+    
+    def export_ndjson(self, request, queryset):
+        return exports.export_response(queryset, "ndjson")
+    export_ndjson.short_description = "Export selected as NDJSON"
+
+
+class BulkUpdateMixin:
+    """Bulk updates for the changelist actions.
+    
+    Small selections are updated in the request; larger ones (e.g. "select
+    all N matching") become a background job (see Frontend/jobs.py).
+    """
+    
+    def bulk_update(self, request, queryset, done_message, description, **changes):
+        ids = jobs.selected_ids(queryset, settings.BULK_JOB_INLINE_LIMIT)
+        if ids is not None:
+            updated = rollups.update_queryset(queryset.model.objects.filter(pk__in=ids), **changes)
+            self.message_user(request, done_message.format(updated))
+            return
+        filters, search_term = self.selection(request)
+        job = jobs.enqueue(queryset.model, filters, search_term, description, changes, request.user)
+        self.message_user(
+            request,
+            format_html(
+                'Running "{}" in the background: <a href="{}">follow job #{}</a>.',
+                description,
+                reverse("admin:Frontend_bulkjob_change", args=[job.pk]),
+                job.pk,
+            ),
+        )
+    
+    def selection(self, request):
+        """The lookups and search term behind the action's queryset, in the
+        form BulkJob stores (see jobs.select)"""
+        if request.POST.get("select_across") != "1":
+            return {"pk__in": [request.POST.getlist(ACTION_CHECKBOX_NAME)]}, ""
+        # The changelist has already validated these against list_filter;
+        # the page cursor does not narrow a "select all".
+        filters = {
+            key: prepare_lookup_value(key, request.GET.getlist(key))
+            for key in request.GET
+            if key not in IGNORED_PARAMS and key not in KEYSET_PARAMS
+        }
+        return filters, request.GET.get(SEARCH_VAR, "")
+
+
+class ReplicaChangelistMixin:
+    """GET changelists, their stats and searches read from the replica
+    (see Frontend/replicas.py); actions and list edits stay on the primary.
+    
+    ``changelist_context`` may return ``stats``; the figures named in
+    ``stats_labels`` are shown above the list (admin/Frontend/change_list.html).
+    """
+    stats_labels = []
+    
+    def changelist_context(self):
+        return {}
+    
+    def _changelist_context(self, extra_context):
+        context = self.changelist_context()
+        if "stats" in context:
+            context["stats_summary"] = [
+                (label, context["stats"][key]) for key, label in self.stats_labels
+            ]
+        return {**context, **(extra_context or {})}
+    
+    def changelist_view(self, request, extra_context=None):
+        if request.method != "GET":
+            extra_context = self._changelist_context(extra_context)
+            return super().changelist_view(request, extra_context=extra_context)
+        with replicas.replica_reads():
+            extra_context = self._changelist_context(extra_context)
+            response = super().changelist_view(request, extra_context=extra_context)
+            # The result list is only fetched while the template renders.
+            if hasattr(response, "render"):
+                response.render()
+        return response
 
 
 @admin.register(ProjectSubmission)
-class ProjectSubmissionAdmin(admin.ModelAdmin):
+class ProjectSubmissionAdmin(
+    ReplicaChangelistMixin, BulkUpdateMixin, ExportActionsMixin, KeysetPaginationMixin, admin.ModelAdmin
+):
     list_display = [
         "id",
         "project_title",
@@ -25,7 +123,14 @@ class ProjectSubmissionAdmin(admin.ModelAdmin):
     list_per_page = 25
     
     # Actions
-    actions = ["mark_as_reviewed", "mark_as_contacted", "mark_as_accepted", "mark_as_rejected"]
+    actions = [
+        "mark_as_reviewed",
+        "mark_as_contacted",
+        "mark_as_accepted",
+        "mark_as_rejected",
+        "export_csv",
+        "export_ndjson",
+    ]
     
     fieldsets = [
         (
@@ -116,72 +221,59 @@ class ProjectSubmissionAdmin(admin.ModelAdmin):
         )
     status_badge.short_description = "Status"
     
+    def get_search_results(self, request, queryset, search_term):
+        results = search.search_queryset(queryset, search_term)
+        if results is None:
+            return super().get_search_results(request, queryset, search_term)
+        if ORDER_VAR not in request.GET:
+            results = results.order_by("-search_rank", "-pk")
+        return results, False
+    
     # Action methods
     def mark_as_reviewed(self, request, queryset):
-        updated = queryset.update(status="reviewed")
-        self.message_user(request, f"{updated} project(s) marked as reviewed.")
+        self.bulk_update(
+            request, queryset, "{} project(s) marked as reviewed.", "Mark projects as reviewed", status="reviewed"
+        )
     mark_as_reviewed.short_description = "Mark selected as reviewed"
     
     def mark_as_contacted(self, request, queryset):
-        updated = queryset.update(status="contacted")
-        self.message_user(request, f"{updated} project(s) marked as contacted.")
+        self.bulk_update(
+            request, queryset, "{} project(s) marked as contacted.", "Mark projects as contacted", status="contacted"
+        )
     mark_as_contacted.short_description = "Mark selected as contacted"
     
     def mark_as_accepted(self, request, queryset):
-        updated = queryset.update(status="accepted")
-        self.message_user(request, f"{updated} project(s) marked as accepted.")
+        self.bulk_update(
+            request, queryset, "{} project(s) marked as accepted.", "Mark projects as accepted", status="accepted"
+        )
     mark_as_accepted.short_description = "Mark selected as accepted"
     
     def mark_as_rejected(self, request, queryset):
-        updated = queryset.update(status="rejected")
-        self.message_user(request, f"{updated} project(s) marked as rejected.")
+        self.bulk_update(
+            request, queryset, "{} project(s) marked as rejected.", "Mark projects as rejected", status="rejected"
+        )
     mark_as_rejected.short_description = "Mark selected as rejected"
     
-    def changelist_view(self, request, extra_context=None):
-        extra_context = extra_context or {}
-        
+    stats_labels = [
+        ("total", "projects"),
+        ("pending", "pending"),
+        ("today", "today"),
+        ("total_budget", "total budget"),
+        ("avg_budget", "average budget"),
+    ]
+    
+    def changelist_context(self):
         try:
-            today = timezone.now().date()
-            
-            # Get counts safely
-            total_projects = ProjectSubmission.objects.count()
-            pending_count = ProjectSubmission.objects.filter(status="pending").count()
-            today_count = ProjectSubmission.objects.filter(
-                submitted_at__date=today
-            ).count()
-            
-            # Get budget aggregates safely
-            budget_agg = ProjectSubmission.objects.aggregate(
-                total=Sum("budget"),
-                avg=Avg("budget")
-            )
-            
-            stats = {
-                "total_projects": total_projects,
-                "pending_count": pending_count,
-                "today_count": today_count,
-                "total_budget": budget_agg["total"] or 0,
-                "avg_budget": budget_agg["avg"] or 0,
-            }
-            
-           
-            
+            return {"stats": stats.project_stats()}
         except Exception as e:
             # If there's an error, provide default stats
-            stats = {
-                "total_projects": 0,
-                "pending_count": 0,
-                "today_count": 0,
-                "total_budget": 0,
-                "avg_budget": 0,
-            }
-           
-        
-        return super().changelist_view(request, extra_context=extra_context)
+            return {"stats": dict(stats.EMPTY_PROJECT_STATS)}
 
 
 @admin.register(ContactMessage)
-class ContactMessageAdmin(admin.ModelAdmin):
+class ContactMessageAdmin(
+    ReplicaChangelistMixin, BulkUpdateMixin, ExportActionsMixin, KeysetPaginationMixin, admin.ModelAdmin
+):
     list_display = [
         "id",
         "name",
@@ -199,7 +291,7 @@ class ContactMessageAdmin(admin.ModelAdmin):
     list_per_page = 25
     
     # Actions
-    actions = ["mark_as_read", "mark_as_unread", "archive_messages"]
+    actions = ["mark_as_read", "mark_as_unread", "archive_messages", "export_csv", "export_ndjson"]
     
     fieldsets = [
         (
@@ -258,48 +350,152 @@ class ContactMessageAdmin(admin.ModelAdmin):
         )
     is_read_badge.short_description = "Status"
     
+    def get_search_results(self, request, queryset, search_term):
+        results = search.search_queryset(queryset, search_term)
+        if results is None:
+            return super().get_search_results(request, queryset, search_term)
+        if ORDER_VAR not in request.GET:
+            results = results.order_by("-search_rank", "-pk")
+        return results, False
+    
     # Action methods
     def mark_as_read(self, request, queryset):
-        updated = queryset.update(is_read=True)
-        self.message_user(request, f"{updated} message(s) marked as read.")
+        self.bulk_update(
+            request, queryset, "{} message(s) marked as read.", "Mark messages as read", is_read=True
+        )
     mark_as_read.short_description = "Mark selected as read"
     
     def mark_as_unread(self, request, queryset):
-        updated = queryset.update(is_read=False)
-        self.message_user(request, f"{updated} message(s) marked as unread.")
+        self.bulk_update(
+            request, queryset, "{} message(s) marked as unread.", "Mark messages as unread", is_read=False
+        )
     mark_as_unread.short_description = "Mark selected as unread"
     
     def archive_messages(self, request, queryset):
-        updated = queryset.update(is_archived=True)
-        self.message_user(request, f"{updated} message(s) archived.")
+        self.bulk_update(
+            request, queryset, "{} message(s) archived.", "Archive messages", is_archived=True
+        )
     archive_messages.short_description = "Archive selected messages"
     
-    def changelist_view(self, request, extra_context=None):
-        extra_context = extra_context or {}
-        
+    stats_labels = [
+        ("total", "messages"),
+        ("unread", "unread"),
+        ("today", "today"),
+        ("archived", "archived"),
+    ]
+    
+    def changelist_context(self):
         try:
-            today = timezone.now().date()
-            
-            stats = {
-                "total_messages": ContactMessage.objects.count(),
-                "unread_count": ContactMessage.objects.filter(is_read=False).count(),
-                "today_count": ContactMessage.objects.filter(submitted_at__date=today).count(),
-                "archived_count": ContactMessage.objects.filter(is_archived=True).count(),
-            }
-            
-            
-            
+            return {"stats": stats.contact_stats()}
         except Exception as e:
             # Provide default stats on error
-            stats = {
-                "total_messages": 0,
-                "unread_count": 0,
-                "today_count": 0,
-                "archived_count": 0,
+            return {"stats": dict(stats.EMPTY_CONTACT_STATS)}
+
+
+@admin.register(ArchivedRecord)
+class ArchivedRecordAdmin(ReplicaChangelistMixin, KeysetPaginationMixin, admin.ModelAdmin):
+    """Read-only view of the cold archive (see Frontend/archive.py).
+    
+    Rows come back with ``manage.py restore_archived``.
+    """
+    list_display = ["original_id", "source", "summary", "email", "submitted_at", "archived_at"]
+    list_display_links = ["original_id", "summary"]
+    list_filter = ["source", "submitted_at"]
+    search_fields = ["summary", "email"]
+    fields = ["source", "original_id", "summary", "email", "submitted_at", "archived_at", "payload_display"]
+    readonly_fields = fields
+    list_per_page = 50
+    
+    def payload_display(self, obj):
+        return format_html("<pre>{}</pre>", json.dumps(obj.payload, indent=2, sort_keys=True))
+    payload_display.short_description = "Original record"
+    
+    def has_add_permission(self, request):
+        return False
+    
+    def has_change_permission(self, request, obj=None):
+        return False
+    
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(BulkJob)
+class BulkJobAdmin(admin.ModelAdmin):
+    """Progress of background bulk actions; the change page updates live"""
+    list_display = ["id", "description", "status", "progress_display", "created_by", "created_at", "finished_at"]
+    list_display_links = ["id", "description"]
+    list_filter = ["status", "source"]
+    fields = [
+        "description", "source", "changes", "filters", "search", "status", "progress_display", "processed", "total",
+        "last_pk", "error", "created_by", "created_at", "started_at", "lease_expires_at", "finished_at",
+    ]
+    readonly_fields = fields
+    actions = ["cancel_jobs"]
+    
+    def progress_display(self, obj):
+        return format_html(
+            '<progress class="bulk-job-progress" max="100" value="{}"></progress> <span>{}%</span>',
+            obj.percent,
+            obj.percent,
+        )
+    progress_display.short_description = "Progress"
+    
+    def get_urls(self):
+        # Ahead of the default "<object_id>/" routes, which would match first.
+        return [
+            path(
+                "<path:object_id>/progress/",
+                self.admin_site.admin_view(self.progress_view),
+                name="Frontend_bulkjob_progress",
+            ),
+        ] + super().get_urls()
+    
+    def progress_view(self, request, object_id):
+        """JSON polled by the change page while the job runs"""
+        job = get_object_or_404(BulkJob, pk=object_id)
+        if not self.has_view_permission(request, job):
+            raise PermissionDenied
+        return JsonResponse(
+            {
+                "status": job.status,
+                "processed": job.processed,
+                "total": job.total,
+                "percent": job.percent,
+                "error": job.error,
             }
-            
-        
-        return super().changelist_view(request, extra_context=extra_context)
+        )
+    
+    def cancel_jobs(self, request, queryset):
+        cancelled = queryset.filter(status__in=["pending", "running"]).update(status="cancelled")
+        self.message_user(request, f"{cancelled} job(s) cancelled.")
+    cancel_jobs.short_description = "Cancel selected jobs"
+    
+    def has_add_permission(self, request):
+        return False
+    
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(Notification)
+class NotificationAdmin(admin.ModelAdmin):
+    """The notification outbox (see Frontend/notifications.py)"""
+    list_display = ["id", "summary", "status", "attempts", "next_attempt_at", "sent_at"]
+    list_filter = ["status", "source"]
+    search_fields = ["summary"]
+    readonly_fields = [f.name for f in Notification._meta.fields]
+    actions = ["retry_now"]
+    
+    def retry_now(self, request, queryset):
+        updated = queryset.exclude(status="sent").update(
+            status="pending", attempts=0, next_attempt_at=timezone.now(), claim=""
+        )
+        self.message_user(request, f"{updated} notification(s) queued for retry.")
+    retry_now.short_description = "Retry selected now"
+    
+    def has_add_permission(self, request):
+        return False
 
 
 # Customize admin site
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class FrontendConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'Frontend'
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,112 @@
+# Frontend/archive.py
+"""Hot/cold archival of finished records.
+
+Accepted or rejected project submissions and archived contact messages
+older than ``ARCHIVE_RETENTION_DAYS`` are copied into ``ArchivedRecord``
+(one row each, every original column in a JSON ``payload``) and deleted
+from the live tables, ``ARCHIVE_CHUNK_SIZE`` rows per transaction. The
+changelists, full-text index and duplicate checks then only cover the
+working set. The dashboard rollups keep counting archived rows, so the
+charts and totals do not change when rows move (``rollups.rebuild`` reads
+the archive too). ``restore`` puts rows back under their original ids.
+"""
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from .models import ArchivedRecord, ContactMessage, ProjectSubmission
+
+# source -> (model, rows eligible for archival, summary field)
+POLICIES = {
+    "project": (ProjectSubmission, Q(status__in=["accepted", "rejected"]), "project_title"),
+    "contact": (ContactMessage, Q(is_archived=True), "subject"),
+}
+
+
+def cutoff(days=None):
+    days = settings.ARCHIVE_RETENTION_DAYS if days is None else days
+    return timezone.now() - timedelta(days=days)
+
+
+def candidates(source, before):
+    """Live rows of ``source`` that are due for archival"""
+    model, policy, _ = POLICIES[source]
+    return model.objects.filter(policy, submitted_at__lt=before)
+
+
+def _json_value(value):
+    # DjangoJSONEncoder would cut datetimes to milliseconds.
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def to_record(source, instance):
+    _, _, summary_field = POLICIES[source]
+    return ArchivedRecord(
+        source=source,
+        original_id=instance.pk,
+        summary=(getattr(instance, summary_field) or "")[:200],
+        email=instance.email,
+        submitted_at=instance.submitted_at,
+        payload={
+            f.attname: _json_value(f.value_from_object(instance)) for f in instance._meta.concrete_fields
+        },
+    )
+
+
+def from_record(record):
+    model = POLICIES[record.source][0]
+    instance = model(**record.payload)
+    # The payload holds JSON strings; the instance gets real datetimes back.
+    for field in ("submitted_at", "created_at", "updated_at"):
+        setattr(instance, field, parse_datetime(record.payload[field]))
+    return instance
+
+
+def archive(source, before, chunk_size=None):
+    """Move every row of ``source`` due before ``before``; returns the count"""
+    chunk_size = chunk_size or settings.ARCHIVE_CHUNK_SIZE
+    model = POLICIES[source][0]
+    moved = 0
+    while True:
+        with transaction.atomic():
+            # Oldest first, so an interrupted run leaves the newest rows live.
+            chunk = list(candidates(source, before).order_by("submitted_at", "pk")[:chunk_size])
+            if not chunk:
+                return moved
+            ArchivedRecord.objects.bulk_create([to_record(source, obj) for obj in chunk])
+            # A plain DELETE: nothing references these models, so there is
+            # no cascade to collect, and skipping post_delete is the point,
+            # since the rows still count in the rollups. delete() would
+            # re-select the chunk and send a signal per row.
+            queryset = model.objects.filter(pk__in=[obj.pk for obj in chunk])
+            queryset._raw_delete(queryset.db)
+        moved += len(chunk)
+
+
+def restore(records, chunk_size=None):
+    """Put the rows behind ``records`` (an ArchivedRecord queryset) back"""
+    chunk_size = chunk_size or settings.ARCHIVE_CHUNK_SIZE
+    restored = 0
+    while True:
+        with transaction.atomic():
+            chunk = list(records.order_by("pk")[:chunk_size])
+            if not chunk:
+                return restored
+            by_model = {}
+            for record in chunk:
+                instance = from_record(record)
+                stamps = (instance.created_at, instance.updated_at)
+                by_model.setdefault(type(instance), []).append((instance, stamps))
+            for model, pairs in by_model.items():
+                objs = [obj for obj, _ in pairs]
+                model.objects.bulk_create(objs)
+                # bulk_create() stamps the auto_now fields; put the originals back.
+                for obj, (created_at, updated_at) in pairs:
+                    obj.created_at, obj.updated_at = created_at, updated_at
+                model.objects.bulk_update(objs, ["created_at", "updated_at"])
+            ArchivedRecord.objects.filter(pk__in=[record.pk for record in chunk]).delete()
+        restored += len(chunk)
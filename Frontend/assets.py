@@ -0,0 +1,272 @@
+# Frontend/assets.py
+"""Hashed, minified and precompressed static assets.
+
+``collectstatic`` with ``OptimizedManifestStaticFilesStorage`` writes
+content-hashed copies of every file plus ``staticfiles.json``; CSS and JS are
+minified on the way and get .gz/.br siblings. ``serve_static`` picks the best
+precompressed variant and marks hashed names as immutable.
+
+Scripts are ES modules (``static/Js``); the relative paths in their
+``import ... from`` statements are rewritten to the hashed names too, and
+``module_imports`` lists what a module pulls in so templates can emit
+``modulepreload`` hints for it.
+"""
+import mimetypes
+import posixpath
+import re
+from functools import lru_cache
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage, staticfiles_storage
+from django.core.files.base import ContentFile
+from django.http import Http404
+from django.utils._os import safe_join
+from django.utils.cache import patch_cache_control, patch_vary_headers
+
+from .compression import choose_encoding, file_response, write_compressed_variants
+
+COMPRESSIBLE_EXTENSIONS = (".css", ".js", ".svg", ".json", ".txt", ".html")
+IMMUTABLE_MAX_AGE = 60 * 60 * 24 * 365
+
+# A string (group 1) or a comment, whichever starts first
+_CSS_STRING_OR_COMMENT = re.compile(r"""("(?:\\.|[^"\\\n])*"|'(?:\\.|[^'\\\n])*')|/\*.*?\*/""", re.S)
+_CSS_PLACEHOLDER = re.compile(r"\x00(\d+)\x00")
+_CSS_SPACE = re.compile(r"\s+")
+_CSS_PUNCTUATION = re.compile(r"\s*([{};,>])\s*")
+_JS_STATIC_IMPORT = re.compile(
+    r"""^\s*(?:import|export)\b[^'"`;]*?\bfrom\s*['"](\.{1,2}/[^'"]+)['"]|^\s*import\s*['"](\.{1,2}/[^'"]+)['"]""",
+    re.M,
+)
+# A "/" after one of these (or a keyword below) starts a regex, not a division.
+_JS_REGEX_AFTER = set("(,=:[!&|?{};+-*%<>~^")
+_JS_REGEX_KEYWORDS = re.compile(r"\b(?:return|typeof|case|do|else|in|of|new|delete|void|throw|yield|await)$")
+
+
+def minify_css(source):
+    """Strip comments and insignificant whitespace from a stylesheet.
+
+    Strings are set aside first and put back unchanged, so neither their
+    spacing nor comment-like text inside them is touched.
+    """
+    strings = []
+
+    def set_aside(match):
+        if match[1] is None:
+            return ""
+        strings.append(match[1])
+        return f"\x00{len(strings) - 1}\x00"
+
+    source = _CSS_STRING_OR_COMMENT.sub(set_aside, source)
+    source = _CSS_SPACE.sub(" ", source)
+    source = _CSS_PUNCTUATION.sub(r"\1", source)
+    # Only the space *after* a colon is safe to drop: "a :hover" != "a:hover".
+    source = re.sub(r":\s+", ":", source)
+    source = source.replace(";}", "}").strip()
+    return _CSS_PLACEHOLDER.sub(lambda match: strings[int(match[1])], source)
+
+
+def _js_string_end(source, i):
+    quote = source[i]
+    i += 1
+    while i < len(source):
+        if source[i] == "\\":
+            i += 2
+            continue
+        if source[i] in (quote, "\n"):
+            return i + 1
+        i += 1
+    return len(source)
+
+
+def _js_template_end(source, i):
+    i += 1
+    while i < len(source):
+        if source[i] == "\\":
+            i += 2
+            continue
+        if source[i] == "`":
+            return i + 1
+        if source.startswith("${", i):
+            i = _js_expression_end(source, i + 2)
+            continue
+        i += 1
+    return len(source)
+
+
+def _js_expression_end(source, i):
+    # Index just past the "}" closing a template's ${...}
+    depth = 0
+    while i < len(source):
+        ch = source[i]
+        if ch in "'\"":
+            i = _js_string_end(source, i)
+            continue
+        if ch == "`":
+            i = _js_template_end(source, i)
+            continue
+        if ch == "{":
+            depth += 1
+        elif ch == "}":
+            if depth == 0:
+                return i + 1
+            depth -= 1
+        i += 1
+    return len(source)
+
+
+def _js_regex_end(source, i):
+    i += 1
+    in_class = False
+    while i < len(source) and source[i] != "\n":
+        ch = source[i]
+        if ch == "\\":
+            i += 2
+            continue
+        if in_class:
+            in_class = ch != "]"
+        elif ch == "[":
+            in_class = True
+        elif ch == "/":
+            i += 1
+            break
+        i += 1
+    while i < len(source) and source[i].isalnum():
+        i += 1
+    return i
+
+
+def minify_js(source):
+    """Conservative JS minifier.
+
+    Drops comments, indentation, trailing whitespace and blank lines.
+    Strings, template literals and regex literals are copied unchanged and
+    line breaks are kept, so the output is always equivalent to the input.
+    """
+    out = []
+
+    def at_line_start():
+        return not out or out[-1] == "\n"
+
+    def newline():
+        while out and out[-1] in (" ", "\t"):
+            out.pop()
+        if not at_line_start():
+            out.append("\n")
+
+    i, n = 0, len(source)
+    while i < n:
+        ch = source[i]
+        if ch in " \t\r\n" and (ch == "\n" or at_line_start()):
+            if ch == "\n":
+                newline()
+            i += 1
+        elif source.startswith("//", i):
+            end = source.find("\n", i)
+            i = n if end == -1 else end
+        elif source.startswith("/*", i):
+            end = source.find("*/", i + 2)
+            end = n if end == -1 else end + 2
+            if "\n" in source[i:end]:
+                newline()
+            elif not at_line_start():
+                out.append(" ")
+            i = end
+        elif ch in "'\"`" or ch == "/":
+            if ch == "`":
+                end = _js_template_end(source, i)
+            elif ch != "/":
+                end = _js_string_end(source, i)
+            else:
+                before = "".join(out[-32:]).rstrip()
+                if before and before[-1] not in _JS_REGEX_AFTER and not _JS_REGEX_KEYWORDS.search(before):
+                    end = i + 1  # division
+                else:
+                    end = _js_regex_end(source, i)
+            out.append(source[i:end])
+            i = end
+        else:
+            out.append(ch)
+            i += 1
+    newline()
+    return "".join(out)
+
+
+MINIFIERS = {".css": minify_css, ".js": minify_js}
+
+
+@lru_cache(maxsize=None)
+def module_imports(name):
+    """Static names of every module ``name`` imports, directly or not"""
+    path = finders.find(name)
+    if not path:
+        return ()
+    found = []
+    for match in _JS_STATIC_IMPORT.finditer(Path(path).read_text(encoding="utf-8")):
+        dependency = posixpath.normpath(posixpath.join(posixpath.dirname(name), match[1] or match[2]))
+        for item in (dependency, *module_imports(dependency)):
+            if item not in found:
+                found.append(item)
+    return tuple(found)
+
+
+class OptimizedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    manifest_strict = False
+    # Rewrite "import ... from './x.js'" to the hashed name of x.js.
+    support_js_module_import_aggregation = True
+
+    def _save(self, name, content):
+        minify = MINIFIERS.get(Path(name).suffix)
+        # Vendored builds (chart.umd.min.js, and its hashed copies) are minified already.
+        if minify is not None and ".min." not in Path(name).name:
+            content.seek(0)
+            text = content.read()
+            if isinstance(text, bytes):
+                text = text.decode("utf-8")
+            content = ContentFile(minify(text).encode("utf-8"))
+        return super()._save(name, content)
+
+    def post_process(self, paths, dry_run=False, **options):
+        yield from super().post_process(paths, dry_run, **options)
+        if dry_run:
+            return
+        # Only now are the final hashed names known; the intermediate names
+        # of files rewritten over several passes are never served.
+        for name in sorted({*paths, *self.hashed_files.values()}):
+            if name.endswith(COMPRESSIBLE_EXTENSIONS) and self.exists(name):
+                write_compressed_variants(self.path(name))
+        hashed_names.cache_clear()
+
+    def stored_name(self, name):
+        try:
+            return super().stored_name(name)
+        except ValueError:
+            # collectstatic has not been run (tests, local development).
+            return name
+
+
+@lru_cache(maxsize=1)
+def hashed_names():
+    """Every content-hashed name in the static manifest"""
+    return frozenset((getattr(staticfiles_storage, "hashed_files", None) or {}).values())
+
+
+def serve_static(request, path):
+    """Serve a collected static file, preferring a precompressed variant"""
+    try:
+        full_path = Path(safe_join(settings.STATIC_ROOT, path))
+    except ValueError:
+        raise Http404("Invalid static path")
+    if not full_path.is_file():
+        raise Http404("Static file not found")
+
+    content_type, _ = mimetypes.guess_type(full_path.name)
+    file_path, encoding = choose_encoding(request, full_path)
+    response = file_response(file_path, content_type or "application/octet-stream", encoding)
+    patch_vary_headers(response, ["Accept-Encoding"])
+    if path in hashed_names():
+        patch_cache_control(response, public=True, max_age=IMMUTABLE_MAX_AGE, immutable=True)
+    else:
+        patch_cache_control(response, public=True, no_cache=True)
+    return response
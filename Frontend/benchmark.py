@@ -0,0 +1,248 @@
+# Frontend/benchmark.py
+"""Request benchmark over every named route in Frontend/urls.py.
+
+``run`` drives each route through the test client and records requests per
+second, p50/p95/p99 latency, queries per request and the peak memory one
+request allocates (a separate tracemalloc pass, so tracing does not skew
+the timings). ``compare`` checks a report against a stored baseline and
+lists every route that got slower, hungrier or chattier by more than the
+threshold. The ``benchmark_routes`` command wraps both; the test suite runs
+a short pass to keep every route covered.
+"""
+import itertools
+import json
+import logging
+import platform
+import tempfile
+import statistics
+import time
+import tracemalloc
+from datetime import timedelta
+from decimal import Decimal
+
+import django
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import Client
+from django.test.utils import override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from . import ingest, uploads, urls
+from .models import ContactMessage, ProjectSubmission
+
+STAFF_ROUTES = {"admin_dashboard", "dashboard_charts", "metrics"}
+
+# Submissions are throttled and de-duplicated in production; lift the limits
+# so the benchmark measures the endpoints rather than the 429 path.
+UNTHROTTLED = {
+    "THROTTLE_IP_RATE": 1e9,
+    "THROTTLE_IP_BURST": 10**9,
+    "THROTTLE_GLOBAL_RATE": 1e9,
+    "THROTTLE_GLOBAL_BURST": 10**9,
+}
+
+
+def project_payload(i):
+    return {
+        "project_type": "web",
+        "client_name": "Benchmark Client",
+        "email": f"client{i}@example.com",
+        "company": "Acme Ltd",
+        "phone": "+254700000000",
+        "project_title": f"Marketing site relaunch #{i}",
+        "project_description": "A five page marketing site with a blog and a contact form.",
+        "budget": "$2,500",
+        "timeline": "standard",
+        "reference_links": "https://example.com",
+        "heard_from": "search",
+        "additional_notes": "",
+    }
+
+
+def contact_payload(i):
+    return {
+        "name": "Benchmark Sender",
+        "email": f"sender{i}@example.com",
+        "subject": "Quote request",
+        "message": f"Hello, I would like a quote for a new website ({i}).",
+    }
+
+
+# Shared by every runner and the seed so no two payloads are identical,
+# which duplicate suppression would otherwise answer without writing.
+_sequence = itertools.count(1)
+
+def upload_payload(i):
+    return {"name": f"brief-{i}.pdf", "size": 1024}
+
+
+POST_PAYLOADS = {
+    "submit_project": project_payload,
+    "submit_project_async": project_payload,
+    "submit_contact": contact_payload,
+    "submit_contact_async": contact_payload,
+    "create_upload": upload_payload,
+}
+
+# URL arguments for routes that take them, built once per run.
+ROUTE_ARGS = {
+    "upload": lambda: [uploads.create("brief.pdf", 1024)["id"]],
+}
+
+
+def named_routes():
+    """Route names in Frontend/urls.py, first occurrence wins"""
+    names = []
+    for pattern in urls.urlpatterns:
+        if pattern.name and pattern.name not in names:
+            names.append(pattern.name)
+    return names
+
+
+def seed(rows):
+    """Insert ``rows`` projects and messages so list views have data to show"""
+    now = timezone.now()
+    instances = []
+    for _ in range(rows):
+        i = next(_sequence)
+        project = ProjectSubmission(**ingest.project_fields(project_payload(i)))
+        message = ContactMessage(**ingest.contact_fields(contact_payload(i)))
+        project.submitted_at = message.submitted_at = now - timedelta(minutes=i)
+        project.budget = Decimal(str(project.budget))
+        instances += [project, message]
+    ingest.write_rows(instances)
+
+
+def percentile(sorted_values, q):
+    """Nearest-rank percentile of an already sorted list"""
+    index = max(0, min(len(sorted_values) - 1, round(q / 100 * len(sorted_values) + 0.5) - 1))
+    return sorted_values[index]
+
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+class RouteRunner:
+    def __init__(self, client, name):
+        self.client = client
+        self.name = name
+        self.path = reverse(name, args=ROUTE_ARGS[name]() if name in ROUTE_ARGS else None)
+        self.payload = POST_PAYLOADS.get(name)
+
+    def __call__(self):
+        if self.payload is None:
+            return self.client.get(self.path)
+        i = next(_sequence)
+        return self.client.post(
+            self.path,
+            json.dumps(self.payload(i)),
+            content_type="application/json",
+            REMOTE_ADDR=f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}",
+        )
+
+
+def measure(runner, iterations, warmup, memory_samples):
+    for _ in range(warmup):
+        runner()
+
+    latencies, statuses = [], set()
+    counter = QueryCounter()
+    with connection.execute_wrapper(counter):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            t0 = time.perf_counter()
+            statuses.add(runner().status_code)
+            latencies.append(time.perf_counter() - t0)
+        elapsed = time.perf_counter() - start
+
+    peak = 0
+    tracemalloc.start()
+    try:
+        for _ in range(memory_samples):
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            runner()
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - before)
+    finally:
+        tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        "method": "GET" if runner.payload is None else "POST",
+        "path": runner.path,
+        "status": sorted(statuses),
+        "requests": iterations,
+        "rps": round(iterations / elapsed, 1),
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 3),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "queries": round(counter.count / iterations, 2),
+        "alloc_kib": round(peak / 1024, 1),
+    }
+
+
+def run(iterations=200, warmup=10, memory_samples=5, routes=None):
+    """Benchmark ``routes`` (default: all named routes); returns the report"""
+    routes = routes or named_routes()
+    staff, _ = get_user_model().objects.get_or_create(
+        username="benchmark", defaults={"is_staff": True, "is_superuser": True}
+    )
+    results = {}
+    # Routes that fail would otherwise log a traceback per request.
+    request_logger = logging.getLogger("django.request")
+    level = request_logger.level
+    request_logger.setLevel(logging.CRITICAL)
+    # The test runner allows "testserver"; the management command has to.
+    allowed_hosts = [*settings.ALLOWED_HOSTS, "testserver"]
+    # Uploads created by the run go to a scratch MEDIA_ROOT.
+    media_root = tempfile.TemporaryDirectory(prefix="benchmark-media-")
+    try:
+        with override_settings(ALLOWED_HOSTS=allowed_hosts, MEDIA_ROOT=media_root.name, **UNTHROTTLED):
+            anonymous = Client(raise_request_exception=False)
+            staff_client = Client(raise_request_exception=False)
+            staff_client.force_login(staff)
+            for name in routes:
+                client = staff_client if name in STAFF_ROUTES else anonymous
+                runner = RouteRunner(client, name)
+                results[name] = measure(runner, iterations, warmup, memory_samples)
+    finally:
+        request_logger.setLevel(level)
+        media_root.cleanup()
+    return {
+        "meta": {
+            "created": timezone.now().isoformat(),
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            "database": connection.vendor,
+            "iterations": iterations,
+        },
+        "routes": results,
+    }
+
+
+def compare(report, baseline, threshold):
+    """Describe each route in ``report`` that regressed against ``baseline``"""
+    regressions = []
+    for name, current in report["routes"].items():
+        base = baseline.get("routes", {}).get(name)
+        if base is None:
+            continue
+        if current["status"] != base["status"]:
+            regressions.append(f"{name}: status {base['status']} -> {current['status']}")
+        if current["queries"] > base["queries"]:
+            regressions.append(f"{name}: queries {base['queries']} -> {current['queries']}")
+        for metric in ("p95_ms", "alloc_kib"):
+            if current[metric] > base[metric] * (1 + threshold):
+                regressions.append(f"{name}: {metric} {base[metric]} -> {current[metric]}")
+        if current["rps"] < base["rps"] * (1 - threshold):
+            regressions.append(f"{name}: rps {base['rps']} -> {current['rps']}")
+    return regressions
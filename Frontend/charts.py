@@ -0,0 +1,172 @@
+# Frontend/charts.py
+"""Time-bucketed series for the admin dashboard charts.
+
+``series`` sums the ``DailyRollup`` counters (see Frontend/rollups.py) into
+day, week or month buckets with one grouped query, so a chart costs the
+same whether a bucket holds ten submissions or ten thousand. The payload
+is columnar: one array per series, aligned with ``buckets``.
+
+Rendered payloads are cached under a key that includes a data version.
+``version`` reads it from the ``RollupVersion`` row, which rollups.py bumps
+in the same transaction as every counter change, so every worker and
+process agrees on it without sharing a cache, and stale entries are never
+read again and simply expire. The version is also the ETag, so a dashboard
+that polls gets a 304 until something is submitted.
+"""
+import hashlib
+import json
+from datetime import date, timedelta
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models import F, Sum
+from django.db.models.functions import TruncMonth, TruncWeek
+from django.utils import timezone
+
+from . import rollups
+from .models import DailyRollup, ProjectSubmission, RollupVersion
+
+PERIODS = {
+    # period -> (truncation, default number of buckets)
+    "day": (F("day"), 30),
+    "week": (TruncWeek("day"), 12),
+    "month": (TruncMonth("day"), 12),
+}
+
+
+class ChartError(ValueError):
+    pass
+
+
+def _cache():
+    return caches[settings.CHART_CACHE_ALIAS]
+
+
+def version():
+    """The rollup data version: changes whenever a rollup row does"""
+    value = RollupVersion.objects.filter(pk=rollups.VERSION_PK).values_list("value", flat=True).first()
+    return str(value or 0)
+
+
+def bucket_start(day, period):
+    if period == "week":
+        return day - timedelta(days=day.weekday())
+    if period == "month":
+        return day.replace(day=1)
+    return day
+
+
+def next_bucket(day, period):
+    if period == "week":
+        return day + timedelta(days=7)
+    if period == "month":
+        return (day.replace(day=28) + timedelta(days=4)).replace(day=1)
+    return day + timedelta(days=1)
+
+
+def date_range(period, start=None, end=None):
+    """Validated ``(period, first bucket, last day)`` for a request"""
+    if period not in PERIODS:
+        raise ChartError(f"period must be one of {', '.join(PERIODS)}")
+    try:
+        end = date.fromisoformat(end) if end else timezone.localdate()
+        if start:
+            start = date.fromisoformat(start)
+        else:
+            start = bucket_start(end, period)
+            for _ in range(PERIODS[period][1] - 1):
+                start = bucket_start(start - timedelta(days=1), period)
+    except ValueError:
+        raise ChartError("start and end must be YYYY-MM-DD dates")
+    start = bucket_start(start, period)
+    if start > end:
+        raise ChartError("start must not be after end")
+    if len(buckets(period, start, end)) > settings.CHART_MAX_BUCKETS:
+        raise ChartError(f"at most {settings.CHART_MAX_BUCKETS} buckets per request")
+    return period, start, end
+
+
+def buckets(period, start, end):
+    days = []
+    day = start
+    while day <= end:
+        days.append(day)
+        day = next_bucket(day, period)
+    return days
+
+
+def _choices(field):
+    return ProjectSubmission._meta.get_field(field).choices
+
+
+def series(period, start, end):
+    """Columnar chart data for ``[start, end]`` in ``period`` buckets"""
+    days = buckets(period, start, end)
+    index = {day: i for i, day in enumerate(days)}
+    projects = [0] * len(days)
+    messages = [0] * len(days)
+    budget = [0.0] * len(days)
+    types = {key: [0, 0.0] for key, _ in _choices("project_type")}
+    statuses = {key: 0 for key, _ in _choices("status")}
+
+    rows = (
+        DailyRollup.objects.filter(day__gte=start, day__lte=end)
+        .exclude(bucket__startswith="archived:")
+        .order_by()
+        .values("source", "bucket", start=PERIODS[period][0])
+        .annotate(n=Sum("count"), budget=Sum("budget_total"))
+    )
+    for row in rows:
+        i = index[row["start"]]
+        dimension, _, value = row["bucket"].partition(":")
+        if row["source"] == "contact":
+            # read:0 and read:1 together count every message once.
+            messages[i] += row["n"]
+        elif dimension == "status":
+            projects[i] += row["n"]
+            budget[i] += float(row["budget"] or 0)
+            statuses[value] = statuses.get(value, 0) + row["n"]
+        elif dimension == "type":
+            totals = types.setdefault(value, [0, 0.0])
+            totals[0] += row["n"]
+            totals[1] += float(row["budget"] or 0)
+
+    labels = {**dict(_choices("project_type")), **dict(_choices("status"))}
+    return {
+        "period": period,
+        "start": start.isoformat(),
+        "end": end.isoformat(),
+        "buckets": [day.isoformat() for day in days],
+        "projects": projects,
+        "messages": messages,
+        "budget": [round(value, 2) for value in budget],
+        "types": {
+            "keys": list(types),
+            "labels": [labels.get(key, key) for key in types],
+            "count": [count for count, _ in types.values()],
+            "budget": [round(total, 2) for _, total in types.values()],
+        },
+        "statuses": {
+            "keys": list(statuses),
+            "labels": [labels.get(key, key) for key in statuses],
+            "count": list(statuses.values()),
+        },
+    }
+
+
+def cache_key(period, start, end):
+    return f"charts:{version()}:{period}:{start.isoformat()}:{end.isoformat()}"
+
+
+def etag(key):
+    return '"%s"' % hashlib.sha256(key.encode()).hexdigest()[:32]
+
+
+def payload(key, period, start, end):
+    """The JSON body for ``key``, rendered once per data version"""
+    cache = _cache()
+    body = cache.get(key)
+    if body is None:
+        body = json.dumps(series(period, start, end), separators=(",", ":")).encode()
+        cache.set(key, body, settings.CHART_CACHE_TIMEOUT)
+    return body
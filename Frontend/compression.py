@@ -0,0 +1,77 @@
+# Frontend/compression.py
+"""Precompressed (.gz / .br) file variants and Accept-Encoding negotiation."""
+import gzip
+from pathlib import Path
+
+import brotli
+from django.http import FileResponse
+
+
+# Preferred order when the client accepts several encodings equally.
+ENCODINGS = [("br", ".br"), ("gzip", ".gz")]
+
+
+def write_compressed_variants(path, data=None):
+    """Write ``path.gz`` and ``path.br`` next to ``path``"""
+    path = Path(path)
+    if data is None:
+        data = path.read_bytes()
+    written = []
+    gz_path = path.with_name(path.name + ".gz")
+    # mtime=0 keeps the output byte-for-byte reproducible between builds.
+    gz_path.write_bytes(gzip.compress(data, compresslevel=9, mtime=0))
+    written.append(gz_path)
+    br_path = path.with_name(path.name + ".br")
+    br_path.write_bytes(brotli.compress(data, quality=11))
+    written.append(br_path)
+    return written
+
+
+def parse_accept_encoding(header):
+    """Map of accepted content-codings to their q-values"""
+    accepted = {}
+    for item in (header or "").split(","):
+        coding, _, params = item.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[coding] = q
+    return accepted
+
+
+def choose_encoding(request, path):
+    """Best precompressed sibling of ``path`` for this request.
+
+    Returns ``(file_path, content_encoding)``; ``content_encoding`` is None when
+    the plain file should be served.
+    """
+    accepted = parse_accept_encoding(request.META.get("HTTP_ACCEPT_ENCODING"))
+    path = Path(path)
+    for coding, suffix in ENCODINGS:
+        q = accepted.get(coding, accepted.get("*", 0.0))
+        if q <= 0:
+            continue
+        candidate = path.with_name(path.name + suffix)
+        if candidate.is_file():
+            return candidate, coding
+    return path, None
+
+
+def file_response(path, content_type, encoding=None):
+    """``FileResponse`` for a file served inline under its request path.
+
+    FileResponse derives a ``Content-Disposition`` filename from the file on
+    disk, which for a variant would be e.g. "index.html.br"; it is dropped.
+    """
+    response = FileResponse(open(path, "rb"), content_type=content_type)
+    del response["Content-Disposition"]
+    if encoding:
+        response["Content-Encoding"] = encoding
+    return response
@@ -0,0 +1,355 @@
+# Frontend/critical.py
+"""Per-page critical CSS and a purged site stylesheet.
+
+``manage.py build_critical_css`` renders every page template (``ROUTES``)
+and matches the rules of ``CRITICAL_CSS_SOURCE`` against the markup:
+
+* a page's critical CSS is the rules whose selectors match one of its first
+  ``CRITICAL_FOLD_ELEMENTS`` elements (the part of the page painted first),
+  plus the @keyframes those rules animate with;
+* the site bundle is every rule that matches an element on any page or a
+  class the site's JavaScript adds at runtime.
+
+Matching is deliberately generous: ancestry is not checked and state
+pseudo-classes are ignored, so a rule is only dropped when the classes,
+ids and tag it needs never occur. The ``{% critical_css %}`` tag inlines a
+page's rules and loads the bundle without blocking rendering. Both are
+written to ``CRITICAL_CSS_DIR`` with a manifest recording the source hash,
+so a stylesheet edited since the last build falls back to the plain link.
+"""
+import hashlib
+import json
+import re
+from functools import lru_cache
+from html.parser import HTMLParser
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+
+from .assets import minify_css
+from .prerender import PRERENDER_ROUTES
+
+# One route per page template; the prerendered pages plus the contact form
+ROUTES = PRERENDER_ROUTES + ["contact"]
+
+MANIFEST_NAME = "critical.json"
+BUNDLE_NAME = "site.css"
+
+# At-rules whose block holds further rules rather than declarations
+GROUPING_AT_RULES = ("@media", "@supports", "@layer", "@container")
+# Not needed for the first paint
+INTERACTION_PSEUDO = re.compile(r":(hover|focus|focus-visible|focus-within|active|visited)\b")
+
+_PSEUDO_FUNCTION = re.compile(r"::?[\w-]+\((?:[^()]|\([^()]*\))*\)")
+_PSEUDO = re.compile(r"::?[\w-]+")
+_ATTRIBUTE = re.compile(r"\[[^\]]*\]")
+_COMBINATOR = re.compile(r"\s*[>+~]\s*|\s+")
+_SIMPLE = re.compile(r"([.#]?)((?:\\.|[\w-])+|\*)")
+_ANIMATION = re.compile(r"animation(?:-name)?\s*:([^;}]*)")
+_JS_STRING = re.compile(r"'([^'\\\n]*)'|\"([^\"\\\n]*)\"|`([^`]*)`")
+_IDENTIFIER = re.compile(r"-?[_a-zA-Z][\w-]*")
+
+
+# -- CSS ------------------------------------------------------------------
+
+def _block_end(css, start):
+    """Index just past the "}" closing the block that opens at ``start``"""
+    depth = 0
+    quote = None
+    i = start
+    while i < len(css):
+        ch = css[i]
+        if quote:
+            if ch == "\\":
+                i += 1
+            elif ch == quote:
+                quote = None
+        elif ch in "\"'":
+            quote = ch
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    return len(css)
+
+
+def parse_css(css):
+    """Split a stylesheet into ``(prelude, body)`` pairs.
+
+    ``body`` is a list of pairs for grouping at-rules, the declaration text
+    otherwise, and None for statements such as ``@import ...;``.
+    """
+    css = minify_css(css)
+    rules = []
+    i = 0
+    while i < len(css):
+        brace = css.find("{", i)
+        semicolon = css.find(";", i)
+        if brace == -1:
+            break
+        if css[i] == "@" and semicolon != -1 and semicolon < brace:
+            rules.append((css[i:semicolon].strip(), None))
+            i = semicolon + 1
+            continue
+        prelude = css[i:brace].strip()
+        end = _block_end(css, brace)
+        body = css[brace + 1 : end - 1]
+        if prelude.startswith(GROUPING_AT_RULES):
+            rules.append((prelude, parse_css(body)))
+        else:
+            rules.append((prelude, body))
+        i = end
+    return rules
+
+
+def serialize(rules):
+    out = []
+    for prelude, body in rules:
+        if body is None:
+            out.append(prelude + ";")
+        elif isinstance(body, list):
+            out.append(prelude + "{" + serialize(body) + "}")
+        else:
+            out.append(prelude + "{" + body + "}")
+    return "".join(out)
+
+
+def split_selectors(prelude):
+    """Split a selector list on the commas outside parentheses"""
+    parts, depth, current = [], 0, ""
+    for ch in prelude:
+        if ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+        elif ch == "," and depth == 0:
+            parts.append(current.strip())
+            current = ""
+            continue
+        current += ch
+    parts.append(current.strip())
+    return [p for p in parts if p]
+
+
+def compounds(selector):
+    """``(tag, ids, classes)`` for each compound selector, left to right"""
+    selector = _ATTRIBUTE.sub("", _PSEUDO.sub("", _PSEUDO_FUNCTION.sub("", selector)))
+    result = []
+    for part in _COMBINATOR.split(selector.strip()):
+        tag, ids, classes = None, set(), set()
+        for kind, name in _SIMPLE.findall(part):
+            name = name.replace("\\", "")
+            if kind == ".":
+                classes.add(name)
+            elif kind == "#":
+                ids.add(name)
+            elif name != "*":
+                tag = name.lower()
+        result.append((tag, frozenset(ids), frozenset(classes)))
+    return result
+
+
+# -- HTML -----------------------------------------------------------------
+
+class _ElementCollector(HTMLParser):
+    def __init__(self):
+        super().__init__()
+        self.elements = []
+        self.scripts = []
+        self._in_script = False
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        self.elements.append(
+            (tag, attrs.get("id") or "", frozenset((attrs.get("class") or "").split()))
+        )
+        self._in_script = tag == "script"
+
+    def handle_endtag(self, tag):
+        self._in_script = False
+
+    def handle_data(self, data):
+        if self._in_script:
+            self.scripts.append(data)
+
+
+def elements(html):
+    """``(tag, id, classes)`` for every element of ``html`` in document
+    order, and the text of its inline scripts"""
+    collector = _ElementCollector()
+    collector.feed(html)
+    collector.close()
+    return collector.elements, "\n".join(collector.scripts)
+
+
+def script_classes(source):
+    """Class names a script may add at runtime: every identifier in its
+    string literals, and the prefix of each ``"name-${...}"`` template"""
+    names, prefixes = set(), set()
+    for groups in _JS_STRING.findall(source):
+        text = "".join(groups)
+        for prefix in re.findall(r"(-?[_a-zA-Z][\w-]*)\$\{", text):
+            prefixes.add(prefix)
+        names.update(_IDENTIFIER.findall(re.sub(r"\$\{[^}]*\}", " ", text)))
+    return names, prefixes
+
+
+class ElementIndex:
+    """The tags, ids and classes that occur together on some element"""
+
+    def __init__(self, elements, extra_classes=(), class_prefixes=()):
+        self.elements = set(elements)
+        self.tags = {tag for tag, _, _ in self.elements}
+        self.extra_classes = set(extra_classes)
+        self.class_prefixes = tuple(class_prefixes)
+
+    def _optional(self, name):
+        return name in self.extra_classes or name.startswith(self.class_prefixes)
+
+    def matches(self, compound):
+        tag, ids, classes = compound
+        if tag and tag not in self.tags:
+            return False
+        # Runtime classes can land on any element, so they are not required.
+        classes = {c for c in classes if not self._optional(c)}
+        if not ids and not classes:
+            return True
+        for el_tag, el_id, el_classes in self.elements:
+            if tag and el_tag != tag:
+                continue
+            if ids and ids != {el_id}:
+                continue
+            if classes <= el_classes:
+                return True
+        return False
+
+
+def _selector_used(selector, key_index, page_index):
+    parts = compounds(selector)
+    return key_index.matches(parts[-1]) and all(page_index.matches(p) for p in parts[:-1])
+
+
+def filter_rules(rules, key_index, page_index, critical=False):
+    """The rules (and selectors) that can apply; keyframes are kept only
+    when a kept rule names them"""
+    kept = []
+    for prelude, body in rules:
+        if body is None:
+            # @import / @charset: fine for the bundle, pointless inline
+            if not critical:
+                kept.append((prelude, body))
+        elif isinstance(body, list):
+            inner = filter_rules(body, key_index, page_index, critical)
+            if any(b is not None for _, b in inner):
+                kept.append((prelude, inner))
+        elif prelude.startswith("@"):
+            if prelude.startswith(("@keyframes", "@-webkit-keyframes")):
+                kept.append((prelude, body))
+            elif not critical:
+                kept.append((prelude, body))
+        else:
+            selectors = [
+                s
+                for s in split_selectors(prelude)
+                if not (critical and INTERACTION_PSEUDO.search(s))
+                and _selector_used(s, key_index, page_index)
+            ]
+            if selectors:
+                kept.append((",".join(selectors), body))
+    return kept
+
+
+def _animation_names(rules):
+    names = set()
+    for prelude, body in rules:
+        if isinstance(body, list):
+            names |= _animation_names(body)
+        elif body and not prelude.startswith("@"):
+            for value in _ANIMATION.findall(body):
+                names.update(_IDENTIFIER.findall(value))
+    return names
+
+
+def drop_unused_keyframes(rules, names=None):
+    names = _animation_names(rules) if names is None else names
+    kept = []
+    for prelude, body in rules:
+        if prelude.startswith(("@keyframes", "@-webkit-keyframes")):
+            if prelude.split()[-1] in names:
+                kept.append((prelude, body))
+        elif isinstance(body, list):
+            kept.append((prelude, drop_unused_keyframes(body, names)))
+        else:
+            kept.append((prelude, body))
+    return kept
+
+
+def critical_css(rules, page_elements, fold):
+    page = ElementIndex(page_elements)
+    # The fold counts <body> and what follows it; <html> is always painted.
+    body = next((i for i, (tag, _, _) in enumerate(page_elements) if tag == "body"), 0)
+    above_fold = ElementIndex(page_elements[:1] + page_elements[body : body + fold])
+    return serialize(drop_unused_keyframes(filter_rules(rules, above_fold, page, critical=True)))
+
+
+def purged_css(rules, all_elements, runtime_classes=(), class_prefixes=()):
+    index = ElementIndex(all_elements, runtime_classes, class_prefixes)
+    return serialize(drop_unused_keyframes(filter_rules(rules, index, index)))
+
+
+# -- Build and lookup -------------------------------------------------------
+
+def file_sha256(path):
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def build(pages, output_dir, fold=None, scripts=()):
+    """Write the per-page critical CSS and the purged bundle.
+
+    ``pages`` maps each URL path to its rendered HTML; ``scripts`` are the
+    paths of the external scripts the pages load. Returns the manifest.
+    """
+    fold = fold or settings.CRITICAL_FOLD_ELEMENTS
+    source = finders.find(settings.CRITICAL_CSS_SOURCE)
+    rules = parse_css(Path(source).read_text(encoding="utf-8"))
+
+    sources = [Path(script).read_text(encoding="utf-8") for script in scripts]
+    all_elements = []
+    manifest = {"source_sha256": file_sha256(source), "bundle": BUNDLE_NAME, "pages": {}}
+    for path, html in pages.items():
+        page_elements, inline_scripts = elements(html)
+        all_elements += page_elements
+        sources.append(inline_scripts)
+        manifest["pages"][path] = critical_css(rules, page_elements, fold)
+
+    runtime_classes, prefixes = set(), set()
+    for text in sources:
+        names, script_prefixes = script_classes(text)
+        runtime_classes |= names
+        prefixes |= script_prefixes
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    (output_dir / BUNDLE_NAME).write_text(
+        purged_css(rules, all_elements, runtime_classes, prefixes), encoding="utf-8"
+    )
+    (output_dir / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2, sort_keys=True))
+    load_manifest.cache_clear()
+    return manifest
+
+
+@lru_cache(maxsize=1)
+def load_manifest():
+    """The build manifest, or {} when missing or built from another source"""
+    try:
+        manifest = json.loads((Path(settings.CRITICAL_CSS_DIR) / MANIFEST_NAME).read_text())
+    except (OSError, ValueError):
+        return {}
+    source = finders.find(settings.CRITICAL_CSS_SOURCE)
+    if not source or file_sha256(source) != manifest.get("source_sha256"):
+        return {}
+    return manifest
@@ -0,0 +1,32 @@
+# Frontend/database.py
+"""Per-connection database tuning.
+
+``apply_sqlite_pragmas`` runs ``settings.SQLITE_PRAGMAS`` on every new
+SQLite connection (hooked up in Frontend/signals.py). Django 5.0 has no
+``init_command`` for SQLite, so the connection_created signal is the place
+to do it; with CONN_MAX_AGE the cost is paid once per connection rather
+than once per request.
+"""
+import re
+
+from django.conf import settings
+
+_PRAGMA_VALUE = re.compile(r"^-?\w+$")
+
+
+def pragma_statements(pragmas):
+    statements = []
+    for name, value in pragmas.items():
+        if not (_PRAGMA_VALUE.match(name) and _PRAGMA_VALUE.match(str(value))):
+            raise ValueError(f"Invalid SQLite pragma {name}={value!r}")
+        statements.append(f"PRAGMA {name} = {value}")
+    return statements
+
+
+def apply_sqlite_pragmas(connection):
+    if connection.vendor != "sqlite":
+        return
+    # On the raw sqlite3 connection, so the statements are not counted as
+    # queries of whichever request happened to open the connection.
+    for statement in pragma_statements(settings.SQLITE_PRAGMAS):
+        connection.connection.execute(statement)
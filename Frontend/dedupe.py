@@ -0,0 +1,272 @@
+# Frontend/dedupe.py
+"""Duplicate suppression for the submission endpoints.
+
+Every submission is fingerprinted: a SHA-256 over its normalized fields
+(case-folded, whitespace collapsed, budget rounded to cents). A client may
+also send an ``Idempotency-Key`` header (or ``idempotency_key`` in the JSON
+body). Keys are scoped to the client's address and stored hashed in a
+unique column, so two clients picking the same key never collide.
+
+A repeat of the fingerprint within ``DEDUPE_WINDOW`` seconds, or of the key
+at any time, answers with the first row's id instead of writing again. A key
+reused with a different payload (the row's fingerprint differs) raises
+``KeyReused``, which the views answer with 422. Recent fingerprints and keys
+are kept in an in-process LRU, so double-clicks and retries never reach the
+database. Anything the LRU has not seen (another worker, a restart) is
+caught by one indexed lookup: per request on the sync endpoints, per batch
+in the write-behind queue. A queued write that fails is dropped from the
+LRU again, so it never answers for a later submission.
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from datetime import timedelta
+from decimal import Decimal
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import ContactMessage, ProjectSubmission
+from .throttle import client_ip
+
+FINGERPRINT_FIELDS = {
+    ProjectSubmission: [
+        "project_type",
+        "client_name",
+        "email",
+        "company",
+        "phone",
+        "project_title",
+        "project_description",
+        "budget",
+        "timeline",
+        "reference_links",
+        "heard_from",
+        "additional_notes",
+        "attached_files",
+    ],
+    ContactMessage: ["name", "email", "subject", "message"],
+}
+
+IDEMPOTENCY_HEADER = "HTTP_IDEMPOTENCY_KEY"
+
+
+class KeyReused(Exception):
+    def __init__(self):
+        super().__init__("Idempotency-Key was already used with a different payload")
+
+
+def _normalize(value):
+    if value is None:
+        return ""
+    if isinstance(value, (int, float, Decimal)):
+        return str(Decimal(str(value)).quantize(Decimal("0.01")))
+    return " ".join(str(value).split()).casefold()
+
+
+def fingerprint(instance):
+    model = type(instance)
+    parts = [model._meta.label_lower]
+    parts += [f"{name}={_normalize(getattr(instance, name))}" for name in FINGERPRINT_FIELDS[model]]
+    return hashlib.sha256("\x1f".join(parts).encode()).hexdigest()
+
+
+def request_key(request, data):
+    """The client's idempotency key from the header or JSON body, if any,
+    scoped to the client's address"""
+    key = request.META.get(IDEMPOTENCY_HEADER) or data.get("idempotency_key")
+    return f"{client_ip(request)}\x1f{key}" if key else None
+
+
+def prepare(instance, key=None):
+    """Set ``fingerprint`` and the hashed ``idempotency_key`` on ``instance``"""
+    instance.fingerprint = fingerprint(instance)
+    if key:
+        instance.idempotency_key = hashlib.sha256(key.encode()).hexdigest()
+    return instance
+
+
+class RecentSubmissions:
+    """LRU of fingerprint/key -> id (or pending Future) with a time window"""
+
+    def __init__(self, window, max_size):
+        self.window = window
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, keys, now=None):
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is not None and now - entry[1] < self.window:
+                    return entry[0]
+        return None
+
+    def put(self, keys, value, now=None):
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            for key in keys:
+                self._entries[key] = (value, now)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def discard(self, keys, value):
+        """Drop the entries for ``keys`` that still hold ``value``"""
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is not None and entry[0] == value:
+                    del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+recent = RecentSubmissions(settings.DEDUPE_WINDOW, settings.DEDUPE_CACHE_SIZE)
+
+
+def lookup(instance):
+    """The id (or pending Future) of a recent duplicate of ``instance``"""
+    label = type(instance)._meta.label_lower
+    if instance.idempotency_key:
+        entry = recent.get([(label, "key", instance.idempotency_key)])
+        if entry is not None:
+            value, fp = entry
+            if fp != instance.fingerprint:
+                raise KeyReused()
+            return value
+    return recent.get([(label, "fp", instance.fingerprint)])
+
+
+def remember(instance, value):
+    label = type(instance)._meta.label_lower
+    if instance.idempotency_key:
+        recent.put([(label, "key", instance.idempotency_key)], (value, instance.fingerprint))
+    recent.put([(label, "fp", instance.fingerprint)], value)
+    if isinstance(value, Future):
+        value.add_done_callback(lambda future: _forget_failed(instance, future))
+
+
+def _forget_failed(instance, future):
+    # A refused key or a failed write is this submission's alone; an
+    # identical one that comes later has to be checked afresh.
+    if future.cancelled() or future.exception() is not None:
+        label = type(instance)._meta.label_lower
+        if instance.idempotency_key:
+            recent.discard([(label, "key", instance.idempotency_key)], (future, instance.fingerprint))
+        recent.discard([(label, "fp", instance.fingerprint)], future)
+
+
+def find_existing(model, instances):
+    """The stored duplicate's id for each of ``instances`` (None if there is none).
+
+    An instance whose idempotency key belongs to a row with another
+    fingerprint gets a ``KeyReused`` error in place of the id. One query per
+    call, served by the unique key index and the
+    (fingerprint, -submitted_at) index.
+    """
+    keys = {obj.idempotency_key for obj in instances if obj.idempotency_key}
+    fingerprints = {obj.fingerprint for obj in instances if obj.fingerprint}
+    if not keys and not fingerprints:
+        return [None] * len(instances)
+    since = timezone.now() - timedelta(seconds=settings.DEDUPE_WINDOW)
+    rows = model.objects.filter(
+        Q(idempotency_key__in=keys) | Q(fingerprint__in=fingerprints, submitted_at__gte=since)
+    ).order_by("-pk").values_list("pk", "idempotency_key", "fingerprint")
+    by_key, by_fingerprint = {}, {}
+    # Newest first, so the oldest (original) row wins each mapping.
+    for pk, key, fp in rows:
+        if key:
+            by_key[key] = (pk, fp)
+        by_fingerprint[fp] = pk
+    found = []
+    for obj in instances:
+        if obj.idempotency_key in by_key:
+            pk, fp = by_key[obj.idempotency_key]
+            found.append(pk if fp == obj.fingerprint else KeyReused())
+        else:
+            found.append(by_fingerprint.get(obj.fingerprint))
+    return found
+
+
+def resolve_batch(model, instances):
+    """Split a write-behind batch into rows to insert and duplicates.
+
+    Returns ``(new, duplicates)`` where ``duplicates`` pairs each repeat with
+    the stored id, the instance in ``new`` it repeats, or a ``KeyReused``
+    error; ``link`` sets their pks (or ``rejected``) once ``new`` has been
+    inserted.
+    """
+    new, duplicates, seen = [], [], {}
+    for obj, pk in zip(instances, find_existing(model, instances)):
+        if pk is not None:
+            duplicates.append((obj, pk))
+            continue
+        keys = [k for k in (("key", obj.idempotency_key), ("fp", obj.fingerprint)) if k[1]]
+        original = next((seen[k] for k in keys if k in seen), None)
+        if original is not None:
+            if obj.idempotency_key and original.idempotency_key == obj.idempotency_key:
+                if original.fingerprint != obj.fingerprint:
+                    original = KeyReused()
+            duplicates.append((obj, original))
+            continue
+        for k in keys:
+            seen[k] = obj
+        new.append(obj)
+    return new, duplicates
+
+
+def link(duplicates):
+    for obj, original in duplicates:
+        if isinstance(original, KeyReused):
+            obj.rejected = original
+        else:
+            obj.pk = original if isinstance(original, int) else original.pk
+
+
+def save_once(instance, key=None):
+    """Save ``instance`` unless it repeats a recent submission; returns the id.
+
+    Raises ``KeyReused`` if ``key`` was already used for another payload.
+    """
+    prepare(instance, key)
+    pk = lookup(instance)
+    if isinstance(pk, Future):
+        # Queued by the async endpoint and not written yet. If that
+        # submission's key was refused, the database has the answer for
+        # this one.
+        try:
+            pk = pk.result()
+        except KeyReused:
+            pk = None
+    if pk is None:
+        pk = find_existing(type(instance), [instance])[0]
+    if isinstance(pk, KeyReused):
+        raise pk
+    if pk is None:
+        # The INSERT is the transaction's first statement, so SQLite waits
+        # for the write lock (busy_timeout) instead of having to upgrade a
+        # read lock, which fails at once under concurrent writers. The
+        # post_save receivers write the rollups and the notification outbox
+        # inside this transaction.
+        try:
+            with transaction.atomic():
+                instance.save()
+            pk = instance.pk
+        except IntegrityError:
+            # Lost a race on the idempotency key with another worker.
+            pk = find_existing(type(instance), [instance])[0]
+            if pk is None:
+                raise
+            if isinstance(pk, KeyReused):
+                raise pk
+    remember(instance, pk)
+    return pk
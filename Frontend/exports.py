@@ -0,0 +1,70 @@
+# Frontend/exports.py
+"""Streaming CSV / NDJSON export of submissions and messages.
+
+Rows are pulled with ``values_list().iterator(chunk_size=...)`` (a
+server-side cursor on PostgreSQL, chunked fetches on SQLite) and encoded one
+at a time, so memory stays flat and the first byte goes out immediately.
+Exports read from the replica when one is configured and current
+(Frontend/replicas.py).
+"""
+import csv
+import json
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+
+from .replicas import on_replica
+
+FORMATS = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+
+
+class Echo:
+    """File-like object whose write() hands the encoded line back to csv.writer"""
+
+    def write(self, value):
+        return value
+
+
+def export_fields(model):
+    return [field.attname for field in model._meta.concrete_fields]
+
+
+def iter_rows(queryset, fields, chunk_size=None):
+    chunk_size = chunk_size or settings.EXPORT_CHUNK_SIZE
+    return queryset.values_list(*fields).iterator(chunk_size=chunk_size)
+
+
+def iter_csv(queryset, fields=None, chunk_size=None):
+    fields = fields or export_fields(queryset.model)
+    writer = csv.writer(Echo())
+    yield writer.writerow(fields)
+    for row in iter_rows(queryset, fields, chunk_size):
+        yield writer.writerow(row)
+
+
+def iter_ndjson(queryset, fields=None, chunk_size=None):
+    fields = fields or export_fields(queryset.model)
+    encoder = DjangoJSONEncoder()
+    for row in iter_rows(queryset, fields, chunk_size):
+        yield encoder.encode(dict(zip(fields, row))) + "\n"
+
+
+ENCODERS = {"csv": iter_csv, "ndjson": iter_ndjson}
+
+
+def export_response(queryset, fmt):
+    """StreamingHttpResponse downloading ``queryset`` as CSV or NDJSON"""
+    filename = "%s-%s.%s" % (
+        queryset.model._meta.model_name,
+        timezone.now().strftime("%Y%m%d-%H%M%S"),
+        fmt,
+    )
+    # Streamed after the view returns, so the alias is bound to the queryset.
+    response = StreamingHttpResponse(ENCODERS[fmt](on_replica(queryset)), content_type=FORMATS[fmt])
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
@@ -0,0 +1,101 @@
+# Frontend/images.py
+"""Width-stepped WebP/AVIF derivatives of the images in ``static/images``.
+
+Derivatives live in ``IMAGE_DERIVATIVES_DIR/<source sha256>/<width>w.<fmt>``
+so a source is only re-encoded when its bytes change; files no current
+source or width needs are pruned after each build. ``IMAGE_MANIFEST_PATH``
+maps each static name to its variants and is what the
+``{% responsive_image %}`` tag reads. It is kept outside the derivatives
+directory, which collectstatic publishes.
+"""
+import hashlib
+import json
+from functools import lru_cache
+from pathlib import Path
+
+from django.conf import settings
+
+SOURCE_EXTENSIONS = (".png", ".jpg", ".jpeg")
+# AVIF first: the browser takes the first <source> type it understands.
+FORMATS = {"avif": "AVIF", "webp": "WEBP"}
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def target_widths(source_width, widths):
+    """Requested widths narrower than the source, plus the source width"""
+    return sorted({w for w in widths if w < source_width} | {source_width})
+
+
+def build_derivatives(source, output_dir, widths, formats, quality):
+    """Encode one source image; returns ``(manifest_entry, encoded_count)``"""
+    from PIL import Image
+
+    digest = file_sha256(source)
+    target_dir = Path(output_dir) / digest[:16]
+    encoded = 0
+    with Image.open(source) as image:
+        image.load()
+        source_width, source_height = image.size
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA")
+        variants = {}
+        for fmt in formats:
+            variants[fmt] = []
+            for width in target_widths(source_width, widths):
+                relative = f"{digest[:16]}/{width}w.{fmt}"
+                target = Path(output_dir) / relative
+                if not target.exists():
+                    target_dir.mkdir(parents=True, exist_ok=True)
+                    height = round(source_height * width / source_width)
+                    resized = image.resize((width, height), Image.Resampling.LANCZOS)
+                    resized.save(target, FORMATS[fmt], quality=quality)
+                    encoded += 1
+                variants[fmt].append([width, relative])
+    entry = {
+        "sha256": digest,
+        "width": source_width,
+        "height": source_height,
+        "variants": variants,
+    }
+    return entry, encoded
+
+
+def prune_derivatives(output_dir, manifest):
+    """Delete what ``manifest`` no longer references; returns the file count"""
+    output_dir = Path(output_dir)
+    keep = {
+        relative
+        for entry in manifest.values()
+        for variants in entry["variants"].values()
+        for _, relative in variants
+    }
+    removed = 0
+    for path in sorted(output_dir.rglob("*"), reverse=True):
+        if path.is_file() and path.relative_to(output_dir).as_posix() not in keep:
+            path.unlink()
+            removed += 1
+        elif path.is_dir() and not any(path.iterdir()):
+            path.rmdir()
+    return removed
+
+
+def write_manifest(manifest, path=None):
+    path = Path(path or settings.IMAGE_MANIFEST_PATH)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+    load_manifest.cache_clear()
+
+
+@lru_cache(maxsize=1)
+def load_manifest():
+    try:
+        return json.loads(Path(settings.IMAGE_MANIFEST_PATH).read_text())
+    except (OSError, ValueError):
+        return {}
@@ -0,0 +1,238 @@
+# Frontend/ingest.py
+"""Form payload parsing and the write-behind queue behind the async endpoints.
+
+``WriteBehindQueue`` collects validated model instances from any number of
+requests and inserts them with one ``bulk_create`` per model every
+``INGEST_BATCH_SIZE`` rows or ``INGEST_FLUSH_MS`` milliseconds, whichever
+comes first. Each caller gets a future that resolves to the new row's id
+once its batch is committed. Rows that cannot be written (database down,
+process shutting down) are appended to ``INGEST_SPOOL_PATH`` as NDJSON and
+replayed with ``manage.py replay_ingest_spool``; their futures resolve to
+None, which the endpoints report as 202 "queued".
+
+A caller that goes away may cancel its future; its row is written all
+the same. No single batch can stop the writer thread, and ``get_queue``
+replaces a queue whose thread has died anyway.
+"""
+import atexit
+import json
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future, InvalidStateError
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import close_old_connections, connection, transaction
+from django.forms.models import model_to_dict
+
+from . import dedupe, notifications, rollups, uploads
+from .models import ContactMessage, ProjectSubmission
+
+logger = logging.getLogger(__name__)
+
+MODELS = {"project": ProjectSubmission, "contact": ContactMessage}
+
+
+def parse_budget(value):
+    if isinstance(value, (int, float)):
+        return float(value)
+    return float(str(value or 0).replace("$", "").replace(",", "") or 0)
+
+
+def project_fields(data):
+    return {
+        "project_type": data.get("project_type"),
+        "client_name": data.get("client_name"),
+        "email": data.get("email"),
+        "company": data.get("company", ""),
+        "phone": data.get("phone", ""),
+        "project_title": data.get("project_title"),
+        "project_description": data.get("project_description"),
+        "budget": parse_budget(data.get("budget", 0)),
+        "timeline": data.get("timeline"),
+        "reference_links": data.get("reference_links", ""),
+        "heard_from": data.get("heard_from", ""),
+        "additional_notes": data.get("additional_notes", ""),
+        "attached_files": uploads.attachments(data.get("attachments")),
+    }
+
+
+def contact_fields(data):
+    return {
+        "name": data.get("name", "").strip(),
+        "email": data.get("email", "").strip(),
+        "subject": data.get("subject", "").strip(),
+        "message": data.get("message", "").strip(),
+    }
+
+
+def write_rows(instances):
+    """Insert ``instances`` in one transaction; returns them with ids set.
+
+    Repeats of a stored row (or of another row in the batch) are not
+    inserted; they get the original row's id instead, or ``rejected`` set to
+    a ``dedupe.KeyReused`` error if they reuse its key for another payload.
+    """
+    by_model = {}
+    for instance in instances:
+        by_model.setdefault(type(instance), []).append(instance)
+    with transaction.atomic():
+        created = []
+        for model, objs in by_model.items():
+            new, duplicates = dedupe.resolve_batch(model, objs)
+            model.objects.bulk_create(new)
+            dedupe.link(duplicates)
+            created += new
+        # bulk_create() bypasses post_save, so the rollups and the
+        # notification outbox are fed here.
+        rollups.record_created(created)
+        notifications.record(created)
+    return instances
+
+
+def spool(instances, path=None):
+    """Append unwritten instances to the NDJSON spool file"""
+    path = path or settings.INGEST_SPOOL_PATH
+    with open(path, "a", encoding="utf-8") as f:
+        for instance in instances:
+            source = next(k for k, model in MODELS.items() if isinstance(instance, model))
+            row = model_to_dict(instance, exclude=["id"])
+            f.write(json.dumps({"source": source, "fields": row}, cls=DjangoJSONEncoder) + "\n")
+
+
+def unspool(line):
+    """The unsaved instance a spool line was written from"""
+    row = json.loads(line)
+    model = MODELS[row["source"]]
+    # JSON turned dates and decimals into strings; the fields convert them back.
+    return model(
+        **{name: model._meta.get_field(name).to_python(value) for name, value in row["fields"].items()}
+    )
+
+
+def _settle(future, result=None, exception=None):
+    """Resolve ``future`` unless its caller has cancelled it"""
+    try:
+        if not future.set_running_or_notify_cancel():
+            return
+        if exception is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(result)
+    except (InvalidStateError, RuntimeError):
+        logger.exception("Write-behind future was already resolved")
+
+
+class WriteBehindQueue:
+    def __init__(self, batch_size, flush_ms):
+        self.batch_size = batch_size
+        self.flush_interval = flush_ms / 1000
+        self._queue = queue.SimpleQueue()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="ingest-writer", daemon=True)
+        self._thread.start()
+
+    @property
+    def stalled(self):
+        """True if the writer thread died while the queue was still open"""
+        return not self._closed and not self._thread.is_alive()
+
+    def submit(self, instance):
+        """Queue ``instance`` for insertion; the future resolves to its id"""
+        if self._closed:
+            raise RuntimeError("write-behind queue is closed")
+        future = Future()
+        self._queue.put((instance, future))
+        return future
+
+    def _next_batch(self):
+        item = self._queue.get()
+        if item is None:
+            return None
+        batch = [item]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                break
+            if item is None:
+                self._queue.put(None)
+                break
+            batch.append(item)
+        return batch
+
+    def _flush(self, batch):
+        instances = [instance for instance, _ in batch]
+        try:
+            close_old_connections()
+            write_rows(instances)
+            results = [(instance.pk, getattr(instance, "rejected", None)) for instance in instances]
+        except Exception:
+            logger.exception("Write-behind flush of %d row(s) failed; spooling", len(batch))
+            try:
+                spool(instances)
+            except Exception as e:
+                logger.exception("Spooling %d row(s) failed; they are lost", len(batch))
+                for _, future in batch:
+                    _settle(future, exception=e)
+                return
+            results = [(None, None)] * len(batch)
+        for (_, future), (result, exception) in zip(batch, results):
+            _settle(future, result, exception)
+
+    def _run(self):
+        try:
+            while True:
+                batch = self._next_batch()
+                if batch is None:
+                    break
+                try:
+                    self._flush(batch)
+                except Exception:
+                    # A dead writer would leave every later submission hanging.
+                    logger.exception("Write-behind batch of %d row(s) failed", len(batch))
+        finally:
+            connection.close()
+
+    def close(self, timeout=5):
+        """Flush what is queued and stop; anything left over is spooled"""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join(timeout)
+        leftovers = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                leftovers.append(item)
+        if leftovers:
+            spool([instance for instance, _ in leftovers])
+            for _, future in leftovers:
+                _settle(future)
+
+
+_queue = None
+_queue_lock = threading.Lock()
+
+
+def get_queue():
+    global _queue
+    with _queue_lock:
+        if _queue is not None and _queue.stalled:
+            logger.error("Write-behind writer stopped; starting a new one")
+            _queue.close(timeout=0)
+            _queue = None
+        if _queue is None:
+            _queue = WriteBehindQueue(settings.INGEST_BATCH_SIZE, settings.INGEST_FLUSH_MS)
+            atexit.register(_queue.close)
+        return _queue
@@ -0,0 +1,195 @@
+# Frontend/jobs.py
+"""Admin bulk actions run in the background, a primary-key range at a time.
+
+A selection larger than ``BULK_JOB_INLINE_LIMIT`` rows is not updated in
+the request. ``enqueue`` stores the action as a ``BulkJob``: the changes to
+make, the changelist filters and search that selected the rows, and the
+highest selected primary key. ``run`` then walks the matching rows in key
+order, updating one key range of ``BULK_JOB_CHUNK_SIZE`` rows at a time,
+each range and the job's progress committed in one short transaction with a
+``BULK_JOB_PAUSE_MS`` pause after it, so submissions get the write lock in
+between. The job never holds more than the bounds of one range in memory.
+
+``claim`` leases a job to one runner for ``BULK_JOB_LEASE_SECONDS``, and
+every chunk renews the lease. If the runner dies, the lease runs out and
+the next ``claim`` takes the job over, resuming after ``last_pk``; a runner
+that finds its lease taken stops without touching the job again.
+
+Jobs are run by a thread in the web process (``BULK_JOB_RUNNER="thread"``)
+or by ``manage.py run_bulk_jobs``. The thread only looks for jobs when one is
+queued, so a polling ``run_bulk_jobs`` is what picks up an interrupted job
+promptly.
+"""
+import logging
+import secrets
+import threading
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.admin.utils import build_q_object_from_lookup_parameters
+from django.db import connection, transaction
+from django.db.models import Count, DateTimeField, Max, Q, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from . import rollups, search
+from .models import BulkJob
+
+logger = logging.getLogger(__name__)
+
+
+def selected_ids(queryset, limit):
+    """The pks of ``queryset`` if it has at most ``limit`` rows, else None"""
+    ids = list(queryset.order_by("pk").values_list("pk", flat=True)[: limit + 1])
+    return ids if len(ids) <= limit else None
+
+
+def select(model, filters, search_term=""):
+    """The rows of ``model`` matching changelist ``filters`` (``{lookup:
+    [values]}``, any value may match) and ``search_term``"""
+    queryset = model.objects.filter(build_q_object_from_lookup_parameters(filters))
+    if search_term:
+        queryset = search.filter_queryset(queryset, search_term)
+    return queryset
+
+
+def enqueue(model, filters, search_term, description, changes, user=None):
+    selected = select(model, filters, search_term).aggregate(total=Count("pk"), max_pk=Max("pk"))
+    job = BulkJob.objects.create(
+        source=rollups.source_for(model),
+        description=description,
+        changes=changes,
+        filters=filters,
+        search=search_term,
+        max_pk=selected["max_pk"] or 0,
+        total=selected["total"],
+        created_by=user if user and user.is_authenticated else None,
+    )
+    if settings.BULK_JOB_RUNNER == "thread":
+        transaction.on_commit(start_worker)
+    return job
+
+
+class LeaseLost(Exception):
+    """Another runner claimed the job after this one's lease expired"""
+
+
+def _lease(now):
+    return now + timedelta(seconds=settings.BULK_JOB_LEASE_SECONDS)
+
+
+def claim(now=None):
+    """Lease the oldest pending job, or a running one whose lease expired, to
+    this runner and return it; None if there is none"""
+    now = now or timezone.now()
+    claimable = Q(status="pending") | Q(status="running", lease_expires_at__lt=now)
+    token = secrets.token_hex(16)
+    for pk in BulkJob.objects.filter(claimable).order_by("created_at").values_list("pk", flat=True)[:10]:
+        # Another runner may claim the same job; only one update matches.
+        claimed = BulkJob.objects.filter(claimable, pk=pk).update(
+            status="running",
+            claim=token,
+            lease_expires_at=_lease(now),
+            started_at=Coalesce("started_at", Value(now, output_field=DateTimeField())),
+        )
+        if claimed:
+            return BulkJob.objects.get(pk=pk)
+    return None
+
+
+def _save(job, **fields):
+    """Write ``fields`` to ``job`` if this runner still holds it"""
+    for name, value in fields.items():
+        setattr(job, name, value)
+    if not BulkJob.objects.filter(pk=job.pk, claim=job.claim).update(**fields):
+        raise LeaseLost
+
+
+def _finish(job, status, error=""):
+    _save(job, status=status, error=error, finished_at=timezone.now())
+
+
+def run(job, chunk_size=None, pause_ms=None):
+    """Apply ``job`` chunk by chunk; returns it with its final status"""
+    chunk_size = chunk_size or settings.BULK_JOB_CHUNK_SIZE
+    pause = (settings.BULK_JOB_PAUSE_MS if pause_ms is None else pause_ms) / 1000
+    model = rollups.SOURCES[job.source][0]
+    try:
+        rows = select(model, job.filters, job.search).filter(pk__lte=job.max_pk)
+        while True:
+            if BulkJob.objects.filter(pk=job.pk, status="cancelled").exists():
+                _finish(job, "cancelled")
+                return job
+            if job.last_pk >= job.max_pk:
+                _finish(job, "done")
+                return job
+            # The key of the chunk's last row; short of a full chunk, the rest.
+            ends = rows.filter(pk__gt=job.last_pk).order_by("pk").values_list("pk", flat=True)
+            end = next(iter(ends[chunk_size - 1 : chunk_size]), job.max_pk)
+            with transaction.atomic():
+                processed = job.processed + rollups.update_queryset(
+                    rows.filter(pk__gt=job.last_pk, pk__lte=end), **job.changes
+                )
+                # Rolls the chunk back if the job has been taken over.
+                _save(
+                    job,
+                    processed=processed,
+                    last_pk=end,
+                    lease_expires_at=_lease(timezone.now()),
+                )
+            if pause:
+                time.sleep(pause)
+    except LeaseLost:
+        logger.warning("Bulk job %s was taken over by another runner", job.pk)
+        job.refresh_from_db()
+        return job
+    except Exception as e:
+        logger.exception("Bulk job %s failed", job.pk)
+        try:
+            _finish(job, "failed", f"{type(e).__name__}: {e}")
+        except LeaseLost:
+            job.refresh_from_db()
+        return job
+
+
+def run_pending():
+    """Run queued jobs until there are none left; returns how many ran"""
+    count = 0
+    while (job := claim()) is not None:
+        run(job)
+        count += 1
+    return count
+
+
+# In-process runner: one thread per process, started when a job is queued
+# and exiting once the queue is empty.
+_worker = None
+_worker_wanted = False
+_worker_lock = threading.Lock()
+
+
+def start_worker():
+    global _worker, _worker_wanted
+    with _worker_lock:
+        _worker_wanted = True
+        if _worker is None:
+            _worker = threading.Thread(target=_work, name="bulk-jobs", daemon=True)
+            _worker.start()
+
+
+def _work():
+    global _worker, _worker_wanted
+    try:
+        while True:
+            with _worker_lock:
+                if not _worker_wanted:
+                    _worker = None
+                    return
+                _worker_wanted = False
+            try:
+                run_pending()
+            except Exception:
+                logger.exception("Bulk job worker failed")
+    finally:
+        connection.close()
@@ -0,0 +1,29 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from Frontend import archive
+
+
+class Command(BaseCommand):
+    help = (
+        "Move accepted/rejected project submissions and archived contact "
+        "messages older than the retention age into the archive table."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--source", choices=sorted(archive.POLICIES), action="append")
+        parser.add_argument(
+            "--days", type=int, default=settings.ARCHIVE_RETENTION_DAYS, help="Retention age in days"
+        )
+        parser.add_argument("--chunk-size", type=int, default=settings.ARCHIVE_CHUNK_SIZE)
+        parser.add_argument("--dry-run", action="store_true", help="Only count the rows that are due")
+
+    def handle(self, *args, **options):
+        before = archive.cutoff(options["days"])
+        for source in options["source"] or sorted(archive.POLICIES):
+            if options["dry_run"]:
+                count = archive.candidates(source, before).count()
+                self.stdout.write(f"{source}: {count} row(s) due for archival")
+                continue
+            count = archive.archive(source, before, options["chunk_size"])
+            self.stdout.write(self.style.SUCCESS(f"{source}: archived {count} row(s)."))
@@ -0,0 +1,112 @@
+import random
+import statistics
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+from django.db import OperationalError, connection
+from django.test.utils import override_settings
+
+from Frontend import stats
+from Frontend.models import ContactMessage
+
+PROFILES = {
+    # What settings.py used to do: stock SQLite, a new connection per request.
+    "baseline": {"pragmas": {}, "reconnect": True},
+    # The current profile: SQLITE_PRAGMAS and persistent connections.
+    "tuned": {"pragmas": None, "reconnect": False},
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Mixed read/write concurrency benchmark of the database profile: "
+        "dashboard-style reads alongside contact-message inserts, before and "
+        "after the connection tuning."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--threads", type=int, default=8)
+        parser.add_argument("--seconds", type=float, default=5)
+        parser.add_argument("--write-ratio", type=float, default=0.2)
+        parser.add_argument("--rows", type=int, default=2000, help="Messages to seed")
+        parser.add_argument("--profile", choices=PROFILES, action="append", dest="profiles")
+
+    def handle(self, *args, **options):
+        self.stdout.write(
+            f"{connection.vendor}, {options['threads']} threads, {options['seconds']}s, "
+            f"{options['write_ratio']:.0%} writes"
+        )
+        for name in options["profiles"] or PROFILES:
+            result = self.run_profile(PROFILES[name], options)
+            self.stdout.write(
+                f"  {name:<9} {result['ops']:8.0f} ops/s  reads p95 {result['read_p95']:6.2f} ms  "
+                f"writes p95 {result['write_p95']:6.2f} ms  errors {result['errors']}"
+            )
+
+    def run_profile(self, profile, options):
+        overrides = {} if profile["pragmas"] is None else {"SQLITE_PRAGMAS": profile["pragmas"]}
+        with tempfile.TemporaryDirectory() as tmp, override_settings(**overrides):
+            if connection.vendor == "sqlite":
+                # A real file: WAL and locking behave differently in memory.
+                test_settings = connection.settings_dict.setdefault("TEST", {})
+                test_settings["NAME"] = str(Path(tmp) / "benchmark.sqlite3")
+            old_name = connection.creation.create_test_db(verbosity=0, serialize=False)
+            try:
+                ContactMessage.objects.bulk_create(
+                    ContactMessage(name="Seed", email="seed@example.com", subject="Seed", message=str(i))
+                    for i in range(options["rows"])
+                )
+                connection.close()
+                return self.run_threads(profile["reconnect"], options)
+            finally:
+                connection.creation.destroy_test_db(old_name, verbosity=0)
+
+    def run_threads(self, reconnect, options):
+        deadline = time.perf_counter() + options["seconds"]
+        reads, writes, errors = [], [], []
+        sequence = iter(range(10**9))
+        lock = threading.Lock()
+
+        def worker():
+            rng = random.Random()
+            while time.perf_counter() < deadline:
+                write = rng.random() < options["write_ratio"]
+                start = time.perf_counter()
+                try:
+                    if write:
+                        with lock:
+                            i = next(sequence)
+                        ContactMessage.objects.create(
+                            name="Bench", email="bench@example.com", subject="Bench", message=str(i)
+                        )
+                    else:
+                        stats.contact_stats()
+                        list(ContactMessage.objects.all()[:25])
+                except OperationalError:
+                    errors.append(1)
+                else:
+                    (writes if write else reads).append(time.perf_counter() - start)
+                if reconnect:
+                    connection.close()
+            connection.close()
+
+        threads = [threading.Thread(target=worker) for _ in range(options["threads"])]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+
+        def p95(values):
+            return statistics.quantiles(values, n=20)[-1] * 1000 if len(values) > 1 else 0
+
+        return {
+            "ops": (len(reads) + len(writes)) / elapsed,
+            "read_p95": p95(reads),
+            "write_p95": p95(writes),
+            "errors": len(errors),
+        }
@@ -0,0 +1,108 @@
+import asyncio
+import json
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test import AsyncClient, Client, override_settings
+from django.urls import reverse
+
+from Frontend import ingest
+from Frontend.benchmark import UNTHROTTLED
+from Frontend.models import ContactMessage
+
+def payload(i):
+    # Distinct messages, or duplicate suppression would skip the writes.
+    return json.dumps(
+        {
+            "name": "Load Test",
+            "email": "load@example.com",
+            "subject": "Benchmark",
+            "message": f"Write-behind benchmark message {i}.",
+        }
+    )
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare submit_contact (one INSERT per request) with the async "
+        "write-behind endpoint on a throwaway SQLite database file."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=2000)
+        parser.add_argument("--concurrency", type=int, default=16)
+
+    def handle(self, *args, **options):
+        total, concurrency = options["requests"], options["concurrency"]
+        with tempfile.TemporaryDirectory() as tmp:
+            test_settings = connection.settings_dict.setdefault("TEST", {})
+            test_settings["NAME"] = str(Path(tmp) / "benchmark.sqlite3")
+            old_name = connection.creation.create_test_db(verbosity=0, serialize=False)
+            # The test runner allows "testserver"; the management command has to.
+            allowed_hosts = [*settings.ALLOWED_HOSTS, "testserver"]
+            try:
+                with override_settings(ALLOWED_HOSTS=allowed_hosts, **UNTHROTTLED):
+                    sync_rate = self.run_sync(total, concurrency)
+                    async_rate = self.run_async(total, concurrency)
+            finally:
+                ingest.get_queue().close()
+                connection.creation.destroy_test_db(old_name, verbosity=0)
+
+        self.stdout.write(f"{total} requests, concurrency {concurrency}")
+        self.stdout.write(f"  sync  submit_contact:        {sync_rate:8.0f} req/s")
+        self.stdout.write(f"  async submit_contact_async:  {async_rate:8.0f} req/s")
+        self.stdout.write(self.style.SUCCESS(f"  speed-up: {async_rate / sync_rate:.1f}x"))
+
+    # Both runs go through the test clients so the middleware stack and the
+    # WSGI/ASGI handler are part of the measurement. Neither client closes
+    # the database connection after a response, so each worker thread keeps
+    # one connection for the whole run on both sides.
+
+    def run_sync(self, total, concurrency):
+        url = reverse("submit_contact")
+        local = threading.local()
+
+        def post(i):
+            if not hasattr(local, "client"):
+                local.client = Client(raise_request_exception=False)
+            return local.client.post(url, payload(i), content_type="application/json").status_code
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(concurrency) as pool:
+            statuses = list(pool.map(post, range(total)))
+        elapsed = time.perf_counter() - start
+        self.check_results(statuses, total)
+        return total / elapsed
+
+    def run_async(self, total, concurrency):
+        url = reverse("submit_contact_async")
+        client = AsyncClient(raise_request_exception=False)
+        before = ContactMessage.objects.count()
+
+        async def run():
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def post(i):
+                async with semaphore:
+                    response = await client.post(url, payload(total + i), content_type="application/json")
+                    return response.status_code
+
+            return await asyncio.gather(*(post(i) for i in range(total)))
+
+        start = time.perf_counter()
+        statuses = asyncio.run(run())
+        elapsed = time.perf_counter() - start
+        self.check_results(statuses, total)
+        assert ContactMessage.objects.count() - before == total
+        return total / elapsed
+
+    def check_results(self, statuses, total):
+        failed = sum(1 for status in statuses if status != 200)
+        if failed:
+            self.stderr.write(self.style.WARNING(f"{failed}/{total} requests failed"))
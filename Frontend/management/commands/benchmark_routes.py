@@ -0,0 +1,79 @@
+import json
+import tempfile
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from Frontend import benchmark, ingest
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark every named route in Frontend/urls.py on a throwaway "
+        "database, write a JSON report and fail on regressions against the "
+        "stored baseline."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=200)
+        parser.add_argument("--warmup", type=int, default=10)
+        parser.add_argument("--rows", type=int, default=500, help="Projects and messages to seed")
+        parser.add_argument("--route", action="append", dest="routes", help="Only these routes")
+        parser.add_argument("--output", "-o", default="benchmark-report.json")
+        parser.add_argument("--baseline", default=settings.BENCHMARK_BASELINE_PATH)
+        parser.add_argument("--threshold", type=float, default=settings.BENCHMARK_THRESHOLD)
+        parser.add_argument(
+            "--save-baseline", action="store_true", help="Store this run as the new baseline"
+        )
+
+    def handle(self, *args, **options):
+        unknown = set(options["routes"] or ()) - set(benchmark.named_routes())
+        if unknown:
+            raise CommandError(f"Unknown route(s): {', '.join(sorted(unknown))}")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            test_settings = connection.settings_dict.setdefault("TEST", {})
+            test_settings["NAME"] = str(Path(tmp) / "benchmark.sqlite3")
+            old_name = connection.creation.create_test_db(verbosity=0, serialize=False)
+            try:
+                benchmark.seed(options["rows"])
+                report = benchmark.run(options["iterations"], options["warmup"], routes=options["routes"])
+            finally:
+                ingest.get_queue().close()
+                connection.creation.destroy_test_db(old_name, verbosity=0)
+
+        Path(options["output"]).write_text(json.dumps(report, indent=2))
+        self.print_report(report)
+        self.stdout.write(f"Report written to {options['output']}")
+
+        baseline_path = Path(options["baseline"])
+        if options["save_baseline"]:
+            baseline_path.parent.mkdir(parents=True, exist_ok=True)
+            baseline_path.write_text(json.dumps(report, indent=2))
+            self.stdout.write(self.style.SUCCESS(f"Baseline saved to {baseline_path}"))
+            return
+        if not baseline_path.exists():
+            # A CI run without a baseline would otherwise pass without comparing anything.
+            raise CommandError(f"No baseline at {baseline_path}; run with --save-baseline to store one.")
+
+        baseline = json.loads(baseline_path.read_text())
+        regressions = benchmark.compare(report, baseline, options["threshold"])
+        if regressions:
+            for line in regressions:
+                self.stderr.write(self.style.ERROR(f"  {line}"))
+            raise CommandError(
+                f"{len(regressions)} regression(s) over {options['threshold']:.0%} against {baseline_path}"
+            )
+        self.stdout.write(self.style.SUCCESS(f"No regressions against {baseline_path}"))
+
+    def print_report(self, report):
+        header = f"{'route':<22} {'status':<8} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'queries':>8} {'KiB':>8}"
+        self.stdout.write(header)
+        for name, r in report["routes"].items():
+            status = ",".join(map(str, r["status"]))
+            self.stdout.write(
+                f"{name:<22} {status:<8} {r['rps']:>8.0f} {r['p50_ms']:>8.2f} {r['p95_ms']:>8.2f} "
+                f"{r['p99_ms']:>8.2f} {r['queries']:>8} {r['alloc_kib']:>8}"
+            )
@@ -0,0 +1,63 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.test.utils import override_settings
+
+from Frontend.throttle import SubmissionThrottleMiddleware
+
+
+def ok(request):
+    return HttpResponse()
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure the per-request cost of SubmissionThrottleMiddleware on the "
+        "allow path (limits raised so nothing is rejected)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=200000)
+        parser.add_argument("--clients", type=int, default=5000, help="Distinct client IPs")
+        parser.add_argument("--cache", default=None, help="Cache alias to share buckets through")
+
+    def handle(self, *args, **options):
+        total, clients = options["requests"], options["clients"]
+        factory = RequestFactory()
+        requests = [
+            factory.post(
+                "/submit-contact/",
+                REMOTE_ADDR=f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}",
+            )
+            for i in range(clients)
+        ]
+        unlimited = {
+            "THROTTLE_IP_RATE": 1e9,
+            "THROTTLE_IP_BURST": 10**9,
+            "THROTTLE_GLOBAL_RATE": 1e9,
+            "THROTTLE_GLOBAL_BURST": 10**9,
+            "THROTTLE_CACHE_ALIAS": options["cache"],
+        }
+        with override_settings(**unlimited):
+            middleware = SubmissionThrottleMiddleware(ok)
+            middleware.paths  # resolve the URLs outside the timed loop
+
+        baseline = self.time(ok, requests, total)
+        throttled = self.time(middleware, requests, total)
+        overhead = (throttled - baseline) / total * 1e9
+
+        backend = f"cache {options['cache']!r}" if options["cache"] else "in-process"
+        self.stdout.write(f"{total} requests from {clients} clients, {backend} buckets")
+        self.stdout.write(f"  without middleware: {baseline / total * 1e9:8.0f} ns/request")
+        self.stdout.write(f"  with middleware:    {throttled / total * 1e9:8.0f} ns/request")
+        self.stdout.write(self.style.SUCCESS(f"  overhead:           {overhead:8.0f} ns/request"))
+
+    def time(self, handler, requests, total):
+        count = len(requests)
+        start = time.perf_counter()
+        for i in range(total):
+            response = handler(requests[i % count])
+            assert response.status_code == 200, response.status_code
+        return time.perf_counter() - start
@@ -0,0 +1,46 @@
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.core.management.base import BaseCommand, CommandError
+from django.urls import reverse
+
+from Frontend.critical import ROUTES, build
+from Frontend.prerender import render_page
+
+
+class Command(BaseCommand):
+    help = "Extract each page's above-the-fold CSS and a purged site stylesheet."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--fold",
+            type=int,
+            default=settings.CRITICAL_FOLD_ELEMENTS,
+            help="Number of leading elements treated as above the fold.",
+        )
+
+    def handle(self, *args, **options):
+        if not finders.find(settings.CRITICAL_CSS_SOURCE):
+            raise CommandError(f"{settings.CRITICAL_CSS_SOURCE} not found in the static files")
+
+        pages = {}
+        for name in ROUTES:
+            path = reverse(name)
+            if path in pages:
+                continue
+            try:
+                # Never served from disk, so pages with forms are fine.
+                pages[path] = render_page(path, shared=False).decode()
+            except Exception as e:
+                self.stderr.write(self.style.WARNING(f"Skipped {path}: {e}"))
+        if not pages:
+            raise CommandError("No pages could be rendered.")
+
+        scripts = sorted((Path(settings.STATICFILES_DIRS[0]) / "Js").rglob("*.js"))
+        manifest = build(pages, settings.CRITICAL_CSS_DIR, options["fold"], scripts)
+        for path, css in manifest["pages"].items():
+            self.stdout.write(f"{path}: {len(css)} bytes inline")
+        self.stdout.write(
+            self.style.SUCCESS(f"{len(pages)} page(s) written to {settings.CRITICAL_CSS_DIR}")
+        )
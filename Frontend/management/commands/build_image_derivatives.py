@@ -0,0 +1,58 @@
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from Frontend.images import SOURCE_EXTENSIONS, build_derivatives, prune_derivatives, write_manifest
+
+
+class Command(BaseCommand):
+    help = "Generate width-stepped WebP (and optionally AVIF) variants of static/images."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--widths",
+            type=int,
+            nargs="+",
+            default=settings.IMAGE_DERIVATIVE_WIDTHS,
+            help="Target widths in pixels.",
+        )
+        parser.add_argument("--avif", action="store_true", help="Also emit AVIF variants.")
+        parser.add_argument("--quality", type=int, default=80)
+
+    def handle(self, *args, **options):
+        try:
+            import PIL  # noqa: F401
+        except ImportError:
+            raise CommandError("Pillow is required: pip install Pillow")
+
+        static_dir = Path(settings.STATICFILES_DIRS[0])
+        output_dir = Path(settings.IMAGE_DERIVATIVES_DIR)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        formats = ["avif", "webp"] if options["avif"] else ["webp"]
+
+        manifest = {}
+        total_encoded = 0
+        for source in sorted((static_dir / "images").rglob("*")):
+            if source.suffix.lower() not in SOURCE_EXTENSIONS:
+                continue
+            static_name = source.relative_to(static_dir).as_posix()
+            entry, encoded = build_derivatives(
+                source,
+                output_dir,
+                options["widths"],
+                formats,
+                options["quality"],
+            )
+            manifest[static_name] = entry
+            total_encoded += encoded
+            self.stdout.write(f"{static_name}: {encoded} new variant(s)")
+
+        write_manifest(manifest)
+        pruned = prune_derivatives(output_dir, manifest)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{len(manifest)} image(s), {total_encoded} variant(s) encoded into {output_dir}, "
+                f"{pruned} stale file(s) pruned"
+            )
+        )
@@ -0,0 +1,35 @@
+from django.conf import settings
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.management.base import BaseCommand, CommandError
+
+from Frontend.pagecache import get_page_cache
+
+# Backends whose entries live in one process: clearing them from here
+# would leave every worker's copy in place.
+PROCESS_LOCAL_BACKENDS = (LocMemCache, DummyCache)
+
+
+class Command(BaseCommand):
+    help = (
+        "Invalidate the marketing page cache. PAGE_CACHE_ALIAS must point at "
+        "a backend the workers share; with a per-process cache, bump "
+        "PAGE_CACHE_VERSION and restart the workers instead."
+    )
+
+    def handle(self, *args, **options):
+        cache = get_page_cache()
+        if isinstance(cache, PROCESS_LOCAL_BACKENDS):
+            raise CommandError(
+                f"Page cache '{settings.PAGE_CACHE_ALIAS}' is {type(cache).__name__}, which "
+                "lives in each worker process and cannot be cleared from here. Bump "
+                "PAGE_CACHE_VERSION and restart the workers, or point PAGE_CACHE_ALIAS "
+                "at a shared cache."
+            )
+        cache.clear()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Cleared page cache '{settings.PAGE_CACHE_ALIAS}' "
+                f"(version {settings.PAGE_CACHE_VERSION})."
+            )
+        )
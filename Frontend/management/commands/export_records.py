@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+
+from Frontend.exports import ENCODERS
+from Frontend.models import ContactMessage, ProjectSubmission
+from Frontend.replicas import on_replica
+
+MODELS = {"projects": ProjectSubmission, "messages": ContactMessage}
+
+
+class Command(BaseCommand):
+    help = "Stream project submissions or contact messages to CSV or NDJSON."
+
+    def add_arguments(self, parser):
+        parser.add_argument("model", choices=sorted(MODELS))
+        parser.add_argument("--format", choices=sorted(ENCODERS), default="csv")
+        parser.add_argument("--output", "-o", default="-", help="File path, or - for stdout.")
+        parser.add_argument("--chunk-size", type=int, default=None)
+
+    def handle(self, *args, **options):
+        queryset = on_replica(MODELS[options["model"]].objects.order_by("pk"))
+        lines = ENCODERS[options["format"]](queryset, chunk_size=options["chunk_size"])
+
+        if options["output"] == "-":
+            # Lines carry their own terminators; OutputWrapper must not add one.
+            self.write_lines(lambda line: self.stdout.write(line, ending=""), lines)
+        else:
+            with open(options["output"], "w", encoding="utf-8", newline="") as out:
+                count = self.write_lines(out.write, lines)
+            self.stderr.write(f"Wrote {count} line(s) to {options['output']}")
+
+    def write_lines(self, write, lines):
+        count = 0
+        for count, line in enumerate(lines, 1):
+            write(line)
+        return count
@@ -0,0 +1,31 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from Frontend.prerender import build_snapshots, get_output_dir
+
+
+class Command(BaseCommand):
+    help = "Render the marketing pages to disk with .gz/.br siblings for direct serving."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output-version",
+            dest="output_version",
+            default=None,
+            help="Output version directory (defaults to PAGE_CACHE_VERSION).",
+        )
+
+    def handle(self, *args, **options):
+        output_dir = get_output_dir(options["output_version"])
+        manifest, skipped = build_snapshots(output_dir)
+
+        for path, reason in skipped.items():
+            self.stderr.write(self.style.WARNING(f"Skipped {path}: {reason}"))
+        if not manifest:
+            raise CommandError("No pages were prerendered.")
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Prerendered {len(manifest)} page(s) into {output_dir}")
+        )
+        if not settings.PRERENDER_SERVE:
+            self.stdout.write("Set PRERENDER_SERVE=1 to serve them.")
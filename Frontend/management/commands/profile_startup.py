@@ -0,0 +1,97 @@
+import json
+import os
+import subprocess
+import sys
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# Imports the WSGI application the way a worker does, then runs the warm-up
+# on its own so the two costs are reported separately.
+WORKER_BOOT = """
+import json
+from PortfolioWebsite.wsgi import application
+from Frontend.warmup import run
+print(json.dumps(run()))
+"""
+
+
+def parse_importtime(stderr):
+    """``[(module, self_us, cumulative_us, depth)]`` from ``-X importtime`` output"""
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        modules.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return modules
+
+
+class Command(BaseCommand):
+    help = "Report the import cost of each module a worker loads at boot, and the warm-up time."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--top", type=int, default=25, help="Modules to list.")
+        parser.add_argument(
+            "--budget-ms",
+            type=float,
+            default=settings.STARTUP_IMPORT_BUDGET_MS,
+            help="Fail if importing the application takes longer than this.",
+        )
+        parser.add_argument("--json", action="store_true", help="Print the report as JSON.")
+
+    def handle(self, *args, **options):
+        env = {**os.environ, "WARMUP_ON_BOOT": "0"}
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", WORKER_BOOT],
+            cwd=settings.BASE_DIR,
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            raise CommandError(f"Booting the application failed:\n{result.stderr[-2000:]}")
+
+        modules = parse_importtime(result.stderr)
+        warmup = json.loads(result.stdout.strip().splitlines()[-1])
+        # Top-level entries are the imports the boot script made itself.
+        total_ms = sum(cumulative for _, _, cumulative, depth in modules if depth == 0) / 1000
+        packages = defaultdict(int)
+        for name, self_us, _, _ in modules:
+            packages[name.split(".")[0]] += self_us
+
+        report = {
+            "import_ms": round(total_ms, 1),
+            "budget_ms": options["budget_ms"],
+            "modules": len(modules),
+            "warmup_ms": {step: round(seconds * 1000, 1) for step, seconds in warmup.items()},
+            "slowest": [
+                {"module": name, "self_ms": self_us / 1000, "cumulative_ms": cumulative / 1000}
+                for name, self_us, cumulative, _ in sorted(modules, key=lambda m: -m[2])[: options["top"]]
+            ],
+            "packages_ms": {
+                name: round(us / 1000, 1)
+                for name, us in sorted(packages.items(), key=lambda item: -item[1])[: options["top"]]
+            },
+        }
+
+        if options["json"]:
+            self.stdout.write(json.dumps(report, indent=2))
+        else:
+            self.stdout.write(f"{'cumulative ms':>14} {'self ms':>9}  module")
+            for row in report["slowest"]:
+                self.stdout.write(f"{row['cumulative_ms']:14.1f} {row['self_ms']:9.1f}  {row['module']}")
+            self.stdout.write("\nSelf time by top-level package:")
+            for name, ms in report["packages_ms"].items():
+                self.stdout.write(f"{ms:14.1f}  {name}")
+            warm = ", ".join(f"{step} {ms:.0f} ms" for step, ms in report["warmup_ms"].items())
+            self.stdout.write(f"\nWarm-up: {warm}")
+            self.stdout.write(f"Imports: {report['import_ms']:.0f} ms across {report['modules']} modules")
+
+        if total_ms > options["budget_ms"]:
+            raise CommandError(
+                f"Import time {total_ms:.0f} ms is over the {options['budget_ms']:.0f} ms budget"
+            )
+        self.stdout.write(self.style.SUCCESS(f"Within the {options['budget_ms']:.0f} ms import budget"))
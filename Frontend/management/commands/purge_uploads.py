@@ -0,0 +1,25 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from Frontend import uploads
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete partial uploads that have seen no chunk for UPLOAD_TTL "
+        "seconds, and stored files that old which no submission references."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--max-age", type=int, default=settings.UPLOAD_TTL, help="Idle seconds before removal"
+        )
+
+    def handle(self, *args, **options):
+        removed = uploads.purge_stale(options["max_age"])
+        unreferenced = uploads.purge_unreferenced(options["max_age"])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Removed {removed} stale upload(s) and {unreferenced} unreferenced stored file(s)."
+            )
+        )
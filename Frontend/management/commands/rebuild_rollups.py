@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from Frontend import rollups
+
+
+class Command(BaseCommand):
+    help = "Recompute the DailyRollup table from ProjectSubmission, ContactMessage and the archive."
+
+    def handle(self, *args, **options):
+        count = rollups.rebuild()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {count} rollup row(s)."))
@@ -0,0 +1,76 @@
+import os
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from Frontend.ingest import unspool, write_rows
+
+
+class Command(BaseCommand):
+    help = "Insert rows the write-behind queue spooled to disk instead of writing."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--path", default=settings.INGEST_SPOOL_PATH)
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        path = Path(options["path"])
+        replaying = path.with_name(path.name + ".replaying")
+        # Byte offset of the first row not yet committed, updated per batch
+        progress = path.with_name(path.name + ".replaying.offset")
+
+        if replaying.exists():
+            self.stdout.write(f"Resuming the interrupted replay of {replaying}.")
+        elif path.exists():
+            # Move the file aside first so new spooled rows are not lost or replayed twice.
+            path.rename(replaying)
+        else:
+            self.stdout.write("Nothing to replay.")
+            return
+
+        offset = int(progress.read_text()) if progress.exists() else 0
+        total = 0
+        try:
+            with open(replaying, "rb") as f:
+                f.seek(offset)
+                for batch, end in self.batches(f, options["batch_size"]):
+                    write_rows(batch)
+                    total += len(batch)
+                    offset = end
+                    progress.write_text(str(offset))
+        except Exception as e:
+            self.restore(replaying, offset, path)
+            progress.unlink(missing_ok=True)
+            raise CommandError(
+                f"Replay stopped after {total} row(s); the rest is back in {path}: {e}"
+            )
+
+        replaying.unlink()
+        progress.unlink(missing_ok=True)
+        self.stdout.write(self.style.SUCCESS(f"Replayed {total} row(s) from {path}."))
+
+    def batches(self, f, size):
+        """``(instances, offset after them)`` for each batch of spooled rows"""
+        batch = []
+        while line := f.readline():
+            if line.strip():
+                batch.append(unspool(line))
+            if len(batch) >= size:
+                yield batch, f.tell()
+                batch = []
+        if batch:
+            yield batch, f.tell()
+
+    def restore(self, replaying, offset, path):
+        """Put the rows from ``offset`` on back in front of the spool"""
+        with open(replaying, "rb") as f:
+            f.seek(offset)
+            remainder = f.read()
+        # Rows spooled while this ran come after the ones that were already waiting.
+        if path.exists():
+            remainder += path.read_bytes()
+        temporary = path.with_name(path.name + ".restoring")
+        temporary.write_bytes(remainder)
+        os.replace(temporary, path)
+        replaying.unlink()
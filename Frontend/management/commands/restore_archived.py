@@ -0,0 +1,36 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_date
+
+from Frontend import archive
+from Frontend.models import ArchivedRecord
+
+
+class Command(BaseCommand):
+    help = "Move archived records back into the live tables under their original ids."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--source", choices=sorted(archive.POLICIES))
+        parser.add_argument("--id", type=int, nargs="+", dest="ids", help="Original row ids")
+        parser.add_argument("--since", help="Only records submitted on or after YYYY-MM-DD")
+        parser.add_argument("--all", action="store_true", help="Restore everything that matches")
+        parser.add_argument("--chunk-size", type=int, default=settings.ARCHIVE_CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        records = ArchivedRecord.objects.all()
+        if options["source"]:
+            records = records.filter(source=options["source"])
+        if options["ids"]:
+            records = records.filter(original_id__in=options["ids"])
+        if options["since"]:
+            since = parse_date(options["since"])
+            if since is None:
+                raise CommandError("--since must be a date (YYYY-MM-DD)")
+            records = records.filter(submitted_at__date__gte=since)
+        if options["ids"] and not options["source"]:
+            raise CommandError("--id needs --source: ids are only unique per source")
+        if not (options["ids"] or options["since"] or options["all"]):
+            raise CommandError("Pass --id, --since or --all to choose what to restore")
+
+        count = archive.restore(records, options["chunk_size"])
+        self.stdout.write(self.style.SUCCESS(f"Restored {count} record(s)."))
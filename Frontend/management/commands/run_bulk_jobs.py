@@ -0,0 +1,26 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from Frontend import jobs
+
+
+class Command(BaseCommand):
+    help = (
+        "Run queued admin bulk jobs. Use with BULK_JOB_RUNNER=worker, or to "
+        "finish jobs left running by a process that stopped: they are taken "
+        "over once their lease expires (BULK_JOB_LEASE_SECONDS)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--once", action="store_true", help="Exit when the queue is empty")
+        parser.add_argument("--poll", type=float, default=2.0, help="Seconds between queue checks")
+
+    def handle(self, *args, **options):
+        while True:
+            count = jobs.run_pending()
+            if count:
+                self.stdout.write(self.style.SUCCESS(f"Ran {count} job(s)."))
+            if options["once"]:
+                return
+            time.sleep(options["poll"])
@@ -0,0 +1,34 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from Frontend.notifications import Drain
+
+
+class Command(BaseCommand):
+    help = (
+        "Mail the new-submission notifications waiting in the outbox, "
+        "coalescing bursts into digests."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--once", action="store_true", help="Exit after one pass")
+        parser.add_argument(
+            "--flush", action="store_true", help="Send everything due now, without waiting to coalesce"
+        )
+        parser.add_argument("--poll", type=float, default=5.0, help="Seconds between passes")
+
+    def handle(self, *args, **options):
+        if not settings.NOTIFY_RECIPIENTS:
+            raise CommandError("NOTIFY_RECIPIENTS is empty; nobody to notify")
+        drain = Drain()
+        while True:
+            sent, failed = drain(force=options["flush"])
+            if sent:
+                self.stdout.write(self.style.SUCCESS(f"Sent {sent} notification(s)."))
+            if failed:
+                self.stderr.write(f"{failed} notification(s) failed; will retry with backoff.")
+            if options["once"]:
+                return
+            time.sleep(options["poll"])
@@ -0,0 +1,37 @@
+import sqlite3
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+
+
+class Command(BaseCommand):
+    help = "Copy the SQLite database to the replica file (a local read-replica stand-in)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output",
+            default=None,
+            help="Replica path (defaults to the replica database's NAME).",
+        )
+
+    def handle(self, *args, **options):
+        primary = connections[DEFAULT_DB_ALIAS]
+        if primary.vendor != "sqlite":
+            raise CommandError("The primary database is not SQLite.")
+        output = options["output"]
+        if output is None:
+            alias = settings.DATABASE_REPLICA_ALIAS
+            if not alias:
+                raise CommandError("No replica configured: set SQLITE_REPLICA_PATH or pass --output.")
+            output = settings.DATABASES[alias]["NAME"]
+
+        primary.ensure_connection()
+        # The online backup API copies a consistent snapshot while writers
+        # carry on, replacing the replica in a single step.
+        target = sqlite3.connect(output)
+        try:
+            primary.connection.backup(target)
+        finally:
+            target.close()
+        self.stdout.write(self.style.SUCCESS(f"Replica written to {output}"))
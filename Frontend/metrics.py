@@ -0,0 +1,242 @@
+# Frontend/metrics.py
+"""Per-view request metrics, Server-Timing headers and Prometheus export.
+
+``MetricsMiddleware`` times every request and, through a database execute
+wrapper added to each connection as it opens and the
+``TimedDjangoTemplates`` backend, the SQL and template work inside it. Each
+response gets a ``Server-Timing`` header and the numbers are added to
+fixed-bucket histograms keyed by view name.
+
+Recording never takes a lock: every thread owns its own table of counters,
+registered once in ``_stores``. When a thread exits its table is folded
+into ``_retired`` and unregistered, so servers that recycle threads do not
+grow ``_stores`` without bound. ``render_prometheus`` sums the tables when
+``/metrics/`` is scraped; a scrape that races a request may miss that one
+request, which the next scrape picks up.
+"""
+import threading
+import time
+import weakref
+from bisect import bisect_left
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.template.backends.django import DjangoTemplates, Template
+
+# Upper bounds in seconds; a final +Inf bucket is implied.
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+# Per-view counters: [*bucket counts, +Inf count, duration sum, queries,
+# query seconds, template seconds, 5xx responses]
+_SUM, _QUERIES, _QUERY_TIME, _TEMPLATE_TIME, _ERRORS = range(
+    len(LATENCY_BUCKETS) + 1, len(LATENCY_BUCKETS) + 6
+)
+_WIDTH = len(LATENCY_BUCKETS) + 6
+
+_local = threading.local()
+_stores = []
+# Counters from threads that have exited
+_retired = {}
+# Reentrant: a thread's finalizer can run from a garbage collection
+# triggered while this thread already holds it.
+_stores_lock = threading.RLock()
+
+_current = ContextVar("request_metrics", default=None)
+
+
+class RequestMetrics:
+    __slots__ = ("queries", "query_time", "template_time", "rendering")
+
+    def __init__(self):
+        self.queries = 0
+        self.query_time = 0.0
+        self.template_time = 0.0
+        self.rendering = False
+
+
+def install_query_timer(connection):
+    """Add the query timer to ``connection`` (see signals.connection_created)"""
+    if _time_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_time_query)
+
+
+def _time_query(execute, sql, params, many, context):
+    metrics = _current.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.query_time += time.perf_counter() - start
+        metrics.queries += 1
+
+
+class _Owner:
+    """Lives in the thread-local, so it is freed when its thread exits"""
+
+
+def _add(totals, store):
+    for view, row in list(store.items()):
+        total = totals.setdefault(view, [0] * _WIDTH)
+        for i, value in enumerate(row):
+            total[i] += value
+
+
+def _retire(store):
+    with _stores_lock:
+        _add(_retired, store)
+        _stores[:] = [s for s in _stores if s is not store]
+
+
+def _store():
+    store = getattr(_local, "store", None)
+    if store is None:
+        store = _local.store = {}
+        _local.owner = _Owner()
+        weakref.finalize(_local.owner, _retire, store)
+        with _stores_lock:
+            _stores.append(store)
+    return store
+
+
+def record(view, seconds, metrics, status):
+    row = _store().get(view)
+    if row is None:
+        row = _local.store[view] = [0] * _WIDTH
+    row[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+    row[_SUM] += seconds
+    row[_QUERIES] += metrics.queries
+    row[_QUERY_TIME] += metrics.query_time
+    row[_TEMPLATE_TIME] += metrics.template_time
+    if status >= 500:
+        row[_ERRORS] += 1
+
+
+def snapshot():
+    """Counters summed over every thread, keyed by view name"""
+    totals = {}
+    with _stores_lock:
+        stores = list(_stores)
+        _add(totals, _retired)
+    for store in stores:
+        _add(totals, store)
+    return totals
+
+
+def reset():
+    with _stores_lock:
+        _retired.clear()
+        for store in _stores:
+            store.clear()
+
+
+def _label(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def render_prometheus():
+    """All counters in the Prometheus text exposition format"""
+    totals = snapshot()
+    lines = [
+        "# HELP django_request_duration_seconds Request latency by view.",
+        "# TYPE django_request_duration_seconds histogram",
+    ]
+    for view, row in sorted(totals.items()):
+        view = _label(view)
+        cumulative = 0
+        for bound, count in zip((*LATENCY_BUCKETS, "+Inf"), row):
+            cumulative += count
+            lines.append(f'django_request_duration_seconds_bucket{{view="{view}",le="{bound}"}} {cumulative}')
+        lines.append(f'django_request_duration_seconds_sum{{view="{view}"}} {row[_SUM]:.6f}')
+        lines.append(f'django_request_duration_seconds_count{{view="{view}"}} {cumulative}')
+    counters = [
+        ("django_db_queries_total", "SQL queries run by view.", _QUERIES, "d"),
+        ("django_db_query_seconds_total", "Time spent in SQL by view.", _QUERY_TIME, ".6f"),
+        ("django_template_render_seconds_total", "Time spent rendering templates by view.", _TEMPLATE_TIME, ".6f"),
+        ("django_request_errors_total", "5xx responses by view.", _ERRORS, "d"),
+    ]
+    for name, help_text, index, fmt in counters:
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+        for view, row in sorted(totals.items()):
+            lines.append(f'{name}{{view="{_label(view)}"}} {row[index]:{fmt}}')
+    return "\n".join(lines) + "\n"
+
+
+SERVER_TIMING = 'app;dur=%.1f, db;dur=%.1f;desc="%d queries", tpl;dur=%.1f'
+
+
+def server_timing(seconds, metrics):
+    return SERVER_TIMING % (
+        seconds * 1000, metrics.query_time * 1000, metrics.queries, metrics.template_time * 1000
+    )
+
+
+class MetricsMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.METRICS_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        start = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self.finish(request, response, metrics, time.perf_counter() - start)
+
+    async def __acall__(self, request):
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        start = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self.finish(request, response, metrics, time.perf_counter() - start)
+
+    def finish(self, request, response, metrics, seconds):
+        match = request.resolver_match
+        record(match.view_name if match else "<unresolved>", seconds, metrics, response.status_code)
+        if settings.METRICS_SERVER_TIMING:
+            response["Server-Timing"] = server_timing(seconds, metrics)
+        return response
+
+
+class TimedTemplate(Template):
+    def render(self, context=None, request=None):
+        metrics = _current.get()
+        # Templates rendered from inside another one are already being timed.
+        if metrics is None or metrics.rendering:
+            return super().render(context, request)
+        metrics.rendering = True
+        start = time.perf_counter()
+        try:
+            return super().render(context, request)
+        finally:
+            metrics.template_time += time.perf_counter() - start
+            metrics.rendering = False
+
+
+class TimedDjangoTemplates(DjangoTemplates):
+    """DjangoTemplates that adds render time to the current request's metrics"""
+
+    def from_string(self, template_code):
+        return TimedTemplate(self.engine.from_string(template_code), self)
+
+    def get_template(self, template_name):
+        template = super().get_template(template_name)
+        return TimedTemplate(template.template, self)
@@ -0,0 +1,69 @@
+# Generated by Django 5.0.6 on 2026-10-17 22:06
+
+from django.db import migrations, models
+from django.db.models import Count, F, Sum
+from django.db.models.functions import TruncDate
+
+
+def populate_rollups(apps, schema_editor):
+    DailyRollup = apps.get_model('Frontend', 'DailyRollup')
+    sources = [
+        ('project', apps.get_model('Frontend', 'ProjectSubmission'),
+         {'status': 'status', 'type': 'project_type'}, True),
+        ('contact', apps.get_model('Frontend', 'ContactMessage'),
+         {'read': 'is_read', 'archived': 'is_archived'}, False),
+    ]
+    rows = []
+    for source, model, dimensions, has_budget in sources:
+        for dimension, field in dimensions.items():
+            aggregates = {'n': Count('id')}
+            if has_budget:
+                aggregates['budget'] = Sum('budget')
+            groups = (
+                model.objects.order_by()
+                .values(day=TruncDate('submitted_at'), value=F(field))
+                .annotate(**aggregates)
+            )
+            for group in groups:
+                value = group['value']
+                if isinstance(value, bool):
+                    value = '1' if value else '0'
+                rows.append(DailyRollup(
+                    day=group['day'],
+                    source=source,
+                    bucket=f'{dimension}:{value}',
+                    count=group['n'],
+                    budget_total=group.get('budget') or 0,
+                ))
+    DailyRollup.objects.bulk_create(rows, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Frontend', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('source', models.CharField(choices=[('project', 'Project Submission'), ('contact', 'Contact Message')], max_length=20)),
+                ('bucket', models.CharField(max_length=50)),
+                ('count', models.IntegerField(default=0)),
+                ('budget_total', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+            ],
+            options={
+                'verbose_name': 'Daily Rollup',
+                'verbose_name_plural': 'Daily Rollups',
+                'ordering': ['-day', 'source', 'bucket'],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='dailyrollup',
+            constraint=models.UniqueConstraint(fields=('day', 'source', 'bucket'), name='unique_daily_rollup'),
+        ),
+        migrations.RunPython(populate_rollups, migrations.RunPython.noop),
+    ]
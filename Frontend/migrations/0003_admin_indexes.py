@@ -0,0 +1,49 @@
+# Generated by Django 5.0.6 on 2026-10-17 22:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Frontend', '0002_dailyrollup'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contactmessage',
+            index=models.Index(fields=['-submitted_at', '-id'], name='contact_submitted_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contactmessage',
+            index=models.Index(condition=models.Q(('is_read', False)), fields=['-submitted_at', '-id'], name='contact_unread_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contactmessage',
+            index=models.Index(condition=models.Q(('is_archived', False)), fields=['-submitted_at', '-id'], name='contact_inbox_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contactmessage',
+            index=models.Index(condition=models.Q(('is_archived', True)), fields=['-submitted_at', '-id'], name='contact_archived_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='dailyrollup',
+            index=models.Index(fields=['source', 'bucket', 'day'], name='rollup_source_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='projectsubmission',
+            index=models.Index(fields=['-submitted_at', '-id'], name='project_submitted_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='projectsubmission',
+            index=models.Index(fields=['status', '-submitted_at', '-id'], name='project_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='projectsubmission',
+            index=models.Index(fields=['project_type', '-submitted_at', '-id'], name='project_type_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='projectsubmission',
+            index=models.Index(fields=['timeline', '-submitted_at', '-id'], name='project_timeline_idx'),
+        ),
+    ]
@@ -0,0 +1,62 @@
+from django.db import migrations
+
+# The FTS5 tables and triggers (SQLite) and GIN indexes (PostgreSQL) for
+# Frontend.search.SEARCH_INDEXES, written out in full so later changes to
+# the app code cannot change what this migration does.
+SQLITE_INSTALL = [
+    'CREATE VIRTUAL TABLE "Frontend_contactmessage_fts" USING fts5("name", "email", "subject", "message", content="Frontend_contactmessage", content_rowid=\'id\', tokenize=\'unicode61 remove_diacritics 2\', prefix=\'2 3\')',
+    'CREATE TRIGGER "Frontend_contactmessage_fts_ai" AFTER INSERT ON "Frontend_contactmessage" BEGIN INSERT INTO "Frontend_contactmessage_fts"(rowid, "name", "email", "subject", "message") VALUES (new.id, new."name", new."email", new."subject", new."message"); END',
+    'CREATE TRIGGER "Frontend_contactmessage_fts_ad" AFTER DELETE ON "Frontend_contactmessage" BEGIN INSERT INTO "Frontend_contactmessage_fts"("Frontend_contactmessage_fts", rowid, "name", "email", "subject", "message") VALUES (\'delete\', old.id, old."name", old."email", old."subject", old."message"); END',
+    'CREATE TRIGGER "Frontend_contactmessage_fts_au" AFTER UPDATE OF "name", "email", "subject", "message" ON "Frontend_contactmessage" BEGIN INSERT INTO "Frontend_contactmessage_fts"("Frontend_contactmessage_fts", rowid, "name", "email", "subject", "message") VALUES (\'delete\', old.id, old."name", old."email", old."subject", old."message"); INSERT INTO "Frontend_contactmessage_fts"(rowid, "name", "email", "subject", "message") VALUES (new.id, new."name", new."email", new."subject", new."message"); END',
+    'INSERT INTO "Frontend_contactmessage_fts"("Frontend_contactmessage_fts") VALUES (\'rebuild\')',
+    'CREATE VIRTUAL TABLE "Frontend_projectsubmission_fts" USING fts5("project_title", "client_name", "email", "company", "phone", content="Frontend_projectsubmission", content_rowid=\'id\', tokenize=\'unicode61 remove_diacritics 2\', prefix=\'2 3\')',
+    'CREATE TRIGGER "Frontend_projectsubmission_fts_ai" AFTER INSERT ON "Frontend_projectsubmission" BEGIN INSERT INTO "Frontend_projectsubmission_fts"(rowid, "project_title", "client_name", "email", "company", "phone") VALUES (new.id, new."project_title", new."client_name", new."email", new."company", new."phone"); END',
+    'CREATE TRIGGER "Frontend_projectsubmission_fts_ad" AFTER DELETE ON "Frontend_projectsubmission" BEGIN INSERT INTO "Frontend_projectsubmission_fts"("Frontend_projectsubmission_fts", rowid, "project_title", "client_name", "email", "company", "phone") VALUES (\'delete\', old.id, old."project_title", old."client_name", old."email", old."company", old."phone"); END',
+    'CREATE TRIGGER "Frontend_projectsubmission_fts_au" AFTER UPDATE OF "project_title", "client_name", "email", "company", "phone" ON "Frontend_projectsubmission" BEGIN INSERT INTO "Frontend_projectsubmission_fts"("Frontend_projectsubmission_fts", rowid, "project_title", "client_name", "email", "company", "phone") VALUES (\'delete\', old.id, old."project_title", old."client_name", old."email", old."company", old."phone"); INSERT INTO "Frontend_projectsubmission_fts"(rowid, "project_title", "client_name", "email", "company", "phone") VALUES (new.id, new."project_title", new."client_name", new."email", new."company", new."phone"); END',
+    'INSERT INTO "Frontend_projectsubmission_fts"("Frontend_projectsubmission_fts") VALUES (\'rebuild\')',
+]
+
+SQLITE_UNINSTALL = [
+    'DROP TRIGGER IF EXISTS "Frontend_contactmessage_fts_ai"',
+    'DROP TRIGGER IF EXISTS "Frontend_contactmessage_fts_ad"',
+    'DROP TRIGGER IF EXISTS "Frontend_contactmessage_fts_au"',
+    'DROP TABLE IF EXISTS "Frontend_contactmessage_fts"',
+    'DROP TRIGGER IF EXISTS "Frontend_projectsubmission_fts_ai"',
+    'DROP TRIGGER IF EXISTS "Frontend_projectsubmission_fts_ad"',
+    'DROP TRIGGER IF EXISTS "Frontend_projectsubmission_fts_au"',
+    'DROP TABLE IF EXISTS "Frontend_projectsubmission_fts"',
+]
+
+POSTGRESQL_INSTALL = [
+    'CREATE INDEX IF NOT EXISTS "Frontend_contactmessage_search_gin" ON "Frontend_contactmessage" USING GIN (to_tsvector(\'simple\', coalesce("name", \'\') || \' \' || coalesce("email", \'\') || \' \' || coalesce("subject", \'\') || \' \' || coalesce("message", \'\')))',
+    'CREATE INDEX IF NOT EXISTS "Frontend_projectsubmission_search_gin" ON "Frontend_projectsubmission" USING GIN (to_tsvector(\'simple\', coalesce("project_title", \'\') || \' \' || coalesce("client_name", \'\') || \' \' || coalesce("email", \'\') || \' \' || coalesce("company", \'\') || \' \' || coalesce("phone", \'\')))',
+]
+
+POSTGRESQL_UNINSTALL = [
+    'DROP INDEX IF EXISTS "Frontend_contactmessage_search_gin"',
+    'DROP INDEX IF EXISTS "Frontend_projectsubmission_search_gin"',
+]
+
+INSTALL = {'sqlite': SQLITE_INSTALL, 'postgresql': POSTGRESQL_INSTALL}
+UNINSTALL = {'sqlite': SQLITE_UNINSTALL, 'postgresql': POSTGRESQL_UNINSTALL}
+
+
+def install(apps, schema_editor):
+    for statement in INSTALL.get(schema_editor.connection.vendor, []):
+        schema_editor.execute(statement)
+
+
+def uninstall(apps, schema_editor):
+    for statement in UNINSTALL.get(schema_editor.connection.vendor, []):
+        schema_editor.execute(statement)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Frontend', '0003_admin_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(install, uninstall),
+    ]
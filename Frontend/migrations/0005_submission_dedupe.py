@@ -0,0 +1,83 @@
+# Generated by Django 5.0.6 on 2026-10-17 22:18
+
+from django.db import migrations, models
+
+# The full-text SQL from 0004, frozen here too: this migration must keep
+# doing what it did when it was written.
+SQLITE_INSTALL = [
+    'CREATE VIRTUAL TABLE "Frontend_contactmessage_fts" USING fts5("name", "email", "subject", "message", content="Frontend_contactmessage", content_rowid=\'id\', tokenize=\'unicode61 remove_diacritics 2\', prefix=\'2 3\')',
+    'CREATE TRIGGER "Frontend_contactmessage_fts_ai" AFTER INSERT ON "Frontend_contactmessage" BEGIN INSERT INTO "Frontend_contactmessage_fts"(rowid, "name", "email", "subject", "message") VALUES (new.id, new."name", new."email", new."subject", new."message"); END',
+    'CREATE TRIGGER "Frontend_contactmessage_fts_ad" AFTER DELETE ON "Frontend_contactmessage" BEGIN INSERT INTO "Frontend_contactmessage_fts"("Frontend_contactmessage_fts", rowid, "name", "email", "subject", "message") VALUES (\'delete\', old.id, old."name", old."email", old."subject", old."message"); END',
+    'CREATE TRIGGER "Frontend_contactmessage_fts_au" AFTER UPDATE OF "name", "email", "subject", "message" ON "Frontend_contactmessage" BEGIN INSERT INTO "Frontend_contactmessage_fts"("Frontend_contactmessage_fts", rowid, "name", "email", "subject", "message") VALUES (\'delete\', old.id, old."name", old."email", old."subject", old."message"); INSERT INTO "Frontend_contactmessage_fts"(rowid, "name", "email", "subject", "message") VALUES (new.id, new."name", new."email", new."subject", new."message"); END',
+    'INSERT INTO "Frontend_contactmessage_fts"("Frontend_contactmessage_fts") VALUES (\'rebuild\')',
+    'CREATE VIRTUAL TABLE "Frontend_projectsubmission_fts" USING fts5("project_title", "client_name", "email", "company", "phone", content="Frontend_projectsubmission", content_rowid=\'id\', tokenize=\'unicode61 remove_diacritics 2\', prefix=\'2 3\')',
+    'CREATE TRIGGER "Frontend_projectsubmission_fts_ai" AFTER INSERT ON "Frontend_projectsubmission" BEGIN INSERT INTO "Frontend_projectsubmission_fts"(rowid, "project_title", "client_name", "email", "company", "phone") VALUES (new.id, new."project_title", new."client_name", new."email", new."company", new."phone"); END',
+    'CREATE TRIGGER "Frontend_projectsubmission_fts_ad" AFTER DELETE ON "Frontend_projectsubmission" BEGIN INSERT INTO "Frontend_projectsubmission_fts"("Frontend_projectsubmission_fts", rowid, "project_title", "client_name", "email", "company", "phone") VALUES (\'delete\', old.id, old."project_title", old."client_name", old."email", old."company", old."phone"); END',
+    'CREATE TRIGGER "Frontend_projectsubmission_fts_au" AFTER UPDATE OF "project_title", "client_name", "email", "company", "phone" ON "Frontend_projectsubmission" BEGIN INSERT INTO "Frontend_projectsubmission_fts"("Frontend_projectsubmission_fts", rowid, "project_title", "client_name", "email", "company", "phone") VALUES (\'delete\', old.id, old."project_title", old."client_name", old."email", old."company", old."phone"); INSERT INTO "Frontend_projectsubmission_fts"(rowid, "project_title", "client_name", "email", "company", "phone") VALUES (new.id, new."project_title", new."client_name", new."email", new."company", new."phone"); END',
+    'INSERT INTO "Frontend_projectsubmission_fts"("Frontend_projectsubmission_fts") VALUES (\'rebuild\')',
+]
+
+SQLITE_UNINSTALL = [
+    'DROP TRIGGER IF EXISTS "Frontend_contactmessage_fts_ai"',
+    'DROP TRIGGER IF EXISTS "Frontend_contactmessage_fts_ad"',
+    'DROP TRIGGER IF EXISTS "Frontend_contactmessage_fts_au"',
+    'DROP TABLE IF EXISTS "Frontend_contactmessage_fts"',
+    'DROP TRIGGER IF EXISTS "Frontend_projectsubmission_fts_ai"',
+    'DROP TRIGGER IF EXISTS "Frontend_projectsubmission_fts_ad"',
+    'DROP TRIGGER IF EXISTS "Frontend_projectsubmission_fts_au"',
+    'DROP TABLE IF EXISTS "Frontend_projectsubmission_fts"',
+]
+
+
+# Adding these columns remakes both tables on SQLite, which drops the
+# full-text triggers; take the index down first and rebuild it afterwards.
+def drop_search(apps, schema_editor):
+    if schema_editor.connection.vendor == 'sqlite':
+        for statement in SQLITE_UNINSTALL:
+            schema_editor.execute(statement)
+
+
+def restore_search(apps, schema_editor):
+    if schema_editor.connection.vendor == 'sqlite':
+        for statement in SQLITE_INSTALL:
+            schema_editor.execute(statement)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Frontend', '0004_fulltext_search'),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_search, restore_search),
+        migrations.AddField(
+            model_name='contactmessage',
+            name='fingerprint',
+            field=models.CharField(blank=True, default='', max_length=64),
+        ),
+        migrations.AddField(
+            model_name='contactmessage',
+            name='idempotency_key',
+            field=models.CharField(blank=True, max_length=64, null=True, unique=True),
+        ),
+        migrations.AddField(
+            model_name='projectsubmission',
+            name='fingerprint',
+            field=models.CharField(blank=True, default='', max_length=64),
+        ),
+        migrations.AddField(
+            model_name='projectsubmission',
+            name='idempotency_key',
+            field=models.CharField(blank=True, max_length=64, null=True, unique=True),
+        ),
+        migrations.AddIndex(
+            model_name='contactmessage',
+            index=models.Index(fields=['fingerprint', '-submitted_at'], name='contact_fingerprint_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='projectsubmission',
+            index=models.Index(fields=['fingerprint', '-submitted_at'], name='project_fingerprint_idx'),
+        ),
+        migrations.RunPython(restore_search, drop_search),
+    ]
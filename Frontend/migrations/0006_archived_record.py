@@ -0,0 +1,38 @@
+# Generated by Django 5.0.6 on 2026-10-17 22:31
+
+import django.core.serializers.json
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Frontend', '0005_submission_dedupe'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedRecord',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(choices=[('project', 'Project Submission'), ('contact', 'Contact Message')], max_length=20)),
+                ('original_id', models.BigIntegerField()),
+                ('summary', models.CharField(max_length=200)),
+                ('email', models.EmailField(max_length=254)),
+                ('submitted_at', models.DateTimeField()),
+                ('archived_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('payload', models.JSONField(encoder=django.core.serializers.json.DjangoJSONEncoder)),
+            ],
+            options={
+                'verbose_name': 'Archived Record',
+                'verbose_name_plural': 'Archived Records',
+                'ordering': ['-submitted_at'],
+                'indexes': [models.Index(fields=['-submitted_at', '-id'], name='archive_submitted_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='archivedrecord',
+            constraint=models.UniqueConstraint(fields=('source', 'original_id'), name='unique_archived_record'),
+        ),
+    ]
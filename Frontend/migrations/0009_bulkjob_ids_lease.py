@@ -0,0 +1,40 @@
+from django.db import migrations, models
+
+
+# Jobs queued before this migration only have the pickled query, which is
+# no longer read; fail them so the action can be run again.
+def fail_unfinished(apps, schema_editor):
+    BulkJob = apps.get_model('Frontend', 'BulkJob')
+    BulkJob.objects.filter(status__in=['pending', 'running']).update(
+        status='failed', error='Queued before an upgrade; run the action again.'
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Frontend', '0008_notification'),
+    ]
+
+    operations = [
+        migrations.RunPython(fail_unfinished, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='bulkjob',
+            name='query',
+        ),
+        migrations.AddField(
+            model_name='bulkjob',
+            name='ids',
+            field=models.JSONField(default=list),
+        ),
+        migrations.AddField(
+            model_name='bulkjob',
+            name='claim',
+            field=models.CharField(blank=True, default='', max_length=32),
+        ),
+        migrations.AddField(
+            model_name='bulkjob',
+            name='lease_expires_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
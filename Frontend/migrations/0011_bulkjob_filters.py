@@ -0,0 +1,40 @@
+from django.db import migrations, models
+
+
+# Jobs queued before this migration only have the list of ids, which is
+# no longer read; fail them so the action can be run again.
+def fail_unfinished(apps, schema_editor):
+    BulkJob = apps.get_model('Frontend', 'BulkJob')
+    BulkJob.objects.filter(status__in=['pending', 'running']).update(
+        status='failed', error='Queued before an upgrade; run the action again.'
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Frontend', '0010_rollup_updated_at'),
+    ]
+
+    operations = [
+        migrations.RunPython(fail_unfinished, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='bulkjob',
+            name='ids',
+        ),
+        migrations.AddField(
+            model_name='bulkjob',
+            name='filters',
+            field=models.JSONField(default=dict),
+        ),
+        migrations.AddField(
+            model_name='bulkjob',
+            name='search',
+            field=models.CharField(blank=True, default='', max_length=200),
+        ),
+        migrations.AddField(
+            model_name='bulkjob',
+            name='max_pk',
+            field=models.BigIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.0.6 on 2026-10-17 23:43
+
+import time
+
+from django.db import migrations, models
+
+
+def create_version(apps, schema_editor):
+    RollupVersion = apps.get_model('Frontend', 'RollupVersion')
+    RollupVersion.objects.create(pk=1, value=time.time_ns() // 1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Frontend', '0011_bulkjob_filters'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RollupVersion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('value', models.BigIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Rollup Version',
+                'verbose_name_plural': 'Rollup Versions',
+            },
+        ),
+        migrations.RunPython(create_version, migrations.RunPython.noop),
+        migrations.RemoveIndex(
+            model_name='dailyrollup',
+            name='rollup_updated_idx',
+        ),
+        migrations.RemoveField(
+            model_name='dailyrollup',
+            name='updated_at',
+        ),
+    ]
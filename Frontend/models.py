@@ -1,4 +1,6 @@
 # core/models.py (or Frontend/models.py depending on your app structure)
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
 from django.utils import timezone
 
@@ -60,6 +62,10 @@ class ProjectSubmission(models.Model):
     )
     notes = models.TextField(blank=True, null=True)  # Internal notes
     
+    # Duplicate suppression (see Frontend/dedupe.py)
+    fingerprint = models.CharField(max_length=64, blank=True, default='')
+    idempotency_key = models.CharField(max_length=64, blank=True, null=True, unique=True)
+    
     # Timestamps - THESE ARE MODEL FIELDS, NOT META ATTRIBUTES
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -70,6 +76,15 @@ class ProjectSubmission(models.Model):
         ordering = ['-submitted_at']
         verbose_name = 'Project Submission'
         verbose_name_plural = 'Project Submissions'
+        # Each admin list_filter is paired with the changelist ordering
+        # (-submitted_at, -pk) so filtered pages are read in index order.
+        indexes = [
+            models.Index(fields=['-submitted_at', '-id'], name='project_submitted_idx'),
+            models.Index(fields=['status', '-submitted_at', '-id'], name='project_status_idx'),
+            models.Index(fields=['project_type', '-submitted_at', '-id'], name='project_type_idx'),
+            models.Index(fields=['timeline', '-submitted_at', '-id'], name='project_timeline_idx'),
+            models.Index(fields=['fingerprint', '-submitted_at'], name='project_fingerprint_idx'),
+        ]
     
     def __str__(self):
         return f"{self.project_title} - {self.client_name}"
@@ -106,6 +121,10 @@ class ContactMessage(models.Model):
     is_read = models.BooleanField(default=False)
     is_archived = models.BooleanField(default=False)
     
+    # Duplicate suppression (see Frontend/dedupe.py)
+    fingerprint = models.CharField(max_length=64, blank=True, default='')
+    idempotency_key = models.CharField(max_length=64, blank=True, null=True, unique=True)
+    
     # Timestamps - MODEL FIELDS
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -116,6 +135,192 @@ class ContactMessage(models.Model):
         ordering = ['-submitted_at']
         verbose_name = 'Contact Message'
         verbose_name_plural = 'Contact Messages'
+        # Django compiles boolean filters to "is_read" / NOT "is_read", which
+        # SQLite can only match against partial indexes with that condition.
+        indexes = [
+            models.Index(fields=['-submitted_at', '-id'], name='contact_submitted_idx'),
+            models.Index(fields=['fingerprint', '-submitted_at'], name='contact_fingerprint_idx'),
+            models.Index(
+                fields=['-submitted_at', '-id'],
+                condition=models.Q(is_read=False),
+                name='contact_unread_idx',
+            ),
+            models.Index(
+                fields=['-submitted_at', '-id'],
+                condition=models.Q(is_archived=False),
+                name='contact_inbox_idx',
+            ),
+            models.Index(
+                fields=['-submitted_at', '-id'],
+                condition=models.Q(is_archived=True),
+                name='contact_archived_idx',
+            ),
+        ]
+    
+    def __str__(self):
+        return f"{self.subject} - {self.name}"
+
+
+class DailyRollup(models.Model):
+    """Per-day counters for the dashboard, maintained by Frontend/rollups.py"""
+    SOURCES = [
+        ('project', 'Project Submission'),
+        ('contact', 'Contact Message'),
+    ]
+    
+    day = models.DateField()
+    source = models.CharField(max_length=20, choices=SOURCES)
+    # "<dimension>:<value>", e.g. "status:pending", "type:web", "read:0"
+    bucket = models.CharField(max_length=50)
+    count = models.IntegerField(default=0)
+    budget_total = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    
+    class Meta:
+        ordering = ['-day', 'source', 'bucket']
+        verbose_name = 'Daily Rollup'
+        verbose_name_plural = 'Daily Rollups'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['day', 'source', 'bucket'], name='unique_daily_rollup'
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['source', 'bucket', 'day'], name='rollup_source_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.day} {self.source} {self.bucket}: {self.count}"
+
+
+class RollupVersion(models.Model):
+    """Single row counting changes to the rollups; bumped by
+    Frontend/rollups.py in the transaction that changes them"""
+    value = models.BigIntegerField(default=0)
+    
+    class Meta:
+        verbose_name = 'Rollup Version'
+        verbose_name_plural = 'Rollup Versions'
+    
+    def __str__(self):
+        return str(self.value)
+
+
+class ArchivedRecord(models.Model):
+    """A closed submission or archived message moved out of the live tables
+    by Frontend/archive.py; ``payload`` holds every column of the original row"""
+    SOURCES = [
+        ('project', 'Project Submission'),
+        ('contact', 'Contact Message'),
+    ]
+    
+    source = models.CharField(max_length=20, choices=SOURCES)
+    original_id = models.BigIntegerField()
+    # Copied out of the payload so the archive can be listed and searched
+    summary = models.CharField(max_length=200)
+    email = models.EmailField()
+    submitted_at = models.DateTimeField()
+    archived_at = models.DateTimeField(default=timezone.now)
+    payload = models.JSONField(encoder=DjangoJSONEncoder)
+    
+    class Meta:
+        ordering = ['-submitted_at']
+        verbose_name = 'Archived Record'
+        verbose_name_plural = 'Archived Records'
+        constraints = [
+            models.UniqueConstraint(fields=['source', 'original_id'], name='unique_archived_record'),
+        ]
+        indexes = [
+            models.Index(fields=['-submitted_at', '-id'], name='archive_submitted_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.get_source_display()} #{self.original_id}: {self.summary}"
+
+
+class BulkJob(models.Model):
+    """An admin bulk action run in the background by Frontend/jobs.py"""
+    STATUSES = [
+        ('pending', 'Pending'),
+        ('running', 'Running'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+        ('cancelled', 'Cancelled'),
+    ]
+    
+    source = models.CharField(max_length=20)
+    description = models.CharField(max_length=200)
+    changes = models.JSONField()
+    # The changelist lookups and search that selected the rows; each lookup
+    # maps to a list of values, any of which may match
+    filters = models.JSONField(default=dict)
+    search = models.CharField(max_length=200, blank=True, default='')
+    # Highest selected primary key when the job was queued; rows added
+    # later are left alone
+    max_pk = models.BigIntegerField(default=0)
+    status = models.CharField(max_length=20, choices=STATUSES, default='pending')
+    total = models.IntegerField(null=True, blank=True)
+    processed = models.IntegerField(default=0)
+    # Highest primary key handled so far; the next chunk starts after it
+    last_pk = models.BigIntegerField(default=0)
+    error = models.TextField(blank=True, default='')
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL, null=True, blank=True, on_delete=models.SET_NULL
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    # Set by the runner holding the job (see jobs.claim); a running job whose
+    # lease has expired is claimed again
+    claim = models.CharField(max_length=32, blank=True, default='')
+    lease_expires_at = models.DateTimeField(null=True, blank=True)
+    
+    class Meta:
+        ordering = ['-created_at']
+        verbose_name = 'Bulk Job'
+        verbose_name_plural = 'Bulk Jobs'
+        indexes = [
+            models.Index(fields=['status', 'created_at'], name='bulkjob_status_idx'),
+        ]
+    
+    def __str__(self):
+        return f"#{self.pk} {self.description}"
+    
+    @property
+    def percent(self):
+        if not self.total:
+            return 100 if self.status == 'done' else 0
+        return min(100, round(self.processed * 100 / self.total))
+
+
+class Notification(models.Model):
+    """Outbox row for a new submission, written in the submission's
+    transaction and mailed by Frontend/notifications.py"""
+    STATUSES = [
+        ('pending', 'Pending'),
+        ('sent', 'Sent'),
+        ('failed', 'Failed'),
+    ]
+    
+    source = models.CharField(max_length=20)
+    object_id = models.BigIntegerField()
+    summary = models.CharField(max_length=300)
+    status = models.CharField(max_length=20, choices=STATUSES, default='pending')
+    attempts = models.IntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    # Set by the worker that is sending the row (see notifications.claim)
+    claim = models.CharField(max_length=32, blank=True, default='')
+    last_error = models.TextField(blank=True, default='')
+    created_at = models.DateTimeField(default=timezone.now)
+    sent_at = models.DateTimeField(null=True, blank=True)
+    
+    class Meta:
+        ordering = ['-created_at']
+        verbose_name = 'Notification'
+        verbose_name_plural = 'Notifications'
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at'], name='notification_due_idx'),
+            models.Index(fields=['claim'], name='notification_claim_idx'),
+        ]
     
     def __str__(self):
-        return f"{self.subject} - {self.name}"
\ No newline at end of file
+        return f"{self.source} #{self.object_id} ({self.status})"
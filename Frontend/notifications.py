@@ -0,0 +1,157 @@
+# Frontend/notifications.py
+"""Transactional outbox for new-submission emails.
+
+Saving a submission also inserts a ``Notification`` row in the same
+transaction (``record``, called from the post_save receiver and from
+``ingest.write_rows``), so a request never talks to the mail server and a
+row that is rolled back is never announced.
+
+``manage.py send_notifications`` drains the outbox. It waits until the
+oldest pending row is ``NOTIFY_COALESCE_SECONDS`` old (or a full batch is
+waiting), claims up to ``NOTIFY_BATCH_SIZE`` rows with one UPDATE and sends
+them as one message: a single notice, or a digest for a burst. The batches
+of one pass share a single SMTP connection. A failed send leaves the rows
+pending with an exponential backoff until ``NOTIFY_MAX_ATTEMPTS``, after
+which they are marked failed.
+"""
+import logging
+import secrets
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.urls import reverse
+from django.utils import timezone
+
+from . import rollups
+from .models import Notification
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_FIELDS = {
+    "project": "New project: {obj.project_title} from {obj.client_name} <{obj.email}>",
+    "contact": "New message: {obj.subject} from {obj.name} <{obj.email}>",
+}
+
+
+def record(instances):
+    """Queue a notification for each newly stored submission"""
+    now = timezone.now()
+    rows = []
+    for obj in instances:
+        source = rollups.source_for(type(obj))
+        summary = SUMMARY_FIELDS[source].format(obj=obj)[:300]
+        rows.append(
+            Notification(source=source, object_id=obj.pk, summary=summary, created_at=now, next_attempt_at=now)
+        )
+    Notification.objects.bulk_create(rows)
+
+
+def _due(now):
+    return Notification.objects.filter(status="pending", next_attempt_at__lte=now)
+
+
+def ready(now=None):
+    """Whether a batch should go out now rather than wait for more rows"""
+    now = now or timezone.now()
+    due = _due(now).order_by("created_at")
+    oldest = due.values_list("created_at", flat=True).first()
+    if oldest is None:
+        return False
+    if oldest <= now - timedelta(seconds=settings.NOTIFY_COALESCE_SECONDS):
+        return True
+    return due[settings.NOTIFY_BATCH_SIZE - 1 : settings.NOTIFY_BATCH_SIZE].exists()
+
+
+def claim(now=None):
+    """Lease up to NOTIFY_BATCH_SIZE due rows to this worker; returns them.
+
+    One UPDATE both picks and leases the rows, so concurrent workers never
+    share a row and the claim takes no read lock before its write.
+    """
+    now = now or timezone.now()
+    token = secrets.token_hex(16)
+    ids = _due(now).order_by("next_attempt_at", "pk").values("pk")[: settings.NOTIFY_BATCH_SIZE]
+    lease = now + timedelta(seconds=settings.NOTIFY_LEASE_SECONDS)
+    Notification.objects.filter(pk__in=ids).update(claim=token, next_attempt_at=lease)
+    return list(Notification.objects.filter(claim=token).order_by("created_at", "pk"))
+
+
+def _admin_url(notification):
+    model = rollups.SOURCES[notification.source][0]
+    path = reverse(
+        f"admin:{model._meta.app_label}_{model._meta.model_name}_change", args=[notification.object_id]
+    )
+    return settings.NOTIFY_SITE_URL.rstrip("/") + path
+
+
+def build_message(notifications, connection=None):
+    if len(notifications) == 1:
+        subject = notifications[0].summary
+    else:
+        subject = f"{len(notifications)} new submissions"
+    lines = [f"{n.summary}\n  {_admin_url(n)}" for n in notifications]
+    return EmailMessage(
+        subject=f"{settings.EMAIL_SUBJECT_PREFIX}{subject}",
+        body="\n\n".join(lines) + "\n",
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=settings.NOTIFY_RECIPIENTS,
+        connection=connection,
+    )
+
+
+def backoff(attempts):
+    return min(settings.NOTIFY_BACKOFF_SECONDS * 2 ** (attempts - 1), settings.NOTIFY_BACKOFF_MAX)
+
+
+def send_batch(notifications, connection):
+    """Mail ``notifications`` as one message; returns True if it was sent"""
+    now = timezone.now()
+    try:
+        # A no-op while the connection is open; Drain closes it when idle.
+        connection.open()
+        connection.send_messages([build_message(notifications, connection)])
+    except Exception as e:
+        logger.warning("Sending %d notification(s) failed: %s", len(notifications), e)
+        # Drop the connection so the next batch reconnects.
+        connection.close()
+        for n in notifications:
+            n.attempts += 1
+            n.last_error = f"{type(e).__name__}: {e}"
+            n.next_attempt_at = now + timedelta(seconds=backoff(n.attempts))
+            if n.attempts >= settings.NOTIFY_MAX_ATTEMPTS:
+                n.status = "failed"
+            n.claim = ""
+        Notification.objects.bulk_update(
+            notifications, ["attempts", "last_error", "next_attempt_at", "status", "claim"]
+        )
+        return False
+    Notification.objects.filter(pk__in=[n.pk for n in notifications]).update(
+        status="sent", sent_at=now, claim=""
+    )
+    return True
+
+
+class Drain:
+    """Sends due notifications over one reused mail connection"""
+
+    def __init__(self, connection=None):
+        self.connection = connection or get_connection(fail_silently=False)
+
+    def __call__(self, force=False):
+        """Send every ready batch; returns (sent, failed) notification counts"""
+        sent = failed = 0
+        try:
+            while force or ready():
+                batch = claim()
+                if not batch:
+                    break
+                if send_batch(batch, self.connection):
+                    sent += len(batch)
+                else:
+                    failed += len(batch)
+                    break
+        finally:
+            # Mail servers drop idle connections; reconnect on the next pass.
+            self.connection.close()
+        return sent, failed
@@ -0,0 +1,110 @@
+# Frontend/pagecache.py
+"""Full-page cache for the static marketing views.
+
+Rendered pages are stored per path and deploy version (``PAGE_CACHE_VERSION``)
+together with a strong ETag, so repeat hits are a single cache lookup and
+conditional requests are answered with a 304 before any template work.
+
+Pages whose scripts post back with the ``csrftoken`` cookie are decorated
+with ``cached_page(csrf_cookie=True)``: a visitor without the cookie gets it
+on the response, while the stored page itself stays free of any token.
+"""
+import hashlib
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import caches
+from django.http import HttpResponse, HttpResponseNotModified
+from django.middleware.csrf import get_token
+from django.utils.cache import patch_cache_control
+from django.utils.http import parse_etags
+
+
+def get_page_cache():
+    return caches[settings.PAGE_CACHE_ALIAS]
+
+
+def page_cache_key(path):
+    """Cache key for a page: deploy version plus request path"""
+    return f"page:{settings.PAGE_CACHE_VERSION}:{path}"
+
+
+def make_etag(content):
+    """Strong ETag derived from the rendered bytes"""
+    return '"%s"' % hashlib.sha256(content).hexdigest()[:32]
+
+
+def etag_matches(request, etag):
+    """True if the request's If-None-Match header covers ``etag``"""
+    header = request.META.get("HTTP_IF_NONE_MATCH")
+    if not header:
+        return False
+    # If-None-Match uses the weak comparison function (RFC 9110 13.1.2).
+    etags = [tag.removeprefix("W/") for tag in parse_etags(header)]
+    return "*" in etags or etag in etags
+
+
+def _is_cacheable(request, response):
+    if response.status_code != 200 or response.streaming:
+        return False
+    if response.cookies or response.has_header("Vary"):
+        return False
+    # A page that rendered {% csrf_token %} or touched the session is
+    # specific to one visitor and must never be shared.
+    if request.META.get("CSRF_COOKIE_NEEDS_UPDATE"):
+        return False
+    session = getattr(request, "session", None)
+    return not (session is not None and session.accessed)
+
+
+def _page_response(request, etag, content, content_type):
+    if etag_matches(request, etag):
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(content, content_type=content_type)
+    response["ETag"] = etag
+    patch_cache_control(response, public=True, no_cache=True)
+    # Shared by every visitor; prerender.render_page relies on this.
+    response.shared_page = True
+    return response
+
+
+def _issue_csrf_cookie(request, response):
+    if settings.CSRF_COOKIE_NAME in request.COOKIES:
+        return
+    # CsrfViewMiddleware sets the cookie on the way out; the response
+    # carrying it must not be stored by a shared cache.
+    get_token(request)
+    patch_cache_control(response, public=False, private=True)
+
+
+def cached_page(view_func=None, *, csrf_cookie=False):
+    """Serve a context-free page view from the page cache.
+
+    With ``csrf_cookie`` the response also sets the CSRF cookie for visitors
+    that have none, like ``ensure_csrf_cookie`` but after the page is stored.
+    """
+    if view_func is None:
+        return lambda func: cached_page(func, csrf_cookie=csrf_cookie)
+
+    @wraps(view_func)
+    def _wrapped_view(request, *args, **kwargs):
+        if request.method not in ("GET", "HEAD"):
+            return view_func(request, *args, **kwargs)
+
+        cache = get_page_cache()
+        key = page_cache_key(request.path)
+        entry = cache.get(key)
+        if entry is None:
+            response = view_func(request, *args, **kwargs)
+            if not _is_cacheable(request, response):
+                return response
+            entry = (make_etag(response.content), response.content, response["Content-Type"])
+            cache.set(key, entry, settings.PAGE_CACHE_TIMEOUT)
+        response = _page_response(request, *entry)
+        if csrf_cookie:
+            _issue_csrf_cookie(request, response)
+        return response
+
+    _wrapped_view.csrf_cookie = csrf_cookie
+    return _wrapped_view
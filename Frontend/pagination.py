@@ -0,0 +1,175 @@
+# Frontend/pagination.py
+"""Keyset pagination and approximate counts for the admin changelists.
+
+With the default ordering (-submitted_at, -pk) pages are fetched with a
+seek predicate on the last row seen instead of OFFSET, so every page costs
+one index range scan. Totals come from the planner's table statistics (or a
+briefly cached COUNT for filtered lists) unless ``?exact_count=1`` asks
+for the real number.
+"""
+import hashlib
+from datetime import datetime
+
+from django.conf import settings
+from django.contrib.admin.options import IncorrectLookupParameters
+from django.contrib.admin.views.main import PAGE_VAR, ChangeList
+from django.core.cache import cache
+from django.db import DatabaseError, connections, transaction
+from django.db.models import Q
+
+AFTER_VAR = "after"
+BEFORE_VAR = "before"
+EXACT_COUNT_VAR = "exact_count"
+KEYSET_PARAMS = (AFTER_VAR, BEFORE_VAR, EXACT_COUNT_VAR)
+KEYSET_ORDERING = ["-submitted_at", "-pk"]
+
+
+def encode_cursor(key):
+    submitted_at, pk = key
+    return f"{submitted_at.isoformat()}_{pk}"
+
+
+def decode_cursor(value):
+    try:
+        submitted_at, _, pk = value.rpartition("_")
+        return datetime.fromisoformat(submitted_at), int(pk)
+    except ValueError:
+        raise IncorrectLookupParameters(f"Invalid cursor {value!r}")
+
+
+def seek(queryset, key, older, inclusive=False):
+    """Rows older (or newer) than ``key`` in (-submitted_at, -pk) order"""
+    submitted_at, pk = key
+    # The range on submitted_at alone is what lets the index seek; the OR
+    # only breaks ties between rows sharing a timestamp.
+    if older:
+        tie = Q(pk__lte=pk) if inclusive else Q(pk__lt=pk)
+        return queryset.filter(Q(submitted_at__lt=submitted_at) | tie, submitted_at__lte=submitted_at)
+    tie = Q(pk__gte=pk) if inclusive else Q(pk__gt=pk)
+    return queryset.filter(Q(submitted_at__gt=submitted_at) | tie, submitted_at__gte=submitted_at)
+
+
+def table_row_estimate(model, using):
+    """Row count from the planner's statistics, or None if there are none"""
+    connection = connections[using]
+    table = model._meta.db_table
+    try:
+        with transaction.atomic(using=using), connection.cursor() as cursor:
+            if connection.vendor == "postgresql":
+                cursor.execute(
+                    "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                    [connection.ops.quote_name(table)],
+                )
+            elif connection.vendor == "sqlite":
+                # Populated by ANALYZE / PRAGMA optimize. The first number of
+                # each row counts that index's entries, which for a partial
+                # index is only the rows it covers; every full index (or the
+                # idx IS NULL row of a table without one) has the table's count.
+                cursor.execute(
+                    "SELECT MAX(CAST(substr(stat, 1, instr(stat || ' ', ' ') - 1) AS INTEGER)) "
+                    "FROM sqlite_stat1 WHERE tbl = %s",
+                    [table],
+                )
+            else:
+                return None
+            row = cursor.fetchone()
+    except DatabaseError:
+        return None
+    if row is None or row[0] is None:
+        return None
+    estimate = int(str(row[0]).split()[0])
+    return estimate if estimate >= 0 else None
+
+
+def approximate_count(queryset):
+    """Cheap row count for ``queryset``; may lag the table by a little"""
+    if not queryset.query.where:
+        estimate = table_row_estimate(queryset.model, queryset.db)
+        if estimate is not None:
+            return estimate
+    sql, params = queryset.query.sql_with_params()
+    key = "approx-count:" + hashlib.sha256(f"{sql}{params}".encode()).hexdigest()
+    return cache.get_or_set(key, queryset.count, settings.APPROXIMATE_COUNT_TIMEOUT)
+
+
+class KeysetChangeList(ChangeList):
+    def __init__(self, request, *args, **kwargs):
+        # Keep our parameters away from ChangeList, which would treat any
+        # unknown GET parameter as a field lookup.
+        self.keyset_params = {
+            name: request.GET[name] for name in KEYSET_PARAMS if name in request.GET
+        }
+        if self.keyset_params:
+            request.GET = request.GET.copy()
+            for name in self.keyset_params:
+                del request.GET[name]
+        super().__init__(request, *args, **kwargs)
+
+    def uses_keyset(self):
+        return list(self.queryset.query.order_by) == KEYSET_ORDERING
+
+    def get_results(self, request):
+        if not self.uses_keyset():
+            return super().get_results(request)
+
+        after = self.keyset_params.get(AFTER_VAR)
+        before = self.keyset_params.get(BEFORE_VAR)
+        per_page = self.list_per_page
+        # Find the page's bounds with an index-only query, then hand the
+        # template a lazy queryset between them (list_editable needs one).
+        if before:
+            keys = seek(self.queryset, decode_cursor(before), older=False).order_by("submitted_at", "pk")
+            keys = list(keys.values_list("submitted_at", "pk")[: per_page + 1])
+            has_newer = len(keys) > per_page
+            keys = keys[:per_page][::-1]
+            has_older = True
+        else:
+            keys = self.queryset
+            if after:
+                keys = seek(keys, decode_cursor(after), older=True)
+            keys = list(keys.values_list("submitted_at", "pk")[: per_page + 1])
+            has_older = len(keys) > per_page
+            keys = keys[:per_page]
+            has_newer = bool(after)
+
+        if keys:
+            page = seek(self.queryset, keys[0], older=True, inclusive=True)
+            self.result_list = seek(page, keys[-1], older=False, inclusive=True)
+        else:
+            self.result_list = self.queryset.none()
+
+        self.exact_count = EXACT_COUNT_VAR in self.keyset_params
+        if self.exact_count:
+            self.result_count = self.queryset.count()
+        else:
+            self.result_count = approximate_count(self.queryset)
+        self.full_result_count = None
+        self.show_full_result_count = False
+        self.show_admin_actions = True
+        self.can_show_all = False
+        self.multi_page = has_newer or has_older
+        self.paginator = self.model_admin.get_paginator(request, self.queryset, per_page)
+
+        self.keyset = True
+        remove = [PAGE_VAR, AFTER_VAR, BEFORE_VAR]
+        self.first_page_url = self.get_query_string(remove=remove) if has_newer else None
+        self.newer_url = (
+            self.get_query_string({BEFORE_VAR: encode_cursor(keys[0])}, remove)
+            if has_newer and keys else None
+        )
+        self.older_url = (
+            self.get_query_string({AFTER_VAR: encode_cursor(keys[-1])}, remove)
+            if has_older and keys else None
+        )
+        self.exact_count_url = self.get_query_string(
+            {**self.keyset_params, EXACT_COUNT_VAR: 1}
+        )
+
+
+class KeysetPaginationMixin:
+    """ModelAdmin mixin switching the changelist to keyset pagination"""
+
+    show_full_result_count = False
+
+    def get_changelist(self, request, **kwargs):
+        return KeysetChangeList
@@ -0,0 +1,172 @@
+# Frontend/prerender.py
+"""Prerendered snapshots of the marketing pages.
+
+``manage.py prerender_pages`` renders every route in ``PRERENDER_ROUTES`` once
+into ``PRERENDER_ROOT/<PAGE_CACHE_VERSION>/`` with .gz/.br siblings, and
+``PrerenderedPageMiddleware`` streams those files straight from disk.
+
+The middleware sits near the top of ``MIDDLEWARE``, right after the
+security and clickjacking headers, so a snapshot is served without running
+sessions, auth or CSRF. Paths it cannot serve (no snapshot for this
+version, a missing file, or a page that must set the CSRF cookie for a
+visitor without one) fall through to the view and the page cache.
+"""
+import json
+from pathlib import Path
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.http import HttpResponseNotModified
+from django.urls import resolve, reverse
+from django.utils.cache import patch_cache_control, patch_vary_headers
+
+from .compression import choose_encoding, file_response, write_compressed_variants
+from .pagecache import etag_matches, make_etag
+
+PRERENDER_ROUTES = [
+    "home",
+    "index",
+    "about",
+    "services",
+    "portfolio",
+    "webdev",
+    "uiux",
+    "graphicdesign",
+    "brandidentity",
+    "startproject",
+    "project_catalyst",
+]
+
+MANIFEST_NAME = "manifest.json"
+
+
+class PageNotPrerenderable(Exception):
+    pass
+
+
+def get_output_dir(version=None):
+    return Path(settings.PRERENDER_ROOT) / (version or settings.PAGE_CACHE_VERSION)
+
+
+def _file_for_path(path):
+    # "/about/" -> "about/index.html", "/" -> "index.html"
+    return str(Path(path.strip("/")) / "index.html") if path.strip("/") else "index.html"
+
+
+def render_page(path, shared=True):
+    """Render ``path`` exactly as a plain anonymous GET would.
+
+    ``shared`` output is served to every visitor, so pages that embed a
+    CSRF token are refused.
+    """
+    from django.test import RequestFactory
+
+    host = next((h for h in settings.ALLOWED_HOSTS if "*" not in h), "localhost")
+    request = RequestFactory().get(path, HTTP_HOST=host.lstrip("."))
+    request.user = AnonymousUser()
+    match = resolve(path)
+    response = match.func(request, *match.args, **match.kwargs)
+    if response.status_code != 200:
+        raise PageNotPrerenderable(f"{path} returned HTTP {response.status_code}")
+    # A CSRF token baked into a shared file would be valid for nobody. Shared
+    # cached pages only ever set the cookie (see cached_page(csrf_cookie=True)).
+    if (
+        shared
+        and request.META.get("CSRF_COOKIE_NEEDS_UPDATE")
+        and not getattr(response, "shared_page", False)
+    ):
+        raise PageNotPrerenderable(f"{path} renders a CSRF token")
+    return response.content
+
+
+def build_snapshots(output_dir, routes=PRERENDER_ROUTES):
+    """Render ``routes`` into ``output_dir``; returns ``(manifest, skipped)``"""
+    output_dir = Path(output_dir)
+    manifest, skipped = {}, {}
+    for name in routes:
+        path = reverse(name)
+        if path in manifest:
+            continue
+        try:
+            content = render_page(path)
+        except Exception as e:
+            skipped[path] = str(e)
+            continue
+        relative = _file_for_path(path)
+        target = output_dir / relative
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(content)
+        write_compressed_variants(target, content)
+        manifest[path] = {
+            "file": relative,
+            "etag": make_etag(content),
+            "csrf_cookie": getattr(resolve(path).func, "csrf_cookie", False),
+        }
+    output_dir.mkdir(parents=True, exist_ok=True)
+    (output_dir / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2, sort_keys=True))
+    return manifest, skipped
+
+
+def load_manifest(output_dir):
+    try:
+        return json.loads((Path(output_dir) / MANIFEST_NAME).read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+class PrerenderedPageMiddleware:
+    """Serve prerendered marketing pages from disk when PRERENDER_SERVE is on.
+
+    Files go out as ``FileResponse`` so WSGI servers that provide
+    ``wsgi.file_wrapper`` hand them to ``sendfile()`` without copying the
+    body through Python.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.output_dir = get_output_dir()
+        self.manifest = load_manifest(self.output_dir) if settings.PRERENDER_SERVE else {}
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        entry = self.match(request)
+        if entry is None:
+            return self.get_response(request)
+        return self.serve(request, entry)
+
+    async def __acall__(self, request):
+        entry = self.match(request)
+        if entry is None:
+            return await self.get_response(request)
+        return self.serve(request, entry)
+
+    def match(self, request):
+        entry = self.manifest.get(request.path_info)
+        if entry is None or request.method not in ("GET", "HEAD"):
+            return None
+        if entry.get("csrf_cookie") and settings.CSRF_COOKIE_NAME not in request.COOKIES:
+            return None
+        if not (self.output_dir / entry["file"]).is_file():
+            return None
+        return entry
+
+    def serve(self, request, entry):
+        path, encoding = choose_encoding(request, self.output_dir / entry["file"])
+        # Each encoding is a different representation and needs its own ETag.
+        etag = entry["etag"] if encoding is None else '%s-%s"' % (entry["etag"][:-1], encoding)
+        if etag_matches(request, etag):
+            response = HttpResponseNotModified()
+        else:
+            response = file_response(path, "text/html; charset=utf-8", encoding)
+        response["ETag"] = etag
+        patch_vary_headers(response, ["Accept-Encoding"])
+        patch_cache_control(response, public=True, no_cache=True)
+        return response
@@ -0,0 +1,200 @@
+# Frontend/replicas.py
+"""Read-replica routing for staff and analytics reads.
+
+Reads only go to ``DATABASE_REPLICA_ALIAS`` inside ``replica_reads()``: the
+admin dashboard and its charts, GET changelists, and exports (through
+``on_replica``). Everything else reads from the primary, and so does any
+read that must see a recent write:
+
+* once anything in the current request or task has written (``db_for_write``
+  pins the rest of it to the primary), and inside a primary transaction;
+* for ``REPLICA_PIN_SECONDS`` after a client's last write, via the
+  ``REPLICA_PIN_COOKIE`` set by ``ReplicaPinMiddleware``;
+* while the replica lags more than ``REPLICA_MAX_LAG_SECONDS``, as measured
+  at most every ``REPLICA_LAG_CHECK_SECONDS``; an unreachable replica counts
+  as lagging.
+
+With no replica configured every read goes to ``default`` as before.
+"""
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+logger = logging.getLogger(__name__)
+
+_replica_reads = ContextVar("replica_reads", default=False)
+_wrote = ContextVar("wrote_to_primary", default=False)
+_pinned_by_client = ContextVar("pinned_by_client", default=False)
+
+_lag_lock = threading.Lock()
+_lag = (None, 0.0)  # (checked at, seconds behind)
+
+
+@contextmanager
+def replica_reads():
+    """Let the reads in this block (or decorated view) use the replica"""
+    token = _replica_reads.set(True)
+    try:
+        yield
+    finally:
+        _replica_reads.reset(token)
+
+
+def pin():
+    _wrote.set(True)
+
+
+def pinned():
+    return _wrote.get() or _pinned_by_client.get()
+
+
+def _file_mtime(path):
+    # WAL-mode writes land in the -wal file until a checkpoint.
+    times = [os.path.getmtime(p) for p in (path, f"{path}-wal") if os.path.exists(p)]
+    if not times:
+        raise OSError(f"{path} does not exist")
+    return max(times)
+
+
+def measure_lag(alias):
+    """Seconds the replica ``alias`` is behind the primary"""
+    connection = connections[alias]
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            # A standby that has replayed all it received is current, however
+            # long ago the last transaction was.
+            cursor.execute(
+                "SELECT CASE WHEN NOT pg_is_in_recovery() "
+                "OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+                "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+            )
+            return float(cursor.fetchone()[0])
+    if connection.vendor == "sqlite":
+        primary = connections[DEFAULT_DB_ALIAS].settings_dict["NAME"]
+        return max(0.0, _file_mtime(primary) - _file_mtime(connection.settings_dict["NAME"]))
+    return 0.0
+
+
+def replica_lag(alias):
+    """``measure_lag`` cached for REPLICA_LAG_CHECK_SECONDS; inf on error"""
+    global _lag
+    checked_at, lag = _lag
+    now = time.monotonic()
+    if checked_at is not None and now - checked_at < settings.REPLICA_LAG_CHECK_SECONDS:
+        return lag
+    with _lag_lock:
+        checked_at, lag = _lag
+        if checked_at is None or now - checked_at >= settings.REPLICA_LAG_CHECK_SECONDS:
+            try:
+                lag = measure_lag(alias)
+            except Exception as e:
+                logger.warning("Replica %s unavailable, reading from the primary: %s", alias, e)
+                lag = float("inf")
+            _lag = (now, lag)
+    return lag
+
+
+def replica_alias():
+    """The replica alias if reads may use it right now, else None"""
+    alias = settings.DATABASE_REPLICA_ALIAS
+    if not alias or pinned():
+        return None
+    # Reads inside a transaction on the primary must see its writes.
+    if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+        return None
+    max_lag = settings.REPLICA_MAX_LAG_SECONDS
+    if max_lag is not None and replica_lag(alias) > max_lag:
+        return None
+    return alias
+
+
+def on_replica(queryset):
+    """``queryset`` bound to the replica when it may be used.
+
+    For querysets evaluated after the view returns, e.g. streamed exports.
+    """
+    alias = replica_alias()
+    return queryset.using(alias) if alias else queryset
+
+
+class ReplicaRouter:
+    # Sessions and users always come from the primary, so a fresh login is
+    # never lost to replication lag.
+    route_app_labels = {"Frontend"}
+
+    def db_for_read(self, model, **hints):
+        if _replica_reads.get() and model._meta.app_label in self.route_app_labels:
+            return replica_alias()
+        return None
+
+    def db_for_write(self, model, **hints):
+        pin()
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Both aliases hold the same data.
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == DEFAULT_DB_ALIAS
+
+
+class ReplicaPinMiddleware:
+    """Keeps a client on the primary for REPLICA_PIN_SECONDS after it writes"""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        tokens = self.enter(request)
+        try:
+            return self.pin(self.get_response(request))
+        finally:
+            self.exit(tokens)
+
+    async def __acall__(self, request):
+        # sync_to_async copies changes to the context vars back from the
+        # worker thread, so a write in a sync view is seen here too.
+        tokens = self.enter(request)
+        try:
+            return self.pin(await self.get_response(request))
+        finally:
+            self.exit(tokens)
+
+    def enter(self, request):
+        return [
+            (_replica_reads, _replica_reads.set(False)),
+            (_wrote, _wrote.set(False)),
+            (_pinned_by_client, _pinned_by_client.set(settings.REPLICA_PIN_COOKIE in request.COOKIES)),
+        ]
+
+    def exit(self, tokens):
+        for var, token in reversed(tokens):
+            var.reset(token)
+
+    def pin(self, response):
+        # Only a write restarts the pin; merely being pinned does not.
+        if settings.DATABASE_REPLICA_ALIAS and _wrote.get():
+            response.set_cookie(
+                settings.REPLICA_PIN_COOKIE,
+                "1",
+                max_age=settings.REPLICA_PIN_SECONDS,
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
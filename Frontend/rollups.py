@@ -0,0 +1,213 @@
+# Frontend/rollups.py
+"""Incrementally maintained per-day counters behind the dashboard stats.
+
+Each ``DailyRollup`` row holds the number of rows (and their budget total)
+for one ``(day, source, bucket)`` where ``bucket`` is ``"<dimension>:<value>"``.
+Model saves and deletes are tracked by the receivers in ``Frontend/signals.py``;
+code that calls ``queryset.update()`` or ``bulk_create()`` must go through
+``update_queryset()`` / ``record_created()`` because those bypass signals.
+Rows moved into the archive (Frontend/archive.py) keep their counts.
+Every change also bumps the single ``RollupVersion`` row in the same
+transaction, which is what the dashboard charts cache on.
+"""
+import time
+
+from collections import defaultdict
+from decimal import Decimal
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from .models import ArchivedRecord, ContactMessage, DailyRollup, ProjectSubmission, RollupVersion
+
+# source -> (model, {dimension: field}, has budget)
+SOURCES = {
+    "project": (ProjectSubmission, {"status": "status", "type": "project_type"}, True),
+    "contact": (ContactMessage, {"read": "is_read", "archived": "is_archived"}, False),
+}
+
+
+def source_for(model):
+    for source, (source_model, _, _) in SOURCES.items():
+        if model is source_model:
+            return source
+    return None
+
+
+def bucket_value(value):
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    return str(value)
+
+
+def _day(submitted_at):
+    return timezone.localdate(submitted_at) if timezone.is_aware(submitted_at) else submitted_at.date()
+
+
+def _budget(value):
+    if value is None or value == "":
+        return Decimal(0)
+    return value if isinstance(value, Decimal) else Decimal(str(value))
+
+
+def snapshot(instance):
+    """The values of ``instance`` that its rollup buckets depend on"""
+    source = source_for(type(instance))
+    _, dimensions, has_budget = SOURCES[source]
+    state = {field: getattr(instance, field) for field in dimensions.values()}
+    state["submitted_at"] = instance.submitted_at
+    state["budget"] = instance.budget if has_budget else None
+    return state
+
+
+def _deltas_for(source, state, sign, deltas):
+    _, dimensions, has_budget = SOURCES[source]
+    day = _day(state["submitted_at"])
+    budget = _budget(state["budget"]) if has_budget else Decimal(0)
+    for dimension, field in dimensions.items():
+        delta = deltas[(day, source, f"{dimension}:{bucket_value(state[field])}")]
+        delta[0] += sign
+        delta[1] += sign * budget
+
+
+def _new_deltas():
+    return defaultdict(lambda: [0, Decimal(0)])
+
+
+VERSION_PK = 1
+
+
+def bump_version():
+    """Count a change to the rollups (see charts.version)"""
+    if RollupVersion.objects.filter(pk=VERSION_PK).update(value=F("value") + 1):
+        return
+    try:
+        with transaction.atomic():
+            # Start past any version a lost row may have handed out, so the
+            # charts never reuse a cache key.
+            RollupVersion.objects.create(pk=VERSION_PK, value=time.time_ns() // 1000)
+    except IntegrityError:
+        # Another writer created the row first.
+        RollupVersion.objects.filter(pk=VERSION_PK).update(value=F("value") + 1)
+
+
+def apply_deltas(deltas):
+    """Add ``{(day, source, bucket): [count, budget]}`` to the rollup table"""
+    changed = False
+    with transaction.atomic():
+        for (day, source, bucket), (count, budget) in deltas.items():
+            if not count and not budget:
+                continue
+            changed = True
+            rows = DailyRollup.objects.filter(day=day, source=source, bucket=bucket)
+            if rows.update(count=F("count") + count, budget_total=F("budget_total") + budget):
+                continue
+            try:
+                with transaction.atomic():
+                    DailyRollup.objects.create(
+                        day=day, source=source, bucket=bucket, count=count, budget_total=budget
+                    )
+            except IntegrityError:
+                # Another writer created the row first.
+                rows.update(count=F("count") + count, budget_total=F("budget_total") + budget)
+        if changed:
+            bump_version()
+
+
+def record_created(instances):
+    deltas = _new_deltas()
+    for instance in instances:
+        _deltas_for(source_for(type(instance)), snapshot(instance), 1, deltas)
+    apply_deltas(deltas)
+
+
+def record_deleted(instances):
+    deltas = _new_deltas()
+    for instance in instances:
+        state = getattr(instance, "_rollup_state", None) or snapshot(instance)
+        _deltas_for(source_for(type(instance)), state, -1, deltas)
+    apply_deltas(deltas)
+
+
+def record_changed(instance, old_state):
+    new_state = snapshot(instance)
+    if new_state == old_state:
+        return
+    source = source_for(type(instance))
+    deltas = _new_deltas()
+    _deltas_for(source, old_state, -1, deltas)
+    _deltas_for(source, new_state, 1, deltas)
+    apply_deltas(deltas)
+
+
+def update_queryset(queryset, **changes):
+    """``queryset.update(**changes)`` that also moves the affected rollup counts"""
+    source = source_for(queryset.model)
+    _, dimensions, has_budget = SOURCES[source]
+    deltas = _new_deltas()
+    with transaction.atomic():
+        for dimension, field in dimensions.items():
+            if field not in changes:
+                continue
+            new_bucket = f"{dimension}:{bucket_value(changes[field])}"
+            aggregates = {"n": Count("id")}
+            if has_budget:
+                aggregates["budget"] = Sum("budget")
+            groups = (
+                queryset.exclude(**{field: changes[field]})
+                .order_by()
+                .values(day=TruncDate("submitted_at"), old=F(field))
+                .annotate(**aggregates)
+            )
+            for group in groups:
+                budget = _budget(group.get("budget"))
+                old = deltas[(group["day"], source, f"{dimension}:{bucket_value(group['old'])}")]
+                old[0] -= group["n"]
+                old[1] -= budget
+                new = deltas[(group["day"], source, new_bucket)]
+                new[0] += group["n"]
+                new[1] += budget
+        apply_deltas(deltas)
+        return queryset.update(**changes)
+
+
+def _archived_state(source, submitted_at, payload):
+    _, dimensions, has_budget = SOURCES[source]
+    state = {field: payload[field] for field in dimensions.values()}
+    state["submitted_at"] = submitted_at
+    state["budget"] = payload["budget"] if has_budget else None
+    return state
+
+
+def rebuild():
+    """Recompute every rollup row from the source tables and the archive"""
+    deltas = _new_deltas()
+    for source, (model, dimensions, has_budget) in SOURCES.items():
+        for dimension, field in dimensions.items():
+            aggregates = {"n": Count("id")}
+            if has_budget:
+                aggregates["budget"] = Sum("budget")
+            groups = (
+                model.objects.order_by()
+                .values(day=TruncDate("submitted_at"), value=F(field))
+                .annotate(**aggregates)
+            )
+            for group in groups:
+                delta = deltas[(group["day"], source, f"{dimension}:{bucket_value(group['value'])}")]
+                delta[0] += group["n"]
+                delta[1] += _budget(group.get("budget"))
+    archived = ArchivedRecord.objects.values_list("source", "submitted_at", "payload")
+    for source, submitted_at, payload in archived.iterator():
+        _deltas_for(source, _archived_state(source, submitted_at, payload), 1, deltas)
+    rows = [
+        DailyRollup(day=day, source=source, bucket=bucket, count=count, budget_total=budget)
+        for (day, source, bucket), (count, budget) in deltas.items()
+        if count
+    ]
+    with transaction.atomic():
+        DailyRollup.objects.all().delete()
+        DailyRollup.objects.bulk_create(rows, batch_size=500)
+        bump_version()
+    return len(rows)
@@ -0,0 +1,131 @@
+# Frontend/search.py
+"""Full-text search for the admin changelists.
+
+SQLite gets an external-content FTS5 table per model, kept in sync by
+triggers; PostgreSQL gets a GIN index over ``to_tsvector('simple', ...)``
+of the same columns, which the database maintains itself. Both are created
+by migration 0004, which carries the SQL as literals.
+
+SQLite drops a table's triggers whenever the schema editor remakes it
+(adding a column with a default, altering a field, ...), so migrations that
+do that to an indexed table must drop the index before and recreate it
+after, carrying their own copy of the SQL (see 0005).
+
+``search_queryset`` filters a queryset through whichever index exists and
+annotates ``search_rank`` (higher is better); it returns None when no index
+is available so callers can fall back to ``icontains``. ``filter_queryset``
+does that fallback itself, for code outside the admin.
+"""
+import re
+from functools import reduce
+from operator import or_
+
+from django.db import connections
+from django.db.models import FloatField, Q
+from django.db.models.expressions import RawSQL
+from django.utils.text import smart_split, unescape_string_literal
+
+# table -> indexed columns; mirrors search_fields on the admin classes
+SEARCH_INDEXES = {
+    "Frontend_contactmessage": ["name", "email", "subject", "message"],
+    "Frontend_projectsubmission": ["project_title", "client_name", "email", "company", "phone"],
+}
+
+_WORD = re.compile(r"\w+", re.UNICODE)
+_available = {}
+
+
+def fts_table(table):
+    return f"{table}_fts"
+
+
+def _quote(name):
+    return '"%s"' % name
+
+
+def tsvector_sql(columns):
+    document = " || ' ' || ".join(f"coalesce({_quote(column)}, '')" for column in columns)
+    return f"to_tsvector('simple', {document})"
+
+
+def connect_sqlite_indexes(connection):
+    """Open the FTS5 tables on a new SQLite connection.
+
+    The first statement to touch an FTS5 table on a connection reads its
+    config while being prepared. Inside a transaction that read must later
+    be upgraded to the write lock, which SQLite refuses at once ("database
+    is locked") when another writer got in first, instead of waiting out
+    busy_timeout. Connecting here, outside any transaction, avoids that.
+    """
+    for table in SEARCH_INDEXES:
+        try:
+            connection.connection.execute(f"SELECT 1 FROM {_quote(fts_table(table))} LIMIT 1").fetchall()
+        except connection.Database.OperationalError:
+            pass  # not migrated yet
+
+
+def is_available(connection, table):
+    key = (connection.alias, table)
+    if key not in _available:
+        if connection.vendor == "sqlite":
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s",
+                    [fts_table(table)],
+                )
+                _available[key] = cursor.fetchone() is not None
+        else:
+            _available[key] = connection.vendor == "postgresql"
+    return _available[key]
+
+
+def _terms(search_term):
+    return _WORD.findall(search_term.lower())
+
+
+def search_queryset(queryset, search_term):
+    """Filter ``queryset`` to full-text matches and annotate ``search_rank``"""
+    table = queryset.model._meta.db_table
+    connection = connections[queryset.db]
+    terms = _terms(search_term)
+    if table not in SEARCH_INDEXES or not terms or not is_available(connection, table):
+        return None
+
+    pk = f"{_quote(table)}.{_quote('id')}"
+    if connection.vendor == "sqlite":
+        fts = _quote(fts_table(table))
+        # Every word must match, each as a prefix: "jan exam" finds jane@example.com
+        query = " ".join('"%s"*' % term for term in terms)
+        matches = RawSQL(f"SELECT rowid FROM {fts} WHERE {fts} MATCH %s", [query])
+        # bm25() is lower-is-better; negate it so both backends sort descending.
+        rank = RawSQL(
+            f"SELECT -bm25({fts}) FROM {fts} WHERE {fts} MATCH %s AND rowid = {pk}",
+            [query],
+            output_field=FloatField(),
+        )
+    else:
+        vector = tsvector_sql(SEARCH_INDEXES[table])
+        query = " & ".join(f"{term}:*" for term in terms)
+        matches = RawSQL(
+            f"SELECT {_quote('id')} FROM {_quote(table)} "
+            f"WHERE {vector} @@ to_tsquery('simple', %s)",
+            [query],
+        )
+        rank = RawSQL(
+            f"ts_rank({vector}, to_tsquery('simple', %s))", [query], output_field=FloatField()
+        )
+    return queryset.filter(pk__in=matches).annotate(search_rank=rank)
+
+
+def filter_queryset(queryset, search_term):
+    """The rows of ``queryset`` the admin's search for ``search_term`` finds"""
+    results = search_queryset(queryset, search_term)
+    if results is not None:
+        return results
+    # ModelAdmin.get_search_results over the same columns.
+    columns = SEARCH_INDEXES[queryset.model._meta.db_table]
+    for bit in smart_split(search_term):
+        if bit.startswith(('"', "'")) and bit[0] == bit[-1]:
+            bit = unescape_string_literal(bit)
+        queryset = queryset.filter(reduce(or_, (Q(**{f"{column}__icontains": bit}) for column in columns)))
+    return queryset
@@ -0,0 +1,69 @@
+# Frontend/signals.py
+from django.conf import settings
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_delete, post_init, post_save, pre_save
+from django.dispatch import receiver
+
+from . import database, metrics, notifications, rollups, search
+from .models import ContactMessage, ProjectSubmission
+
+TRACKED_MODELS = (ProjectSubmission, ContactMessage)
+TRACKED_FIELDS = {"status", "project_type", "budget", "is_read", "is_archived", "submitted_at"}
+
+
+@receiver(post_init)
+def remember_rollup_state(sender, instance, **kwargs):
+    if sender not in TRACKED_MODELS:
+        return
+    # Reading a deferred field here would cost a query per instance.
+    if not TRACKED_FIELDS & instance.get_deferred_fields():
+        instance._rollup_state = rollups.snapshot(instance)
+
+
+@receiver(pre_save)
+def load_rollup_state(sender, instance, raw=False, **kwargs):
+    if sender not in TRACKED_MODELS or raw or instance._state.adding:
+        return
+    if getattr(instance, "_rollup_state", None) is None:
+        stored = sender.objects.filter(pk=instance.pk).first()
+        instance._rollup_state = rollups.snapshot(stored) if stored else None
+
+
+@receiver(post_save)
+def update_rollups_on_save(sender, instance, created, raw=False, **kwargs):
+    if sender not in TRACKED_MODELS or raw:
+        return
+    old_state = getattr(instance, "_rollup_state", None)
+    if created or old_state is None:
+        rollups.record_created([instance])
+    else:
+        rollups.record_changed(instance, old_state)
+    instance._rollup_state = rollups.snapshot(instance)
+
+
+@receiver(post_save)
+def queue_notification(sender, instance, created, raw=False, **kwargs):
+    # Runs inside the caller's transaction, so the outbox row commits with
+    # the submission (see Frontend/notifications.py).
+    if sender in TRACKED_MODELS and created and not raw:
+        notifications.record([instance])
+
+
+@receiver(post_delete)
+def update_rollups_on_delete(sender, instance, **kwargs):
+    if sender in TRACKED_MODELS:
+        rollups.record_deleted([instance])
+
+
+@receiver(connection_created)
+def time_queries(sender, connection, **kwargs):
+    # Installed once per connection so requests pay nothing to set it up.
+    if settings.METRICS_ENABLED:
+        metrics.install_query_timer(connection)
+
+
+@receiver(connection_created)
+def tune_connection(sender, connection, **kwargs):
+    database.apply_sqlite_pragmas(connection)
+    if connection.vendor == "sqlite":
+        search.connect_sqlite_indexes(connection)
@@ -0,0 +1,56 @@
+# Frontend/stats.py
+"""Dashboard and admin statistics.
+
+Every figure for a model comes from a single conditional-aggregation query
+over the ``DailyRollup`` counters (see Frontend/rollups.py), so the dashboard
+and the admin changelists cost one round trip per model and scale with the
+number of days recorded, not the number of rows ever submitted.
+"""
+from django.db.models import Q, Sum
+from django.utils import timezone
+
+from .models import DailyRollup
+
+EMPTY_PROJECT_STATS = {
+    "total": 0,
+    "total_budget": 0,
+    "avg_budget": 0,
+    "pending": 0,
+    "today": 0,
+}
+
+EMPTY_CONTACT_STATS = {
+    "total": 0,
+    "unread": 0,
+    "today": 0,
+    "archived": 0,
+}
+
+
+def _with_defaults(values, defaults):
+    return {key: values.get(key) or default for key, default in defaults.items()}
+
+
+def project_stats():
+    """Totals, budget figures and pending/today counts for ProjectSubmission"""
+    values = DailyRollup.objects.filter(source="project", bucket__startswith="status:").aggregate(
+        total=Sum("count"),
+        total_budget=Sum("budget_total"),
+        pending=Sum("count", filter=Q(bucket="status:pending")),
+        today=Sum("count", filter=Q(day=timezone.localdate())),
+    )
+    if values["total"]:
+        values["avg_budget"] = values["total_budget"] / values["total"]
+    return _with_defaults(values, EMPTY_PROJECT_STATS)
+
+
+def contact_stats():
+    """Total, unread, today and archived counts for ContactMessage"""
+    read_buckets = Q(bucket__startswith="read:")
+    values = DailyRollup.objects.filter(source="contact").aggregate(
+        total=Sum("count", filter=read_buckets),
+        unread=Sum("count", filter=Q(bucket="read:0")),
+        today=Sum("count", filter=read_buckets & Q(day=timezone.localdate())),
+        archived=Sum("count", filter=Q(bucket="archived:1")),
+    )
+    return _with_defaults(values, EMPTY_CONTACT_STATS)
@@ -0,0 +1,81 @@
+from django import template
+from django.templatetags.static import static
+from django.conf import settings
+from django.utils.html import format_html, format_html_join
+from django.utils.safestring import mark_safe
+
+from .. import critical
+from ..assets import module_imports
+from ..images import load_manifest
+
+register = template.Library()
+
+
+def _srcset(variants):
+    return ", ".join(f"{static('derivatives/' + path)} {width}w" for width, path in variants)
+
+
+@register.simple_tag
+def responsive_image(name, alt="", sizes="100vw", **attrs):
+    """<img srcset sizes> (or <picture> when AVIF exists) for a static image.
+
+    Falls back to a plain <img> until build_image_derivatives has run.
+    """
+    attrs.setdefault("loading", "lazy")
+    attrs.setdefault("decoding", "async")
+    extra = format_html_join("", ' {}="{}"', ((k.replace("_", "-"), v) for k, v in attrs.items()))
+    entry = load_manifest().get(name)
+    if not entry:
+        return format_html('<img src="{}" alt="{}"{}>', static(name), alt, extra)
+
+    variants = entry["variants"]
+    img = format_html(
+        '<img src="{}" srcset="{}" sizes="{}" alt="{}"{}>',
+        static(name),
+        _srcset(variants["webp"]),
+        sizes,
+        alt,
+        extra,
+    )
+    if "avif" not in variants:
+        return img
+    return format_html(
+        '<picture><source type="image/avif" srcset="{}" sizes="{}">{}</picture>',
+        _srcset(variants["avif"]),
+        sizes,
+        img,
+    )
+
+
+@register.simple_tag(takes_context=True)
+def critical_css(context):
+    """Inline this page's critical CSS and load the full stylesheet async.
+
+    Falls back to a plain stylesheet link until build_critical_css has run,
+    or once main.css has changed since it ran.
+    """
+    manifest = critical.load_manifest()
+    request = context.get("request")
+    inline = manifest.get("pages", {}).get(request.path) if request else None
+    href = static("critical/" + manifest["bundle"]) if manifest else static(settings.CRITICAL_CSS_SOURCE)
+    if inline is None:
+        return format_html('<link rel="stylesheet" href="{}">', href)
+    return format_html(
+        '<style>{}</style>'
+        '<link rel="preload" as="style" href="{}" onload="this.onload=null;this.rel=\'stylesheet\'">'
+        '<noscript><link rel="stylesheet" href="{}"></noscript>',
+        # Our own build output; only a "</style>" in a string needs escaping.
+        mark_safe(inline.replace("</", "<\\/")),
+        href,
+        href,
+    )
+
+
+@register.simple_tag
+def module_script(name):
+    """<script type="module"> for ``name`` with modulepreload hints for the
+    modules it imports, so they are fetched in parallel rather than in turn"""
+    preloads = format_html_join(
+        "", '<link rel="modulepreload" href="{}">', ((static(dep),) for dep in module_imports(name))
+    )
+    return format_html('{}<script type="module" src="{}"></script>', preloads, static(name))
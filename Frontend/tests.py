@@ -1,3 +1,1812 @@
-from django.test import TestCase
+import asyncio
+import contextvars
+import gc
+import gzip
+import hashlib
+import json
+import shutil
+import sqlite3
+import tempfile
+import threading
+from concurrent.futures import Future
+from datetime import timedelta
+from decimal import Decimal
+from io import StringIO
+from pathlib import Path
+from unittest import mock, skipUnless
 
-# Create your tests here.
+from asgiref.sync import async_to_sync, iscoroutinefunction, sync_to_async
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core import mail
+from django.core.cache import caches
+from django.core.mail.backends.locmem import EmailBackend as LocmemEmailBackend
+from django.core.management import CommandError, call_command
+from django.db import DatabaseError, connection, transaction
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.template import engines
+from django.urls import get_resolver, reverse
+from django.utils import timezone
+from django.utils.http import urlencode
+
+from . import archive, assets, benchmark, charts, compression, critical, database, dedupe, images, ingest, jobs, metrics, notifications, pagination, prerender, replicas, rollups, search, stats, throttle, uploads, views, warmup
+from .management.commands import profile_startup
+from .models import ArchivedRecord, BulkJob, ContactMessage, DailyRollup, Notification, ProjectSubmission
+from .pagecache import cached_page, get_page_cache, make_etag, page_cache_key
+
+
+def make_project(**kwargs):
+    fields = {
+        "project_type": "web",
+        "client_name": "Jane Client",
+        "email": "jane@example.com",
+        "project_title": "New website",
+        "project_description": "A new marketing site",
+        "budget": Decimal("1500.00"),
+        "timeline": "standard",
+    }
+    fields.update(kwargs)
+    return ProjectSubmission.objects.create(**fields)
+
+
+def make_message(**kwargs):
+    fields = {
+        "name": "John Sender",
+        "email": "john@example.com",
+        "subject": "Hello",
+        "message": "I would like a quote.",
+    }
+    fields.update(kwargs)
+    return ContactMessage.objects.create(**fields)
+
+
+class PageCacheTests(TestCase):
+    def setUp(self):
+        get_page_cache().clear()
+        self.addCleanup(get_page_cache().clear)
+        self.factory = RequestFactory()
+
+    def test_miss_then_hit(self):
+        with mock.patch("Frontend.views.render", wraps=views.render) as render:
+            first = self.client.get(reverse("about"))
+            second = self.client.get(reverse("about"))
+        self.assertEqual(render.call_count, 1)
+        self.assertEqual(first.content, second.content)
+        self.assertEqual(first["ETag"], second["ETag"])
+        self.assertIn("no-cache", second["Cache-Control"])
+
+        response = self.client.get(reverse("about"), HTTP_IF_NONE_MATCH=f'W/{first["ETag"]}')
+        self.assertEqual(response.status_code, 304)
+
+    def test_vary_and_cookie_responses_are_not_stored(self):
+        def varying(request):
+            response = HttpResponse("mine")
+            response["Vary"] = "Cookie"
+            return response
+
+        def setting_cookie(request):
+            response = HttpResponse("mine")
+            response.set_cookie("seen", "1")
+            return response
+
+        for view in (varying, setting_cookie):
+            cached = cached_page(mock.Mock(wraps=view))
+            cached(self.factory.get("/private/"))
+            cached(self.factory.get("/private/"))
+            self.assertEqual(cached.__wrapped__.call_count, 2)
+            self.assertIsNone(get_page_cache().get(page_cache_key("/private/")))
+
+    def test_post_bypasses_the_cache(self):
+        cached = cached_page(mock.Mock(return_value=HttpResponse("ok")))
+        cached(self.factory.get("/page/"))
+        cached(self.factory.post("/page/"))
+        self.assertEqual(cached.__wrapped__.call_count, 2)
+
+    def test_deploy_version_invalidates(self):
+        # Pages render no model data; a deploy is the only thing that changes them.
+        with mock.patch("Frontend.views.render", wraps=views.render) as render:
+            self.client.get(reverse("about"))
+            make_message()
+            self.client.get(reverse("about"))
+            self.assertEqual(render.call_count, 1)
+            with override_settings(PAGE_CACHE_VERSION="2"):
+                self.client.get(reverse("about"))
+            self.assertEqual(render.call_count, 2)
+
+    def test_clear_page_cache_command(self):
+        # A per-process cache cannot be cleared for the workers.
+        with self.assertRaisesMessage(CommandError, "PAGE_CACHE_VERSION"):
+            call_command("clear_page_cache", stdout=StringIO())
+
+        location = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, location)
+        shared = {
+            **settings.CACHES,
+            "pages": {"BACKEND": "django.core.cache.backends.filebased.FileBasedCache", "LOCATION": location},
+        }
+        with override_settings(CACHES=shared):
+            self.client.get(reverse("about"))
+            self.assertIsNotNone(get_page_cache().get(page_cache_key(reverse("about"))))
+            call_command("clear_page_cache", stdout=StringIO())
+            self.assertIsNone(get_page_cache().get(page_cache_key(reverse("about"))))
+
+    def test_csrf_cookie_is_set_without_being_cached(self):
+        client = self.client_class(enforce_csrf_checks=True)
+        response = client.get(reverse("startproject"))
+        token = response.cookies[settings.CSRF_COOKIE_NAME].value
+        self.assertIn("private", response["Cache-Control"])
+        self.assertNotIn(token, response.content.decode())
+
+        # A second visitor gets the stored page and a cookie of their own.
+        other = self.client_class().get(reverse("startproject"))
+        self.assertNotEqual(other.cookies[settings.CSRF_COOKIE_NAME].value, token)
+        self.assertEqual(other.content, response.content)
+
+        # Once the cookie is set the page is shared again.
+        again = client.get(reverse("startproject"))
+        self.assertNotIn(settings.CSRF_COOKIE_NAME, again.cookies)
+        self.assertIn("public", again["Cache-Control"])
+
+        response = client.post(
+            reverse("submit_project"), {}, content_type="application/json", HTTP_X_CSRFTOKEN=token
+        )
+        self.assertNotEqual(response.status_code, 403)
+
+
+class PrerenderTests(TestCase):
+    def setUp(self):
+        get_page_cache().clear()
+        self.addCleanup(get_page_cache().clear)
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root)
+        override = override_settings(PRERENDER_ROOT=Path(root), PRERENDER_SERVE=True)
+        override.enable()
+        self.addCleanup(override.disable)
+        self.out = StringIO()
+        call_command("prerender_pages", stdout=self.out, stderr=StringIO())
+        self.fallback = mock.Mock(return_value=HttpResponse("from the view"))
+        self.factory = RequestFactory()
+
+    def middleware(self):
+        return prerender.PrerenderedPageMiddleware(self.fallback)
+
+    def test_build_command_output(self):
+        output_dir = prerender.get_output_dir()
+        manifest = prerender.load_manifest(output_dir)
+        self.assertIn(f"Prerendered {len(manifest)} page(s)", self.out.getvalue())
+        self.assertEqual(manifest["/about/"]["file"], "about/index.html")
+        self.assertTrue((output_dir / "about" / "index.html.gz").is_file())
+        content = (output_dir / "about" / "index.html").read_bytes()
+        self.assertEqual(manifest["/about/"]["etag"], make_etag(content))
+        self.assertTrue(manifest["/startproject/"]["csrf_cookie"])
+        self.assertFalse(manifest["/about/"]["csrf_cookie"])
+
+    def test_serves_the_snapshot(self):
+        request = self.factory.get("/about/", HTTP_ACCEPT_ENCODING="gzip")
+        response = self.middleware()(request)
+        self.fallback.assert_not_called()
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(response["Content-Type"], "text/html; charset=utf-8")
+        self.assertFalse(response.has_header("Content-Disposition"))
+        self.assertIn("Accept-Encoding", response["Vary"])
+        body = gzip.decompress(b"".join(response.streaming_content))
+        self.assertEqual(body, (prerender.get_output_dir() / "about" / "index.html").read_bytes())
+
+        request = self.factory.get("/about/", HTTP_IF_NONE_MATCH=response["ETag"], HTTP_ACCEPT_ENCODING="gzip")
+        self.assertEqual(self.middleware()(request).status_code, 304)
+
+    def test_served_before_sessions_and_auth(self):
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse("about"), HTTP_ACCEPT_ENCODING="identity")
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["X-Frame-Options"], "DENY")
+
+    def test_falls_back_to_the_view(self):
+        with override_settings(PAGE_CACHE_VERSION="stale"):
+            self.middleware()(self.factory.get("/about/"))
+        (prerender.get_output_dir() / "services" / "index.html").unlink()
+        self.middleware()(self.factory.get("/services/"))
+        self.middleware()(self.factory.post("/about/"))
+        self.assertEqual(self.fallback.call_count, 3)
+
+    def test_csrf_cookie_pages_fall_back_until_the_cookie_is_set(self):
+        self.middleware()(self.factory.get("/startproject/"))
+        self.assertEqual(self.fallback.call_count, 1)
+        request = self.factory.get("/startproject/")
+        request.COOKIES[settings.CSRF_COOKIE_NAME] = "x" * 32
+        response = self.middleware()(request)
+        self.assertEqual(self.fallback.call_count, 1)
+        self.assertTrue(response.streaming)
+
+    def test_async_stack_is_not_adapted(self):
+        async def view(request):
+            return HttpResponse("from the view")
+
+        middleware = prerender.PrerenderedPageMiddleware(view)
+        self.assertTrue(iscoroutinefunction(middleware))
+        response = async_to_sync(middleware)(self.factory.get("/about/"))
+        self.assertTrue(response.streaming)
+        response = async_to_sync(middleware)(self.factory.post("/about/"))
+        self.assertEqual(response.content, b"from the view")
+
+
+class StaticAssetTests(SimpleTestCase):
+    def test_minify_css_leaves_strings_alone(self):
+        css = 'a :hover , b { content: "a : b /* not a comment */" ; } /* gone */ .c{ font-family:\'x  y\' }'
+        self.assertEqual(
+            assets.minify_css(css),
+            'a :hover,b{content:"a : b /* not a comment */"}.c{font-family:\'x  y\'}',
+        )
+
+    def test_minify_js_is_string_aware(self):
+        js = (
+            '  const tick = "`";   // a backtick in a plain string\n'
+            "\n"
+            "    /* inline */ call(tick);\n"
+            "    const text = `first\n"
+            "        kept as is ${'`'} `;\n"
+            "    const re = /'\"`[/]\\//g, half = total / 2 / n;\n"
+            "    return /x/.test(s); /* multi\n"
+            "    line */ done();\n"
+        )
+        self.assertEqual(
+            assets.minify_js(js),
+            'const tick = "`";\n'
+            "call(tick);\n"
+            "const text = `first\n"
+            "        kept as is ${'`'} `;\n"
+            "const re = /'\"`[/]\\//g, half = total / 2 / n;\n"
+            "return /x/.test(s);\n"
+            "done();\n",
+        )
+
+    def test_serve_static_prefers_brotli(self):
+        root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, root)
+        (root / "app.abc123.js").write_text("console.log(1);\n")
+        self.assertEqual(len(compression.write_compressed_variants(root / "app.abc123.js")), 2)
+        request = RequestFactory().get("/static/app.abc123.js", HTTP_ACCEPT_ENCODING="gzip, br")
+        with override_settings(STATIC_ROOT=root), mock.patch.object(
+            assets, "hashed_names", return_value=frozenset({"app.abc123.js"})
+        ):
+            response = assets.serve_static(request, "app.abc123.js")
+        response.close()
+        self.assertEqual(response["Content-Encoding"], "br")
+        self.assertEqual(response["Content-Type"], "text/javascript")
+        self.assertFalse(response.has_header("Content-Disposition"))
+        self.assertIn("immutable", response["Cache-Control"])
+
+    def test_collectstatic_compresses_only_final_names(self):
+        source, root = Path(tempfile.mkdtemp()), Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, source)
+        self.addCleanup(shutil.rmtree, root)
+        # b.css is rewritten, so a.css is hashed over more than one pass.
+        (source / "a.css").write_text('@import "b.css";\n.a { color: red; }\n')
+        (source / "b.css").write_text('.b { background: url("dot.svg"); }\n')
+        (source / "dot.svg").write_text("<svg></svg>\n")
+        with override_settings(
+            STATIC_ROOT=root,
+            STATICFILES_DIRS=[source],
+            STATICFILES_FINDERS=["django.contrib.staticfiles.finders.FileSystemFinder"],
+        ):
+            call_command("collectstatic", interactive=False, verbosity=0)
+            hashed = dict(staticfiles_storage.hashed_files)
+        self.addCleanup(assets.hashed_names.cache_clear)
+        served = {*hashed, *hashed.values()}
+        for variant in [*root.rglob("*.gz"), *root.rglob("*.br")]:
+            self.assertIn(variant.relative_to(root).as_posix()[:-3], served)
+        self.assertTrue((root / f"{hashed['a.css']}.br").is_file())
+
+
+class ResponsiveImageTests(SimpleTestCase):
+    def setUp(self):
+        self.static_dir = Path(tempfile.mkdtemp())
+        self.build_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.static_dir)
+        self.addCleanup(shutil.rmtree, self.build_dir)
+        override = override_settings(
+            STATICFILES_DIRS=[self.static_dir],
+            IMAGE_DERIVATIVES_DIR=self.build_dir / "derivatives",
+            IMAGE_MANIFEST_PATH=self.build_dir / "images.json",
+        )
+        override.enable()
+        self.addCleanup(override.disable)
+        self.addCleanup(images.load_manifest.cache_clear)
+        (self.static_dir / "images").mkdir()
+        self.save_image("hero.png", 800, 400)
+
+    def save_image(self, name, width, height):
+        from PIL import Image
+
+        Image.new("RGB", (width, height), (200, 40, 90)).save(self.static_dir / "images" / name)
+
+    def build(self, *widths):
+        out = StringIO()
+        call_command("build_image_derivatives", "--widths", *map(str, widths), stdout=out)
+        return out.getvalue()
+
+    def test_derivative_sizes(self):
+        from PIL import Image
+
+        self.build(320, 480, 1280)
+        entry = images.load_manifest()["images/hero.png"]
+        self.assertEqual([width for width, _ in entry["variants"]["webp"]], [320, 480, 800])
+        for width, relative in entry["variants"]["webp"]:
+            with Image.open(self.build_dir / "derivatives" / relative) as image:
+                self.assertEqual(image.size, (width, width // 2))
+                self.assertEqual(image.format, "WEBP")
+        # Unchanged sources are not encoded again.
+        self.assertIn("0 new variant(s)", self.build(320, 480, 1280))
+
+    def test_stale_derivatives_are_pruned(self):
+        self.build(320, 480)
+        old = images.load_manifest()["images/hero.png"]["sha256"][:16]
+        self.save_image("hero.png", 640, 320)
+        output = self.build(320)
+        self.assertIn("3 stale file(s) pruned", output)
+        derivatives = self.build_dir / "derivatives"
+        self.assertFalse((derivatives / old).exists())
+        self.assertEqual(
+            sorted(p.relative_to(derivatives).as_posix() for p in derivatives.rglob("*") if p.is_file()),
+            sorted(relative for _, relative in images.load_manifest()["images/hero.png"]["variants"]["webp"]),
+        )
+        # The manifest is not under the collected derivatives directory.
+        self.assertTrue((self.build_dir / "images.json").is_file())
+
+    def test_tag_srcset(self):
+        self.build(320, 480)
+        template = engines.all()[0].from_string(
+            "{% load site_assets %}{% responsive_image 'images/hero.png' alt='Hero' sizes='50vw' %}"
+        )
+        digest = images.load_manifest()["images/hero.png"]["sha256"][:16]
+        self.assertHTMLEqual(
+            template.render({}),
+            f'<img src="/static/images/hero.png" alt="Hero" sizes="50vw" loading="lazy" decoding="async" '
+            f'srcset="/static/derivatives/{digest}/320w.webp 320w, /static/derivatives/{digest}/480w.webp 480w, '
+            f'/static/derivatives/{digest}/800w.webp 800w">',
+        )
+
+        entry = images.load_manifest()["images/hero.png"]
+        entry["variants"]["avif"] = [[320, f"{digest}/320w.avif"]]
+        with mock.patch.object(images, "load_manifest", return_value={"images/hero.png": entry}):
+            html = template.render({})
+        self.assertTrue(html.startswith(f'<picture><source type="image/avif" srcset="/static/derivatives/{digest}/320w.avif 320w"'))
+
+    def test_templates_use_the_tag_for_content_images(self):
+        for name in warmup.template_names():
+            source = (warmup.TEMPLATE_DIR / name).read_text(encoding="utf-8")
+            self.assertNotRegex(source, r"<img[^>]*static 'images/", name)
+
+
+class StatsTests(TestCase):
+    def test_project_stats_single_query(self):
+        make_project(budget=Decimal("1000"))
+        make_project(budget=Decimal("3000"), status="accepted")
+
+        with self.assertNumQueries(1):
+            result = stats.project_stats()
+
+        self.assertEqual(result["total"], 2)
+        self.assertEqual(result["total_budget"], Decimal("4000"))
+        self.assertEqual(result["avg_budget"], Decimal("2000"))
+        self.assertEqual(result["pending"], 1)
+        self.assertEqual(result["today"], 2)
+
+    def test_contact_stats_single_query(self):
+        make_message()
+        make_message(is_read=True, is_archived=True)
+
+        with self.assertNumQueries(1):
+            result = stats.contact_stats()
+
+        self.assertEqual(
+            result, {"total": 2, "unread": 1, "today": 2, "archived": 1}
+        )
+
+    def test_empty_tables(self):
+        self.assertEqual(stats.project_stats(), stats.EMPTY_PROJECT_STATS)
+        self.assertEqual(stats.contact_stats(), stats.EMPTY_CONTACT_STATS)
+
+
+class AdminDashboardQueryCountTests(TestCase):
+    # session + user, one aggregate per model, two "recent" slices
+    DASHBOARD_QUERIES = 6
+
+    def setUp(self):
+        self.staff = get_user_model().objects.create_user(
+            "staff", password="pw", is_staff=True, is_superuser=True
+        )
+        self.client.force_login(self.staff)
+
+    def test_query_count_is_constant(self):
+        for rows in (1, 20):
+            for _ in range(rows):
+                make_project()
+                make_message()
+            with self.assertNumQueries(self.DASHBOARD_QUERIES):
+                response = self.client.get(reverse("admin_dashboard"))
+            self.assertEqual(response.status_code, 200)
+
+    def test_admin_changelists_expose_stats(self):
+        make_project()
+        make_message()
+        response = self.client.get(reverse("admin:Frontend_projectsubmission_changelist"))
+        self.assertEqual(response.context["stats"]["total"], 1)
+        self.assertContains(response, "<li><strong>1</strong> projects</li>", html=True)
+        response = self.client.get(reverse("admin:Frontend_contactmessage_changelist"))
+        self.assertEqual(response.context["stats"]["unread"], 1)
+        self.assertContains(response, "<li><strong>1</strong> unread</li>", html=True)
+
+
+class RollupTests(TestCase):
+    def setUp(self):
+        dedupe.recent.clear()
+
+    def assertRollupsMatchRebuild(self):
+        live = (stats.project_stats(), stats.contact_stats())
+        rollups.rebuild()
+        self.assertEqual(live, (stats.project_stats(), stats.contact_stats()))
+
+    def test_saves_and_deletes_keep_rollups_in_sync(self):
+        project = make_project(budget=Decimal("500"))
+        make_project(project_type="uiux", budget=Decimal("700"))
+        message = make_message()
+
+        project.status = "reviewed"
+        project.budget = Decimal("900")
+        project.save()
+        message.is_read = True
+        message.save()
+        ProjectSubmission.objects.get(pk=project.pk).delete()
+
+        self.assertEqual(stats.project_stats()["total"], 1)
+        self.assertEqual(stats.project_stats()["total_budget"], Decimal("700"))
+        self.assertEqual(stats.contact_stats()["unread"], 0)
+        self.assertRollupsMatchRebuild()
+
+    def test_update_queryset_moves_counts(self):
+        for _ in range(3):
+            make_project()
+            make_message()
+        make_project(status="accepted")
+
+        updated = rollups.update_queryset(ProjectSubmission.objects.all(), status="reviewed")
+        rollups.update_queryset(ContactMessage.objects.all(), is_archived=True)
+
+        self.assertEqual(updated, 4)
+        self.assertEqual(stats.project_stats()["pending"], 0)
+        self.assertEqual(stats.contact_stats()["archived"], 3)
+        self.assertRollupsMatchRebuild()
+
+    def test_submit_endpoints_update_rollups(self):
+        self.client.post(
+            reverse("submit_project"),
+            {
+                "project_type": "web",
+                "client_name": "Jane",
+                "email": "jane@example.com",
+                "project_title": "Site",
+                "project_description": "Desc",
+                "budget": "$2,500",
+                "timeline": "urgent",
+            },
+            content_type="application/json",
+        )
+        self.client.post(
+            reverse("submit_contact"),
+            {"name": "John", "email": "john@example.com", "subject": "Hi", "message": "Hello"},
+            content_type="application/json",
+        )
+        self.assertEqual(stats.project_stats()["total_budget"], Decimal("2500"))
+        self.assertEqual(stats.contact_stats()["today"], 1)
+        self.assertRollupsMatchRebuild()
+
+    def test_admin_action_updates_rollups(self):
+        staff = get_user_model().objects.create_user(
+            "staff", password="pw", is_staff=True, is_superuser=True
+        )
+        self.client.force_login(staff)
+        project = make_project()
+        self.client.post(
+            reverse("admin:Frontend_projectsubmission_changelist"),
+            {"action": "mark_as_reviewed", "_selected_action": [project.pk]},
+        )
+        self.assertEqual(stats.project_stats()["pending"], 0)
+        self.assertRollupsMatchRebuild()
+
+
+@skipUnless(connection.vendor == "sqlite", "EXPLAIN QUERY PLAN is SQLite syntax")
+class QueryPlanTests(TestCase):
+    TABLES = ("Frontend_projectsubmission", "Frontend_contactmessage", "Frontend_dailyrollup")
+
+    def setUp(self):
+        staff = get_user_model().objects.create_user(
+            "staff", password="pw", is_staff=True, is_superuser=True
+        )
+        self.client.force_login(staff)
+        for status in ("pending", "reviewed"):
+            make_project(status=status)
+        make_message()
+        make_message(is_read=True, is_archived=True)
+
+    def query_plans(self, url):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        plans = {}
+        for query in ctx.captured_queries:
+            sql = query["sql"]
+            if sql.startswith("SELECT") and any(f'"{table}"' in sql for table in self.TABLES):
+                with connection.cursor() as cursor:
+                    cursor.execute("EXPLAIN QUERY PLAN " + sql)
+                    plans[sql] = [row[-1] for row in cursor.fetchall()]
+        self.assertTrue(plans, f"no queries captured for {url}")
+        return plans
+
+    def assertIndexedPlans(self, url):
+        for sql, plan in self.query_plans(url).items():
+            for line in plan:
+                for table in self.TABLES:
+                    if line.startswith(f"SCAN {table}"):
+                        self.assertIn("INDEX", line, f"full scan for {sql}")
+                if line.startswith(f"SCAN {self.TABLES[0]}") or line.startswith(f"SCAN {self.TABLES[1]}"):
+                    self.assertNotIn("TEMP B-TREE", " ".join(plan), f"sort for {sql}")
+
+    def test_dashboard(self):
+        self.assertIndexedPlans(reverse("admin_dashboard"))
+
+    def test_project_changelist(self):
+        url = reverse("admin:Frontend_projectsubmission_changelist")
+        start = timezone.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        today = urlencode(
+            {"submitted_at__gte": start, "submitted_at__lt": start + timedelta(days=1)}
+        )
+        for query in (
+            "",
+            "?status__exact=pending",
+            "?project_type__exact=web",
+            "?timeline__exact=standard",
+            f"?{today}",
+        ):
+            with self.subTest(query=query):
+                self.assertIndexedPlans(url + query)
+
+    def test_contact_changelist(self):
+        url = reverse("admin:Frontend_contactmessage_changelist")
+        for query in (
+            "",
+            "?is_read__exact=0",
+            "?is_archived__exact=1",
+            "?is_archived__exact=0&is_read__exact=0",
+            "?is_read__exact=0&after=2024-01-01T00:00:00%2B00:00_5",
+            "?before=2024-01-01T00:00:00%2B00:00_5",
+        ):
+            with self.subTest(query=query):
+                self.assertIndexedPlans(url + query)
+
+
+@skipUnless(connection.vendor == "sqlite", "FTS5 index is created on SQLite")
+class FullTextSearchTests(TestCase):
+    def test_triggers_keep_index_in_sync(self):
+        message = make_message(subject="Rebranding enquiry")
+        make_message(subject="Website", message="rebranding as well")
+        queryset = ContactMessage.objects.all()
+
+        results = search.search_queryset(queryset, "rebrand")
+        self.assertEqual(results.count(), 2)
+
+        message.subject = "Logo work"
+        message.save()
+        self.assertEqual(search.search_queryset(queryset, "rebrand").count(), 1)
+        ContactMessage.objects.all().delete()
+        self.assertEqual(search.search_queryset(queryset, "rebrand").count(), 0)
+
+    def test_admin_search_is_ranked(self):
+        staff = get_user_model().objects.create_user(
+            "staff", password="pw", is_staff=True, is_superuser=True
+        )
+        self.client.force_login(staff)
+        weak = make_project(project_title="Website", client_name="Acme")
+        strong = make_project(project_title="Acme Acme relaunch", client_name="Acme", company="Acme")
+        make_project(project_title="Unrelated", client_name="Other")
+
+        response = self.client.get(
+            reverse("admin:Frontend_projectsubmission_changelist"), {"q": "acme"}
+        )
+        self.assertEqual(list(response.context["cl"].result_list), [strong, weak])
+
+
+class WriteBehindQueueTests(TransactionTestCase):
+    # A transaction test: the writer thread commits on its own connection.
+
+    def setUp(self):
+        dedupe.recent.clear()
+        directory = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, directory)
+        self.spool_path = directory / "spool.ndjson"
+        override = override_settings(INGEST_SPOOL_PATH=self.spool_path)
+        override.enable()
+        self.addCleanup(override.disable)
+
+    def make_queue(self, batch_size=3, flush_ms=50):
+        queue = ingest.WriteBehindQueue(batch_size, flush_ms)
+        self.addCleanup(queue.close)
+        return queue
+
+    def message(self, i):
+        return ContactMessage(**ingest.contact_fields(
+            {"name": "John", "email": "john@example.com", "subject": "Hi", "message": f"Hello {i}"}
+        ))
+
+    def test_rows_are_written_in_batches(self):
+        queue = self.make_queue()
+        with mock.patch.object(ingest, "write_rows", wraps=ingest.write_rows) as write_rows:
+            futures = [queue.submit(self.message(i)) for i in range(5)]
+            ids = [future.result(timeout=5) for future in futures]
+        self.assertEqual([len(call.args[0]) for call in write_rows.call_args_list], [3, 2])
+        self.assertEqual(sorted(ids), sorted(ContactMessage.objects.values_list("pk", flat=True)))
+
+    def test_failed_flush_spools_and_resolves_to_none(self):
+        queue = self.make_queue()
+        with mock.patch.object(ingest, "write_rows", side_effect=DatabaseError("down")):
+            futures = [queue.submit(self.message(i)) for i in range(2)]
+            self.assertEqual([future.result(timeout=5) for future in futures], [None, None])
+        rows = [json.loads(line) for line in self.spool_path.read_text().splitlines()]
+        self.assertEqual([row["fields"]["message"] for row in rows], ["Hello 0", "Hello 1"])
+        self.assertFalse(ContactMessage.objects.exists())
+
+    def test_cancelled_submission_does_not_stop_the_writer(self):
+        queue = self.make_queue(batch_size=2, flush_ms=5000)
+        cancelled = queue.submit(self.message(0))
+        self.assertTrue(cancelled.cancel())
+        second = queue.submit(self.message(1))
+        self.assertIsNotNone(second.result(timeout=5))
+        # Still written, and the writer is still there for the next one.
+        self.assertEqual(ContactMessage.objects.count(), 2)
+        self.assertFalse(queue.stalled)
+        queue.submit(self.message(2))
+        self.assertIsNotNone(queue.submit(self.message(3)).result(timeout=5))
+
+    def test_stalled_queue_is_replaced(self):
+        first = ingest.get_queue()
+        self.addCleanup(lambda: ingest.get_queue().close())
+        with mock.patch.object(first._thread, "is_alive", return_value=False):
+            self.assertTrue(first.stalled)
+            self.assertIsNot(ingest.get_queue(), first)
+
+    def test_spooled_submission_is_acknowledged_as_queued(self):
+        payload = {"name": "John", "email": "john@example.com", "subject": "Hi", "message": "Hello"}
+        with mock.patch.object(ingest, "write_rows", side_effect=DatabaseError("down")):
+            response = self.client.post(reverse("submit_contact_async"), payload, content_type="application/json")
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.json()["status"], "queued")
+        self.assertIsNone(response.json()["id"])
+
+    def spool(self, count):
+        ingest.spool([self.message(i) for i in range(count)], self.spool_path)
+
+    def test_replay_inserts_spooled_rows(self):
+        self.spool(3)
+        out = StringIO()
+        call_command("replay_ingest_spool", "--batch-size", "2", stdout=out)
+        self.assertIn("Replayed 3 row(s)", out.getvalue())
+        self.assertEqual(ContactMessage.objects.count(), 3)
+        self.assertFalse(self.spool_path.exists())
+        call_command("replay_ingest_spool", stdout=out)
+        self.assertIn("Nothing to replay.", out.getvalue())
+
+    def test_failed_replay_puts_the_rest_back(self):
+        self.spool(5)
+        write_rows = ingest.write_rows
+        calls = []
+
+        def fail_second_batch(batch):
+            calls.append(len(batch))
+            if len(calls) == 2:
+                raise DatabaseError("down")
+            return write_rows(batch)
+
+        with mock.patch("Frontend.management.commands.replay_ingest_spool.write_rows", fail_second_batch):
+            with self.assertRaisesMessage(CommandError, "stopped after 2 row(s)"):
+                call_command("replay_ingest_spool", "--batch-size", "2", stdout=StringIO())
+        self.assertEqual(len(self.spool_path.read_text().splitlines()), 3)
+        self.assertFalse(self.spool_path.with_name("spool.ndjson.replaying").exists())
+
+        call_command("replay_ingest_spool", "--batch-size", "2", stdout=StringIO())
+        self.assertEqual(
+            sorted(ContactMessage.objects.values_list("message", flat=True)),
+            [f"Hello {i}" for i in range(5)],
+        )
+
+    def test_interrupted_replay_resumes_after_the_last_batch(self):
+        self.spool(3)
+        first_line = len(self.spool_path.read_bytes().splitlines(keepends=True)[0])
+        self.spool_path.rename(self.spool_path.with_name("spool.ndjson.replaying"))
+        self.spool_path.with_name("spool.ndjson.replaying.offset").write_text(str(first_line))
+        out = StringIO()
+        call_command("replay_ingest_spool", stdout=out)
+        self.assertIn("Resuming", out.getvalue())
+        self.assertEqual(
+            sorted(ContactMessage.objects.values_list("message", flat=True)), ["Hello 1", "Hello 2"]
+        )
+
+
+class ExportTests(TestCase):
+    def test_admin_export_streams_selected_rows(self):
+        staff = get_user_model().objects.create_user(
+            "staff", password="pw", is_staff=True, is_superuser=True
+        )
+        self.client.force_login(staff)
+        messages = [make_message(subject=f"Subject {i}") for i in range(3)]
+
+        response = self.client.post(
+            reverse("admin:Frontend_contactmessage_changelist"),
+            {"action": "export_ndjson", "_selected_action": [m.pk for m in messages[:2]]},
+        )
+        self.assertTrue(response.streaming)
+        rows = [json.loads(line) for line in b"".join(response.streaming_content).splitlines()]
+        self.assertEqual({row["id"] for row in rows}, {m.pk for m in messages[:2]})
+
+        response = self.client.post(
+            reverse("admin:Frontend_contactmessage_changelist"),
+            {"action": "export_csv", "_selected_action": [messages[0].pk]},
+        )
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual(lines[0].split(",")[:2], ["id", "name"])
+        self.assertEqual(len(lines), 2)
+
+    def test_export_records_writes_to_command_stdout(self):
+        messages = [make_message(subject=f"Subject {i}") for i in range(2)]
+        out = StringIO()
+        call_command("export_records", "messages", "--format", "ndjson", stdout=out)
+        rows = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual([row["id"] for row in rows], [m.pk for m in messages])
+
+
+class KeysetPaginationTests(TestCase):
+    def setUp(self):
+        staff = get_user_model().objects.create_user(
+            "staff", password="pw", is_staff=True, is_superuser=True
+        )
+        self.client.force_login(staff)
+        self.url = reverse("admin:Frontend_contactmessage_changelist")
+        now = timezone.now()
+        # Pairs share a timestamp so the pk tie-break is exercised.
+        self.messages = [make_message(subject=f"Subject {i}") for i in range(60)]
+        for i, message in enumerate(self.messages):
+            message.submitted_at = now - timedelta(minutes=i // 2)
+            message.save()
+        self.expected = sorted(self.messages, key=lambda m: (m.submitted_at, m.pk), reverse=True)
+
+    def get_cl(self, query=""):
+        response = self.client.get(self.url + query)
+        self.assertEqual(response.status_code, 200)
+        return response.context["cl"]
+
+    def test_walks_every_row_forwards_and_back(self):
+        pages = []
+        cl = self.get_cl()
+        self.assertIsNone(cl.newer_url)
+        while True:
+            pages.append(list(cl.result_list))
+            if not cl.older_url:
+                break
+            cl = self.get_cl(cl.older_url)
+        self.assertEqual([m for page in pages for m in page], self.expected)
+        self.assertEqual([len(page) for page in pages], [25, 25, 10])
+
+        cl = self.get_cl(cl.newer_url)
+        self.assertEqual(list(cl.result_list), pages[1])
+        cl = self.get_cl(cl.newer_url)
+        self.assertEqual(list(cl.result_list), pages[0])
+        self.assertIsNone(cl.newer_url)
+
+    def test_counts(self):
+        cl = self.get_cl("?is_read__exact=0")
+        self.assertEqual(cl.result_count, 60)
+        self.assertFalse(cl.exact_count)
+        make_message()
+        # The filtered count is cached briefly; exact_count bypasses it.
+        self.assertEqual(self.get_cl("?is_read__exact=0").result_count, 60)
+        cl = self.get_cl(cl.exact_count_url)
+        self.assertTrue(cl.exact_count)
+        self.assertEqual(cl.result_count, 61)
+
+    def test_table_estimate_ignores_partial_indexes(self):
+        table = ContactMessage._meta.db_table
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+            cursor.execute("SELECT idx, stat FROM sqlite_stat1 WHERE tbl = %s ORDER BY idx", [table])
+            stats = [row for row in cursor.fetchall() if row[0] != "contact_archived_idx"]
+            # A partial index covering 5 rows, stored ahead of the full ones.
+            stats.insert(0, ("contact_archived_idx", "5 5"))
+            cursor.execute("DELETE FROM sqlite_stat1 WHERE tbl = %s", [table])
+            for idx, stat in stats:
+                cursor.execute("INSERT INTO sqlite_stat1 (tbl, idx, stat) VALUES (%s, %s, %s)", [table, idx, stat])
+        self.assertEqual(pagination.table_row_estimate(ContactMessage, "default"), 60)
+
+    def test_explicit_ordering_uses_page_numbers(self):
+        cl = self.get_cl("?o=2")
+        self.assertFalse(getattr(cl, "keyset", False))
+        self.assertEqual(cl.result_count, 60)
+
+    def test_invalid_cursor(self):
+        response = self.client.get(self.url + "?after=garbage")
+        self.assertEqual(response.status_code, 302)
+        key = (self.expected[0].submitted_at, self.expected[0].pk)
+        self.assertEqual(pagination.decode_cursor(pagination.encode_cursor(key)), key)
+
+
+class ThrottleTests(TestCase):
+    def setUp(self):
+        dedupe.recent.clear()
+
+    def test_token_buckets(self):
+        buckets = throttle.TokenBuckets(rate=1, burst=2, ttl=10, max_keys=2)
+        self.assertEqual([buckets.take("a", now=0) for _ in range(3)], [0, 0, 1])
+        self.assertEqual(buckets.take("a", now=1.5), 0)
+        self.assertEqual(buckets.take("a", now=1.5), 0.5)
+        buckets.take("b", now=2)
+        buckets.take("c", now=3)
+        self.assertEqual(len(buckets), 2)  # over max_keys: "a" went first
+        buckets.take("d", now=20)
+        self.assertEqual(len(buckets), 1)  # the rest idled past the ttl
+
+    @override_settings(THROTTLE_IP_BURST=2, THROTTLE_IP_RATE=0.5)
+    def test_rejects_before_touching_the_database(self):
+        url = reverse("submit_contact")
+        payload = {"name": "John", "email": "john@example.com", "subject": "Hi"}
+        for i in range(2):
+            response = self.client.post(
+                url, {**payload, "message": f"Hello {i}"}, content_type="application/json"
+            )
+            self.assertEqual(response.status_code, 200)
+
+        with self.assertNumQueries(0):
+            response = self.client.post(url, payload, content_type="application/json")
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response["Retry-After"], "2")
+
+        other = self.client.post(
+            url, {**payload, "message": "Hello 2"}, content_type="application/json", REMOTE_ADDR="10.0.0.2"
+        )
+        self.assertEqual(other.status_code, 200)
+        self.assertEqual(ContactMessage.objects.count(), 3)
+
+    @override_settings(
+        THROTTLE_IP_BURST=2, THROTTLE_IP_RATE=0.001, THROTTLE_GLOBAL_BURST=1, THROTTLE_GLOBAL_RATE=0.001
+    )
+    def test_global_rejection_does_not_charge_the_client(self):
+        middleware = throttle.SubmissionThrottleMiddleware(lambda request: HttpResponse("ok"))
+        request = RequestFactory().post(reverse("submit_contact"))
+        self.assertEqual(middleware(request).status_code, 200)
+        for _ in range(3):
+            self.assertEqual(middleware(request).status_code, 429)
+        tokens, _ = middleware.per_ip._buckets[request.META["REMOTE_ADDR"]]
+        self.assertAlmostEqual(tokens, 1, places=2)
+
+        buckets = throttle.CacheTokenBuckets(rate=1, burst=2, ttl=10, alias="default", prefix="test-refund")
+        self.addCleanup(caches["default"].delete, "test-refund:a")
+        buckets.take("a", now=0)
+        buckets.refund("a")
+        self.assertEqual(caches["default"].get("test-refund:a"), (2, 0))
+
+    @override_settings(THROTTLE_IP_BURST=1, THROTTLE_IP_RATE=0.001)
+    def test_upload_creation_is_throttled_but_chunks_are_not(self):
+        middleware = throttle.SubmissionThrottleMiddleware(lambda request: HttpResponse("ok"))
+        factory = RequestFactory()
+        create = factory.post(reverse("create_upload"))
+        self.assertEqual(middleware(create).status_code, 200)
+        self.assertEqual(middleware(create).status_code, 429)
+
+        chunk = factory.patch(reverse("upload", args=["a" * 32]))
+        self.assertEqual(middleware(chunk).status_code, 200)
+
+    @override_settings(THROTTLE_IP_BURST=1, THROTTLE_IP_RATE=0.001)
+    def test_async_stack_is_not_adapted(self):
+        async def view(request):
+            return HttpResponse("ok")
+
+        middleware = throttle.SubmissionThrottleMiddleware(view)
+        self.assertTrue(iscoroutinefunction(middleware))
+        request = RequestFactory().post(reverse("submit_contact"))
+        statuses = [async_to_sync(middleware)(request).status_code for _ in range(2)]
+        self.assertEqual(statuses, [200, 429])
+
+
+class DedupeTests(TestCase):
+    CONTACT = {"name": "John", "email": "john@example.com", "subject": "Hi", "message": "Hello there"}
+
+    def setUp(self):
+        dedupe.recent.clear()
+
+    def post(self, name, payload, status=200, **extra):
+        response = self.client.post(reverse(name), payload, content_type="application/json", **extra)
+        self.assertEqual(response.status_code, status)
+        return response.json().get("id")
+
+    def test_repeated_submission_returns_original(self):
+        first = self.post("submit_contact", self.CONTACT)
+        repeat = {**self.CONTACT, "email": " John@Example.com", "message": "Hello   there"}
+        with self.assertNumQueries(0):
+            self.assertEqual(self.post("submit_contact", repeat), first)
+
+        # Another worker (or a restart) only has the database to go on.
+        dedupe.recent.clear()
+        self.assertEqual(self.post("submit_contact", self.CONTACT), first)
+        self.assertEqual(ContactMessage.objects.count(), 1)
+        self.assertEqual(stats.contact_stats()["total"], 1)
+
+    def test_idempotency_key(self):
+        project = {
+            "project_type": "web",
+            "client_name": "Jane",
+            "email": "jane@example.com",
+            "project_title": "Site",
+            "project_description": "Desc",
+            "budget": "2500",
+            "timeline": "urgent",
+        }
+        first = self.post("submit_project", project, HTTP_IDEMPOTENCY_KEY="abc")
+        retry = {**project, "project_title": " site "}
+        self.assertEqual(self.post("submit_project", retry, HTTP_IDEMPOTENCY_KEY="abc"), first)
+        dedupe.recent.clear()
+        self.assertEqual(self.post("submit_project", retry, HTTP_IDEMPOTENCY_KEY="abc"), first)
+        self.assertNotEqual(self.post("submit_project", {**project, "budget": "3000"}), first)
+        self.assertEqual(ProjectSubmission.objects.count(), 2)
+
+    def test_idempotency_key_reused_for_another_payload(self):
+        first = self.post("submit_contact", self.CONTACT, HTTP_IDEMPOTENCY_KEY="abc")
+        edited = {**self.CONTACT, "message": "Something else"}
+        self.post("submit_contact", edited, status=422, HTTP_IDEMPOTENCY_KEY="abc")
+        dedupe.recent.clear()
+        self.post("submit_contact", edited, status=422, HTTP_IDEMPOTENCY_KEY="abc")
+        self.assertEqual(ContactMessage.objects.count(), 1)
+
+        # Keys are per client: another address may use the same one.
+        other = self.post("submit_contact", edited, HTTP_IDEMPOTENCY_KEY="abc", REMOTE_ADDR="10.0.0.9")
+        self.assertNotEqual(other, first)
+        self.assertEqual(ContactMessage.objects.count(), 2)
+
+    def test_write_behind_batch(self):
+        stored = make_message()
+        dedupe.prepare(stored)
+        stored.save()
+
+        def message(**kwargs):
+            fields = {"name": "John Sender", "email": "john@example.com", "subject": "Hello"}
+            return dedupe.prepare(ContactMessage(**{**fields, "message": "I would like a quote.", **kwargs}))
+
+        batch = [message(), message(message="New"), message(message="New"), message(message="Other")]
+        ingest.write_rows(batch)
+
+        self.assertEqual(batch[0].pk, stored.pk)
+        self.assertEqual(batch[1].pk, batch[2].pk)
+        self.assertEqual(ContactMessage.objects.count(), 3)
+        self.assertEqual(stats.contact_stats()["total"], 3)
+
+        keyed = [message(message="Keyed"), message(message="Changed")]
+        for instance in keyed:
+            dedupe.prepare(instance, "10.0.0.1\x1fabc")
+        ingest.write_rows(keyed)
+        self.assertIsNotNone(keyed[0].pk)
+        self.assertIsNone(keyed[1].pk)
+        self.assertIsInstance(keyed[1].rejected, dedupe.KeyReused)
+        self.assertEqual(ContactMessage.objects.count(), 4)
+
+    def test_refused_queued_submission_does_not_answer_for_others(self):
+        keyed = dedupe.prepare(ContactMessage(**self.CONTACT), "10.0.0.1\x1fabc")
+        pending = Future()
+        dedupe.remember(keyed, pending)
+        waiting = dedupe.prepare(ContactMessage(**self.CONTACT))
+        self.assertIs(dedupe.lookup(waiting), pending)
+
+        queued = Future()
+        queued.set_result(7)
+        queue = mock.Mock(**{"submit.return_value": queued})
+
+        async def submit_while_pending():
+            task = asyncio.ensure_future(views._ingest(ContactMessage(**self.CONTACT)))
+            await asyncio.sleep(0)
+            pending.set_exception(dedupe.KeyReused())
+            return await task
+
+        with mock.patch.object(ingest, "get_queue", return_value=queue):
+            self.assertEqual(async_to_sync(submit_while_pending)(), 7)
+        queue.submit.assert_called_once()
+
+        # The sync endpoint may have picked the future up before it failed.
+        dedupe.recent.clear()
+        failed = Future()
+        failed.set_exception(dedupe.KeyReused())
+        dedupe.recent.put([("frontend.contactmessage", "fp", waiting.fingerprint)], failed)
+        self.assertIsNotNone(dedupe.save_once(ContactMessage(**self.CONTACT)))
+        self.assertEqual(ContactMessage.objects.count(), 1)
+
+
+class BenchmarkSuiteTests(TransactionTestCase):
+    # A transaction test so the write-behind thread can commit the async
+    # submissions while the test waits on them.
+
+    def test_every_route_is_benchmarked(self):
+        dedupe.recent.clear()
+        report = benchmark.run(iterations=3, warmup=1, memory_samples=1)
+
+        self.assertEqual(list(report["routes"]), benchmark.named_routes())
+        for name, result in report["routes"].items():
+            with self.subTest(route=name):
+                for metric in ("rps", "p50_ms", "p95_ms", "p99_ms", "queries", "alloc_kib"):
+                    self.assertGreaterEqual(result[metric], 0)
+        for name in ["admin_dashboard", "upload", *benchmark.POST_PAYLOADS]:
+            expected = [201] if name == "create_upload" else [200]
+            self.assertEqual(report["routes"][name]["status"], expected, name)
+        self.assertEqual(ContactMessage.objects.count(), 2 * (3 + 1 + 1))
+
+    def test_compare_flags_regressions(self):
+        base = {"status": [200], "rps": 1000, "p95_ms": 1.0, "queries": 2, "alloc_kib": 40}
+        baseline = {"routes": {"index": base, "about": base}}
+        report = {
+            "routes": {
+                "index": {**base, "p95_ms": 1.2, "rps": 900},
+                "about": {**base, "p95_ms": 2.0, "queries": 3, "status": [500]},
+                "new_route": base,
+            }
+        }
+        regressions = benchmark.compare(report, baseline, threshold=0.25)
+        self.assertEqual(len(regressions), 3)
+        self.assertTrue(all(line.startswith("about:") for line in regressions))
+
+
+class MetricsTests(TestCase):
+    def setUp(self):
+        metrics.reset()
+        self.staff = get_user_model().objects.create_user(
+            "staff", password="pw", is_staff=True, is_superuser=True
+        )
+
+    def test_server_timing_and_prometheus_export(self):
+        self.client.force_login(self.staff)
+        response = self.client.get(reverse("admin_dashboard"))
+        timing = response["Server-Timing"]
+        self.assertRegex(timing, r'^app;dur=[\d.]+, db;dur=[\d.]+;desc="6 queries", tpl;dur=[\d.]+$')
+        self.assertNotEqual(timing.rsplit("tpl;dur=", 1)[1], "0.0")
+
+        body = self.client.get(reverse("metrics")).content.decode()
+        self.assertIn('django_request_duration_seconds_count{view="admin_dashboard"} 1', body)
+        self.assertIn('django_db_queries_total{view="admin_dashboard"} 6', body)
+        self.assertIn('django_request_duration_seconds_bucket{view="admin_dashboard",le="+Inf"} 1', body)
+
+    @override_settings(METRICS_TOKEN="s3cret")
+    def test_metrics_requires_staff_or_token(self):
+        url = reverse("metrics")
+        self.assertEqual(url, "/metrics/")
+        self.assertEqual(self.client.get(url).status_code, 403)
+        self.assertEqual(self.client.get(url, HTTP_AUTHORIZATION="Bearer wrong").status_code, 403)
+        self.assertEqual(self.client.get(url, HTTP_AUTHORIZATION="Bearer s3cret").status_code, 200)
+
+    def test_exited_threads_are_folded_into_totals(self):
+        stores = len(metrics._stores)
+        for _ in range(3):
+            thread = threading.Thread(
+                target=metrics.record, args=("index", 0.002, metrics.RequestMetrics(), 200)
+            )
+            thread.start()
+            thread.join()
+        gc.collect()
+
+        self.assertEqual(len(metrics._stores), stores)
+        # Every bucket up to +Inf: the request count
+        self.assertEqual(sum(metrics.snapshot()["index"][: metrics._SUM]), 3)
+
+    def test_async_stack_is_not_adapted(self):
+        async def view(request):
+            # Queries run in a worker thread still count towards this request.
+            await sync_to_async(ContactMessage.objects.count)()
+            return HttpResponse("ok")
+
+        middleware = metrics.MetricsMiddleware(view)
+        self.assertTrue(iscoroutinefunction(middleware))
+        response = async_to_sync(middleware)(RequestFactory().get("/"))
+        self.assertIn('desc="1 queries"', response["Server-Timing"])
+
+
+@skipUnless(connection.vendor == "sqlite", "SQLite connection profile")
+class DatabaseProfileTests(TestCase):
+    def test_pragmas_applied_to_new_connections(self):
+        with connection.cursor() as cursor:
+            cursor.execute("PRAGMA synchronous")
+            self.assertEqual(cursor.fetchone()[0], 1)  # NORMAL
+            cursor.execute("PRAGMA busy_timeout")
+            self.assertEqual(cursor.fetchone()[0], 5000)
+
+    def test_pragma_values_are_validated(self):
+        self.assertEqual(database.pragma_statements({"cache_size": -2000}), ["PRAGMA cache_size = -2000"])
+        with self.assertRaises(ValueError):
+            database.pragma_statements({"journal_mode": "WAL; DROP TABLE x"})
+
+
+class UploadTests(TestCase):
+    CONTENT = b"design-brief-" * 100
+
+    def setUp(self):
+        dedupe.recent.clear()
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        # A small read size so every chunk is copied in several pieces.
+        override = override_settings(MEDIA_ROOT=media_root, UPLOAD_READ_SIZE=64)
+        override.enable()
+        self.addCleanup(override.disable)
+
+    def start(self, size=len(CONTENT)):
+        response = self.client.post(
+            reverse("create_upload"), {"name": "../brief.pdf", "size": size}, content_type="application/json"
+        )
+        self.assertEqual(response.status_code, 201)
+        return response["Location"]
+
+    def patch(self, url, offset, chunk):
+        return self.client.patch(
+            url, chunk, content_type="application/offset+octet-stream", HTTP_UPLOAD_OFFSET=str(offset)
+        )
+
+    def upload(self, content):
+        url = self.start(len(content))
+        for offset in range(0, len(content), 500):
+            response = self.patch(url, offset, content[offset:offset + 500])
+            self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_chunked_upload_lands_in_store(self):
+        result = self.upload(self.CONTENT)
+        sha256 = hashlib.sha256(self.CONTENT).hexdigest()
+
+        self.assertEqual(result["sha256"], sha256)
+        self.assertEqual(result["name"], "brief.pdf")
+        self.assertEqual(uploads.cas_path(sha256).read_bytes(), self.CONTENT)
+
+    def test_resume_after_offset_mismatch(self):
+        url = self.start()
+        self.patch(url, 0, self.CONTENT[:300])
+
+        stale = self.patch(url, 0, self.CONTENT[:300])
+        self.assertEqual(stale.status_code, 409)
+        self.assertEqual(stale["Upload-Offset"], "300")
+        status = self.client.head(url)
+        self.assertEqual(status["Upload-Offset"], "300")
+
+        response = self.patch(url, 300, self.CONTENT[300:])
+        self.assertEqual(response.json()["sha256"], hashlib.sha256(self.CONTENT).hexdigest())
+
+    def test_chunk_past_declared_size_is_rejected(self):
+        url = self.start(10)
+        self.assertEqual(self.patch(url, 0, b"x" * 11).status_code, 413)
+        self.assertEqual(self.client.get("/uploads/not-an-upload-id-at-all/").status_code, 404)
+
+    def test_identical_content_is_stored_once(self):
+        first = self.upload(self.CONTENT)
+        second = self.upload(self.CONTENT)
+
+        self.assertEqual(first["sha256"], second["sha256"])
+        stored = [p for p in uploads.cas_root().rglob("*") if p.is_file()]
+        self.assertEqual(len(stored), 1)
+        self.assertEqual(list(uploads.partial_root().glob("*.part")), [])
+
+    def test_submit_project_references_hashes(self):
+        sha256 = self.upload(self.CONTENT)["sha256"]
+        payload = {
+            "project_type": "web",
+            "client_name": "Jane Client",
+            "email": "jane@example.com",
+            "project_title": "New website",
+            "project_description": "A new marketing site",
+            "budget": "$1,500",
+            "timeline": "standard",
+            "attachments": [{"sha256": sha256, "name": "brief.pdf"}],
+        }
+        response = self.client.post(reverse("submit_project"), payload, content_type="application/json")
+        self.assertEqual(response.status_code, 200)
+
+        project = ProjectSubmission.objects.get(pk=response.json()["id"])
+        self.assertEqual(
+            json.loads(project.attached_files),
+            [{"sha256": sha256, "name": "brief.pdf", "size": len(self.CONTENT)}],
+        )
+
+        payload["attachments"] = ["0" * 64]
+        response = self.client.post(reverse("submit_project"), payload, content_type="application/json")
+        self.assertEqual(response.status_code, 400)
+
+    def test_purge_removes_only_stale_partials(self):
+        self.start()
+        self.upload(self.CONTENT)
+        self.assertEqual(uploads.purge_stale(3600), 0)
+        self.assertEqual(uploads.purge_stale(-1), 2)
+        self.assertEqual(len([p for p in uploads.cas_root().rglob("*") if p.is_file()]), 1)
+
+    def test_purge_removes_unreferenced_store_files(self):
+        attached = self.upload(self.CONTENT)["sha256"]
+        archived = self.upload(b"archived-" * 50)["sha256"]
+        spooled = self.upload(b"spooled-" * 50)["sha256"]
+        orphan = self.upload(b"orphan-" * 50)["sha256"]
+        make_project(attached_files=json.dumps([{"sha256": attached, "name": "a.pdf"}]))
+        ArchivedRecord.objects.create(
+            source="project",
+            original_id=1,
+            summary="Old",
+            email="old@example.com",
+            submitted_at=timezone.now(),
+            payload={"attached_files": json.dumps([{"sha256": archived}])},
+        )
+        spool = Path(settings.MEDIA_ROOT) / "spool.ndjson"
+        spool.write_text(json.dumps({"source": "project", "fields": {"attached_files": spooled}}) + "\n")
+
+        with override_settings(INGEST_SPOOL_PATH=spool):
+            self.assertEqual(uploads.purge_unreferenced(3600), 0)
+            self.assertEqual(uploads.purge_unreferenced(-1), 1)
+
+        self.assertFalse(uploads.cas_path(orphan).exists())
+        for sha256 in (attached, archived, spooled):
+            self.assertTrue(uploads.cas_path(sha256).exists())
+
+
+class ArchiveTests(TestCase):
+    def setUp(self):
+        old = timezone.now() - timedelta(days=400)
+        self.closed = make_project(status="accepted", submitted_at=old)
+        self.open = make_project(status="pending", submitted_at=old)
+        self.recent = make_project(status="rejected")
+        self.archived = make_message(is_archived=True, submitted_at=old)
+        self.inbox = make_message(submitted_at=old)
+
+    def test_archive_moves_only_due_rows(self):
+        before = archive.cutoff(365)
+        self.assertEqual(archive.archive("project", before, chunk_size=1), 1)
+        self.assertEqual(archive.archive("contact", before, chunk_size=1), 1)
+
+        self.assertEqual(
+            list(ProjectSubmission.objects.order_by("pk").values_list("pk", flat=True)), [self.open.pk, self.recent.pk]
+        )
+        self.assertEqual(list(ContactMessage.objects.values_list("pk", flat=True)), [self.inbox.pk])
+        record = ArchivedRecord.objects.get(source="project")
+        self.assertEqual(record.original_id, self.closed.pk)
+        self.assertEqual(record.payload["status"], "accepted")
+        # The dashboard counters keep counting archived rows, rebuilt or not.
+        self.assertEqual(stats.project_stats()["total"], 3)
+        self.assertEqual(stats.contact_stats()["archived"], 1)
+        counts = DailyRollup.objects.values_list("day", "source", "bucket", "count", "budget_total")
+        before_rebuild = sorted(counts)
+        rollups.rebuild()
+        self.assertEqual(sorted(counts), before_rebuild)
+
+    def test_restore_puts_rows_back(self):
+        before = archive.cutoff(365)
+        archive.archive("project", before)
+        archive.archive("contact", before)
+
+        self.assertEqual(archive.restore(ArchivedRecord.objects.all()), 2)
+        self.assertFalse(ArchivedRecord.objects.exists())
+        restored = ProjectSubmission.objects.get(pk=self.closed.pk)
+        self.assertEqual(restored.created_at, self.closed.created_at)
+        self.assertEqual(restored.budget, self.closed.budget)
+        self.assertTrue(ContactMessage.objects.get(pk=self.archived.pk).is_archived)
+        self.assertEqual(stats.project_stats()["total"], 3)
+        self.assertEqual(stats.contact_stats()["archived"], 1)
+        counts = DailyRollup.objects.filter(count__gt=0).values_list("day", "bucket", "count").order_by("day", "bucket")
+        before_rebuild = list(counts)
+        rollups.rebuild()
+        self.assertEqual(list(counts), before_rebuild)
+
+    def test_admin_is_read_only(self):
+        archive.archive("project", archive.cutoff(365))
+        staff = get_user_model().objects.create_superuser("admin", "admin@example.com", "pw")
+        self.client.force_login(staff)
+
+        changelist = reverse("admin:Frontend_archivedrecord_changelist")
+        self.assertContains(self.client.get(changelist), self.closed.project_title)
+        record = ArchivedRecord.objects.get()
+        detail = self.client.get(reverse("admin:Frontend_archivedrecord_change", args=[record.pk]))
+        self.assertContains(detail, "&quot;status&quot;: &quot;accepted&quot;")
+        self.assertEqual(self.client.get(reverse("admin:Frontend_archivedrecord_add")).status_code, 403)
+
+
+@override_settings(BULK_JOB_INLINE_LIMIT=2, BULK_JOB_RUNNER="worker")
+class BulkJobTests(TestCase):
+    def setUp(self):
+        self.projects = [make_project(email=f"client{i}@example.com") for i in range(5)]
+        staff = get_user_model().objects.create_superuser("admin", "admin@example.com", "pw")
+        self.client.force_login(staff)
+
+    def select_all(self, action, query=""):
+        return self.client.post(
+            reverse("admin:Frontend_projectsubmission_changelist") + query,
+            {"action": action, "select_across": "1", "index": "0", "_selected_action": [self.projects[0].pk]},
+            follow=True,
+        )
+
+    def test_small_selection_runs_inline(self):
+        self.client.post(
+            reverse("admin:Frontend_projectsubmission_changelist"),
+            {"action": "mark_as_accepted", "_selected_action": [p.pk for p in self.projects[:2]]},
+        )
+        self.assertFalse(BulkJob.objects.exists())
+        self.assertEqual(ProjectSubmission.objects.filter(status="accepted").count(), 2)
+
+    def test_large_selection_runs_in_chunks(self):
+        response = self.select_all("mark_as_reviewed")
+        job = BulkJob.objects.get()
+        self.assertContains(response, f"follow job #{job.pk}")
+        self.assertEqual((job.filters, job.max_pk, job.total), ({}, self.projects[-1].pk, 5))
+        self.assertEqual(ProjectSubmission.objects.filter(status="pending").count(), 5)
+
+        page = self.client.get(reverse("admin:Frontend_bulkjob_change", args=[job.pk]))
+        self.assertContains(page, reverse("admin:Frontend_bulkjob_progress", args=[job.pk]))
+
+        job = jobs.claim()
+        with CaptureQueriesContext(connection) as queries:
+            jobs.run(job, chunk_size=2, pause_ms=0)
+        self.assertEqual((job.status, job.processed, job.total), ("done", 5, 5))
+        self.assertEqual(ProjectSubmission.objects.filter(status="reviewed").count(), 5)
+        self.assertEqual(stats.project_stats()["pending"], 0)
+        # Three chunks (2 + 2 + 1), each one UPDATE of the chunk's key range.
+        updates = [q["sql"] for q in queries if q["sql"].startswith('UPDATE "Frontend_projectsubmission"')]
+        self.assertEqual(len(updates), 3)
+
+        progress = self.client.get(reverse("admin:Frontend_bulkjob_progress", args=[job.pk]))
+        self.assertEqual(progress.json()["percent"], 100)
+
+    def test_job_keeps_the_changelist_filters(self):
+        for project in self.projects[:3]:
+            project.project_title = "Rebrand"
+            project.save()
+        self.projects[0].status = "accepted"
+        self.projects[0].save()
+        late = make_project(project_title="Rebrand")
+
+        self.select_all("mark_as_rejected", "?status__exact=pending&q=rebrand")
+        job = BulkJob.objects.get()
+        self.assertEqual((job.filters, job.search, job.total), ({"status__exact": ["pending"]}, "rebrand", 3))
+
+        # Added after the action was taken: not part of the selection.
+        make_project(project_title="Rebrand")
+        jobs.run(jobs.claim(), chunk_size=1, pause_ms=0)
+        rejected = ProjectSubmission.objects.filter(status="rejected").values_list("pk", flat=True)
+        self.assertEqual(sorted(rejected), [self.projects[1].pk, self.projects[2].pk, late.pk])
+
+    def test_interrupted_job_resumes_after_last_pk(self):
+        self.select_all("mark_as_rejected")
+        job = BulkJob.objects.get()
+        job.last_pk = self.projects[2].pk
+        job.save()
+
+        jobs.run(jobs.claim(), pause_ms=0)
+        rejected = ProjectSubmission.objects.filter(status="rejected").values_list("pk", flat=True)
+        self.assertEqual(sorted(rejected), [p.pk for p in self.projects[3:]])
+
+    def test_cancelled_job_stops(self):
+        self.select_all("mark_as_contacted")
+        job = jobs.claim()
+        self.client.post(
+            reverse("admin:Frontend_bulkjob_changelist"),
+            {"action": "cancel_jobs", "_selected_action": [job.pk]},
+        )
+        jobs.run(job, pause_ms=0)
+        self.assertEqual(BulkJob.objects.get().status, "cancelled")
+        self.assertFalse(ProjectSubmission.objects.filter(status="contacted").exists())
+
+    def test_expired_lease_is_taken_over(self):
+        self.select_all("mark_as_reviewed")
+        crashed = jobs.claim()
+        self.assertIsNone(jobs.claim())  # still leased
+
+        later = timezone.now() + timedelta(seconds=settings.BULK_JOB_LEASE_SECONDS + 1)
+        resumed = jobs.claim(now=later)
+        self.assertEqual(resumed.pk, crashed.pk)
+        self.assertEqual(resumed.started_at, crashed.started_at)
+
+        # The first runner wakes up: its chunk is rolled back and it stops.
+        jobs.run(crashed, pause_ms=0)
+        self.assertEqual(ProjectSubmission.objects.filter(status="reviewed").count(), 0)
+        self.assertEqual(BulkJob.objects.get().status, "running")
+
+        jobs.run(resumed, pause_ms=0)
+        self.assertEqual((resumed.status, resumed.processed), ("done", 5))
+        self.assertEqual(ProjectSubmission.objects.filter(status="reviewed").count(), 5)
+
+
+class CountingEmailBackend(LocmemEmailBackend):
+    connections = 0
+
+    def open(self):
+        if getattr(self, "opened", False):
+            return False
+        self.opened = True
+        CountingEmailBackend.connections += 1
+        return True
+
+    def close(self):
+        self.opened = False
+
+
+class FailingEmailBackend(LocmemEmailBackend):
+    def send_messages(self, messages):
+        raise ConnectionRefusedError("mail server down")
+
+
+@override_settings(NOTIFY_RECIPIENTS=["team@example.com"], NOTIFY_COALESCE_SECONDS=30)
+class NotificationTests(TestCase):
+    CONTACT = {"name": "John", "email": "john@example.com", "subject": "Hi", "message": "Hello there"}
+
+    def setUp(self):
+        dedupe.recent.clear()
+
+    def submit(self, i):
+        payload = {**self.CONTACT, "subject": f"Question {i}"}
+        response = self.client.post(reverse("submit_contact"), payload, content_type="application/json")
+        self.assertEqual(response.status_code, 200)
+
+    def age_outbox(self, seconds=60):
+        Notification.objects.update(created_at=timezone.now() - timedelta(seconds=seconds))
+
+    def test_submission_writes_outbox_without_sending(self):
+        self.submit(1)
+        notification = Notification.objects.get()
+        self.assertEqual(notification.status, "pending")
+        self.assertEqual(notification.summary, "New message: Question 1 from John <john@example.com>")
+        self.assertEqual(mail.outbox, [])
+
+    def test_rolled_back_submission_is_not_announced(self):
+        with self.assertRaises(RuntimeError), transaction.atomic():
+            make_message()
+            raise RuntimeError
+        self.assertFalse(Notification.objects.exists())
+
+    def test_burst_is_coalesced_into_one_digest(self):
+        for i in range(3):
+            self.submit(i)
+        drain = notifications.Drain()
+        self.assertEqual(drain(), (0, 0))  # still inside the coalescing window
+
+        self.age_outbox()
+        self.assertEqual(drain(), (3, 0))
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].subject, "[Project Catalyst] 3 new submissions")
+        self.assertEqual(mail.outbox[0].to, ["team@example.com"])
+        self.assertIn("Question 2", mail.outbox[0].body)
+        self.assertFalse(Notification.objects.exclude(status="sent").exists())
+
+    @override_settings(
+        NOTIFY_BATCH_SIZE=2, EMAIL_BACKEND="Frontend.tests.CountingEmailBackend"
+    )
+    def test_batches_share_one_connection(self):
+        for i in range(5):
+            self.submit(i)
+        self.age_outbox()
+        CountingEmailBackend.connections = 0
+        self.assertEqual(notifications.Drain()(), (5, 0))
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertEqual(CountingEmailBackend.connections, 1)
+
+    @override_settings(EMAIL_BACKEND="Frontend.tests.FailingEmailBackend", NOTIFY_MAX_ATTEMPTS=2)
+    def test_failed_send_backs_off_then_gives_up(self):
+        self.submit(1)
+        drain = notifications.Drain()
+        with self.assertLogs("Frontend.notifications", "WARNING"):
+            self.assertEqual(drain(force=True), (0, 1))
+        notification = Notification.objects.get()
+        self.assertEqual((notification.status, notification.attempts, notification.claim), ("pending", 1, ""))
+        self.assertIn("mail server down", notification.last_error)
+        self.assertGreater(notification.next_attempt_at, timezone.now())
+
+        Notification.objects.update(next_attempt_at=timezone.now())
+        with self.assertLogs("Frontend.notifications", "WARNING"):
+            drain(force=True)
+        self.assertEqual(Notification.objects.get().status, "failed")
+
+
+class CriticalCssTests(TestCase):
+    CSS = """
+    .hero{color:red}
+    .hero:hover{color:blue}
+    .footer-links a{color:gray}
+    .modal.is-open{display:block}
+    .unused{color:green}
+    @media (max-width:600px){.hero{padding:0}.unused{margin:0}}
+    @keyframes fade{from{opacity:0}to{opacity:1}}
+    @keyframes spin{to{transform:rotate(1turn)}}
+    .hero h1{animation:fade 1s}
+    """
+    HTML = (
+        '<html><head><title>t</title></head><body><section class="hero"><h1>Hi</h1></section>'
+        '<div class="modal"></div><footer><ul class="footer-links"><li><a href="#">x</a></li></ul></footer>'
+        "<script>el.classList.add('is-open')</script></body></html>"
+    )
+
+    def setUp(self):
+        self.output_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.output_dir)
+        override = override_settings(CRITICAL_CSS_DIR=self.output_dir)
+        override.enable()
+        self.addCleanup(override.disable)
+        critical.load_manifest.cache_clear()
+        self.addCleanup(critical.load_manifest.cache_clear)
+        caches[settings.PAGE_CACHE_ALIAS].clear()
+
+    def test_critical_css_keeps_rules_above_the_fold(self):
+        rules = critical.parse_css(self.CSS)
+        page_elements, _ = critical.elements(self.HTML)
+        css = critical.critical_css(rules, page_elements, fold=3)
+
+        self.assertIn(".hero{color:red}", css)
+        self.assertIn("@media (max-width:600px){.hero{padding:0}}", css)
+        self.assertIn("@keyframes fade", css)
+        self.assertNotIn(":hover", css)
+        self.assertNotIn("footer-links", css)
+        self.assertNotIn("unused", css)
+        self.assertNotIn("spin", css)
+
+    def test_purged_css_keeps_rules_used_anywhere_or_by_scripts(self):
+        rules = critical.parse_css(self.CSS)
+        page_elements, scripts = critical.elements(self.HTML)
+        css = critical.purged_css(rules, page_elements, *critical.script_classes(scripts))
+
+        self.assertIn(".hero:hover{color:blue}", css)
+        self.assertIn(".footer-links a{color:gray}", css)
+        self.assertIn(".modal.is-open{display:block}", css)
+        self.assertNotIn("unused", css)
+        self.assertNotIn("spin", css)
+
+    def test_tag_falls_back_to_stylesheet_link_without_a_build(self):
+        response = self.client.get(reverse("about"))
+        self.assertContains(response, 'rel="stylesheet" href="/static/style/main')
+        self.assertNotContains(response, "<style>")
+
+    def test_tag_inlines_the_page_css_after_a_build(self):
+        path = reverse("about")
+        manifest = critical.build({path: self.HTML}, self.output_dir, fold=3)
+        self.assertEqual(set(manifest["pages"]), {path})
+        self.assertIn(".hero{", manifest["pages"][path])
+
+        response = self.client.get(path)
+        self.assertContains(response, "<style>" + manifest["pages"][path] + "</style>")
+        self.assertContains(response, 'rel="preload" as="style" href="/static/critical/site')
+        self.assertContains(response, "<noscript>")
+
+    def test_stale_build_is_ignored(self):
+        path = reverse("about")
+        manifest = critical.build({path: self.HTML}, self.output_dir, fold=3)
+        manifest["source_sha256"] = "0" * 64
+        (Path(self.output_dir) / critical.MANIFEST_NAME).write_text(json.dumps(manifest))
+        critical.load_manifest.cache_clear()
+
+        self.assertEqual(critical.load_manifest(), {})
+
+
+class ModuleScriptTests(TestCase):
+    def setUp(self):
+        caches[settings.PAGE_CACHE_ALIAS].clear()
+
+    def test_module_imports_are_followed_transitively(self):
+        self.assertEqual(assets.module_imports("Js/pages/project.js"), ("Js/lib/forms.js", "Js/lib/uploads.js"))
+        self.assertEqual(assets.module_imports("Js/core.js"), ())
+
+    def test_form_pages_load_their_chunk_with_preloads(self):
+        response = self.client.get(reverse("contact"))
+        self.assertContains(response, '<script type="module" src="/static/Js/core.js"></script>')
+        self.assertContains(response, '<link rel="modulepreload" href="/static/Js/lib/forms.js">')
+        self.assertContains(response, '<script type="module" src="/static/Js/pages/contact.js"></script>')
+
+    def test_pages_without_forms_only_load_the_core(self):
+        response = self.client.get(reverse("about"))
+        self.assertContains(response, '<script type="module" src="/static/Js/core.js"></script>')
+        self.assertNotContains(response, "Js/pages/")
+        self.assertNotContains(response, "modulepreload")
+
+
+class DashboardChartTests(TestCase):
+    def setUp(self):
+        caches[settings.CHART_CACHE_ALIAS].clear()
+        self.staff = get_user_model().objects.create_user(username="staff", password="pw", is_staff=True)
+        self.client.force_login(self.staff)
+        self.today = timezone.localdate()
+        with self.captureOnCommitCallbacks(execute=True):
+            make_project(budget=Decimal("1000.00"))
+            make_project(project_type="uiux", status="accepted", budget=Decimal("500.00"))
+            make_project(submitted_at=timezone.now() - timedelta(days=40))
+            make_message()
+
+    def get(self, **params):
+        return self.client.get(reverse("dashboard_charts"), params)
+
+    def test_staff_only(self):
+        self.client.logout()
+        self.assertEqual(self.get().status_code, 403)
+
+    def test_daily_series_is_columnar(self):
+        data = self.get().json()
+        self.assertEqual(len(data["buckets"]), 30)
+        self.assertEqual(data["buckets"][-1], self.today.isoformat())
+        self.assertEqual(data["projects"][-1], 2)
+        self.assertEqual(data["messages"][-1], 1)
+        self.assertEqual(data["budget"][-1], 1500.0)
+        self.assertEqual(sum(data["projects"]), 2)
+        types = dict(zip(data["types"]["keys"], data["types"]["count"]))
+        self.assertEqual((types["web"], types["uiux"]), (1, 1))
+        statuses = dict(zip(data["statuses"]["keys"], data["statuses"]["count"]))
+        self.assertEqual((statuses["pending"], statuses["accepted"]), (1, 1))
+
+    def test_monthly_buckets_cover_older_rows(self):
+        data = self.get(period="month").json()
+        self.assertEqual(len(data["buckets"]), 12)
+        self.assertTrue(all(day.endswith("-01") for day in data["buckets"]))
+        self.assertEqual(sum(data["projects"]), 3)
+
+    def test_invalid_requests(self):
+        self.assertEqual(self.get(period="year").status_code, 400)
+        self.assertEqual(self.get(start="yesterday").status_code, 400)
+        self.assertEqual(self.get(start="2020-01-01", end="2026-01-01").status_code, 400)
+
+    def test_conditional_get_until_a_write(self):
+        etag = self.get()["ETag"]
+        # The session and user lookups and the data version: the payload
+        # comes from the cache.
+        with self.assertNumQueries(3):
+            self.assertEqual(self.get()["ETag"], etag)
+        with self.assertNumQueries(3):
+            cached = self.client.get(reverse("dashboard_charts"), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(cached.status_code, 304)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            make_message()
+        fresh = self.client.get(reverse("dashboard_charts"), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(fresh.status_code, 200)
+        self.assertNotEqual(fresh["ETag"], etag)
+        self.assertEqual(fresh.json()["messages"][-1], 2)
+
+    def test_version_is_shared_and_follows_moves(self):
+        before = charts.version()
+        # Another process has its own cache; it reads the same version.
+        caches[settings.CHART_CACHE_ALIAS].clear()
+        self.assertEqual(charts.version(), before)
+
+        # A status change moves counts between buckets without changing totals.
+        rollups.update_queryset(ProjectSubmission.objects.filter(status="pending"), status="reviewed")
+        self.assertNotEqual(charts.version(), before)
+
+    def test_chart_library_is_served_locally(self):
+        page = self.client.get(reverse("admin_dashboard"))
+        self.assertContains(page, "Js/vendor/chart.umd.min.js")
+        self.assertNotContains(page, "cdn.jsdelivr.net/npm/chart.js")
+
+
+@override_settings(DATABASE_REPLICA_ALIAS="replica", REPLICA_MAX_LAG_SECONDS=5)
+class ReplicaRouterTests(SimpleTestCase):
+    def setUp(self):
+        self.router = replicas.ReplicaRouter()
+        replicas._lag = (None, 0.0)
+        self.addCleanup(setattr, replicas, "_lag", (None, 0.0))
+        patcher = mock.patch.object(replicas, "measure_lag", return_value=0.0)
+        self.measure_lag = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def route(self, model=ProjectSubmission, write_first=False):
+        def read():
+            if write_first:
+                self.router.db_for_write(model)
+            with replicas.replica_reads():
+                return self.router.db_for_read(model)
+
+        # An empty context per call, like a fresh request.
+        return contextvars.Context().run(read)
+
+    def test_only_marked_app_reads_use_the_replica(self):
+        self.assertIsNone(self.router.db_for_read(ProjectSubmission))
+        self.assertEqual(self.route(), "replica")
+        self.assertIsNone(self.route(get_user_model()))
+        self.assertEqual(self.router.db_for_write(ProjectSubmission), "default")
+
+    @override_settings(DATABASE_REPLICA_ALIAS=None)
+    def test_no_replica_configured(self):
+        self.assertIsNone(self.route())
+
+    def test_reads_after_a_write_stay_on_the_primary(self):
+        self.assertIsNone(self.route(write_first=True))
+
+    def test_lagging_or_unreachable_replica_falls_back(self):
+        self.measure_lag.return_value = 30.0
+        self.assertIsNone(self.route())
+        # The measurement is reused until REPLICA_LAG_CHECK_SECONDS pass.
+        self.measure_lag.return_value = 0.0
+        self.assertIsNone(self.route())
+        self.assertEqual(self.measure_lag.call_count, 1)
+
+        replicas._lag = (None, 0.0)
+        self.measure_lag.side_effect = ConnectionError("refused")
+        with self.assertLogs("Frontend.replicas", "WARNING"):
+            self.assertIsNone(self.route())
+
+    def test_middleware_pins_a_client_after_it_writes(self):
+        def writing_view(request):
+            self.router.db_for_write(ProjectSubmission)
+            return HttpResponse()
+
+        def reading_view(request):
+            with replicas.replica_reads():
+                return HttpResponse(self.router.db_for_read(ProjectSubmission) or "default")
+
+        factory = RequestFactory()
+        response = replicas.ReplicaPinMiddleware(writing_view)(factory.post("/"))
+        cookie = response.cookies[settings.REPLICA_PIN_COOKIE]
+        self.assertEqual(cookie["max-age"], settings.REPLICA_PIN_SECONDS)
+
+        pinned = factory.get("/")
+        pinned.COOKIES[settings.REPLICA_PIN_COOKIE] = "1"
+        response = replicas.ReplicaPinMiddleware(reading_view)(pinned)
+        self.assertEqual(response.content, b"default")
+        self.assertNotIn(settings.REPLICA_PIN_COOKIE, response.cookies)
+
+        response = replicas.ReplicaPinMiddleware(reading_view)(factory.get("/"))
+        self.assertEqual(response.content, b"replica")
+
+    def test_async_stack_is_not_adapted(self):
+        async def writing_view(request):
+            # The write happens in a worker thread, as a sync ORM call would.
+            await sync_to_async(self.router.db_for_write)(ProjectSubmission)
+            return HttpResponse()
+
+        middleware = replicas.ReplicaPinMiddleware(writing_view)
+        self.assertTrue(iscoroutinefunction(middleware))
+        response = async_to_sync(middleware)(RequestFactory().post("/"))
+        self.assertIn(settings.REPLICA_PIN_COOKIE, response.cookies)
+
+
+class SqliteReplicaSyncTests(TestCase):
+    @skipUnless(connection.vendor == "sqlite", "SQLite only")
+    def test_sync_writes_a_readable_copy(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        output = f"{directory}/replica.sqlite3"
+        call_command("sync_sqlite_replica", output=output, stdout=StringIO())
+
+        with sqlite3.connect(output) as copy:
+            tables = {row[0] for row in copy.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+        self.assertIn(ProjectSubmission._meta.db_table, tables)
+
+
+class WarmupTests(SimpleTestCase):
+    def test_run_compiles_every_template_and_builds_the_resolver(self):
+        timings = warmup.run(touch_db=False)
+        self.assertEqual(set(timings), {"templates", "urls"})
+
+        engine = engines.all()[0].engine
+        cached = next(loader for loader in engine.template_loaders if hasattr(loader, "get_template_cache"))
+        names = warmup.template_names()
+        self.assertIn("base.html", names)
+        self.assertTrue(set(names) <= set(cached.get_template_cache))
+
+    def test_url_patterns_are_unique(self):
+        routes = [str(pattern.pattern) for pattern in get_resolver("Frontend.urls").url_patterns]
+        self.assertEqual(len(routes), len(set(routes)))
+
+    @override_settings(WARMUP_ON_BOOT=True)
+    def test_connections_are_closed_by_the_pre_fork_hook_only(self):
+        with mock.patch("os.register_at_fork") as register_at_fork:
+            warmup.run_on_boot(touch_db=False)
+        register_at_fork.assert_not_called()
+
+        with mock.patch.object(warmup.connections, "close_all") as close_all:
+            warmup.pre_fork(server=None, worker=None)
+        close_all.assert_called_once_with()
+
+    def test_parse_importtime(self):
+        stderr = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       120 |        120 |   json.decoder\n"
+            "import time:       300 |        420 | json\n"
+        )
+        self.assertEqual(
+            profile_startup.parse_importtime(stderr),
+            [("json.decoder", 120, 120, 1), ("json", 300, 420, 0)],
+        )
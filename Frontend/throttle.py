@@ -0,0 +1,198 @@
+# Frontend/throttle.py
+"""Token-bucket throttling for the submission endpoints and upload creation.
+
+``SubmissionThrottleMiddleware`` sits near the top of MIDDLEWARE and answers
+over-limit POSTs with 429 + ``Retry-After`` before sessions, CSRF, body
+parsing or the ORM are touched. Each client IP gets a bucket of
+``THROTTLE_IP_BURST`` tokens refilled at ``THROTTLE_IP_RATE`` per second, and
+all clients share one ``THROTTLE_GLOBAL_*`` bucket that caps total write
+load.
+
+Buckets live in process memory by default. Setting ``THROTTLE_CACHE_ALIAS``
+to a cache shared by the workers (file-based, memcached, ...) makes them
+shared too, at the cost of a cache round trip per check; updates are not
+atomic across workers, so a burst can overshoot by a few requests.
+"""
+import math
+import threading
+import time
+from collections import OrderedDict
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.http import JsonResponse
+from django.urls import reverse
+
+THROTTLED_VIEWS = [
+    "submit_project",
+    "submit_contact",
+    "submit_project_async",
+    "submit_contact_async",
+    # Starting an upload reserves disk; the chunk PATCHes that follow are
+    # not throttled, or a large file could never finish.
+    "create_upload",
+]
+
+
+class TokenBuckets:
+    """In-memory buckets keyed by client, evicted after ``ttl`` idle seconds.
+
+    Each bucket is a two-item list ``[tokens, updated_at]`` in an OrderedDict
+    kept in least-recently-used order, so eviction only looks at the front.
+    """
+
+    def __init__(self, rate, burst, ttl, max_keys):
+        self.rate = rate
+        self.burst = burst
+        self.ttl = ttl
+        self.max_keys = max_keys
+        self._buckets = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._buckets)
+
+    def take(self, key, now=None):
+        """Spend a token for ``key``; returns 0 or the seconds until one is free"""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = [self.burst, now]
+                self._evict(now)
+            else:
+                self._buckets.move_to_end(key)
+                bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+                bucket[1] = now
+            return _spend(bucket, self.rate)
+
+    def refund(self, key):
+        """Give back a token spent on a request that was refused after all"""
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                bucket[0] = min(self.burst, bucket[0] + 1)
+
+    def _evict(self, now):
+        buckets = self._buckets
+        while buckets:
+            key, (_, updated_at) = next(iter(buckets.items()))
+            if len(buckets) <= self.max_keys and now - updated_at < self.ttl:
+                break
+            del buckets[key]
+
+
+class CacheTokenBuckets:
+    """The same buckets stored in a Django cache, for sharing across workers"""
+
+    def __init__(self, rate, burst, ttl, alias, prefix="throttle"):
+        self.rate = rate
+        self.burst = burst
+        self.ttl = ttl
+        self.cache = caches[alias]
+        self.prefix = prefix
+
+    def take(self, key, now=None):
+        # Wall-clock time, since the value is read by other processes.
+        now = time.time() if now is None else now
+        cache_key = f"{self.prefix}:{key}"
+        tokens, updated_at = self.cache.get(cache_key) or (self.burst, now)
+        bucket = [min(self.burst, tokens + max(0, now - updated_at) * self.rate), now]
+        wait = _spend(bucket, self.rate)
+        self.cache.set(cache_key, tuple(bucket), self.ttl)
+        return wait
+
+    def refund(self, key):
+        cache_key = f"{self.prefix}:{key}"
+        bucket = self.cache.get(cache_key)
+        if bucket is not None:
+            tokens, updated_at = bucket
+            self.cache.set(cache_key, (min(self.burst, tokens + 1), updated_at), self.ttl)
+
+
+def _spend(bucket, rate):
+    if bucket[0] >= 1:
+        bucket[0] -= 1
+        return 0
+    return (1 - bucket[0]) / rate
+
+
+def make_buckets(rate, burst, prefix):
+    alias = settings.THROTTLE_CACHE_ALIAS
+    if alias:
+        return CacheTokenBuckets(rate, burst, settings.THROTTLE_TTL, alias, prefix)
+    return TokenBuckets(rate, burst, settings.THROTTLE_TTL, settings.THROTTLE_MAX_KEYS)
+
+
+def client_ip(request):
+    header = settings.THROTTLE_CLIENT_IP_HEADER
+    if header and request.META.get(header):
+        # X-Forwarded-For style lists: the proxy appends, so trust the last hop.
+        return request.META[header].split(",")[-1].strip()
+    return request.META.get("REMOTE_ADDR", "")
+
+
+class SubmissionThrottleMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+        self.per_ip = make_buckets(settings.THROTTLE_IP_RATE, settings.THROTTLE_IP_BURST, "throttle:ip")
+        self.global_ = make_buckets(
+            settings.THROTTLE_GLOBAL_RATE, settings.THROTTLE_GLOBAL_BURST, "throttle:global"
+        )
+        self._paths = None
+
+    @property
+    def paths(self):
+        # Resolved on first use; the URLconf may not be loaded in __init__.
+        if self._paths is None:
+            self._paths = frozenset(reverse(name) for name in THROTTLED_VIEWS)
+        return self._paths
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        if self.applies(request):
+            wait = self.take(request)
+            if wait:
+                return self.throttled(wait)
+        return self.get_response(request)
+
+    async def __acall__(self, request):
+        if self.applies(request):
+            if isinstance(self.per_ip, CacheTokenBuckets):
+                # A shared cache is a network round trip; keep it off the loop.
+                wait = await sync_to_async(self.take, thread_sensitive=False)(request)
+            else:
+                wait = self.take(request)
+            if wait:
+                return self.throttled(wait)
+        return await self.get_response(request)
+
+    def applies(self, request):
+        return request.method == "POST" and request.path_info in self.paths
+
+    def take(self, request):
+        # Per-IP first, so one flooding client cannot drain the global bucket.
+        ip = client_ip(request)
+        wait = self.per_ip.take(ip)
+        if not wait:
+            wait = self.global_.take("all")
+            if wait:
+                # Refused anyway: the client is not charged for it.
+                self.per_ip.refund(ip)
+        return wait
+
+    def throttled(self, wait):
+        response = JsonResponse(
+            {"success": False, "error": "Too many submissions. Please try again shortly."},
+            status=429,
+        )
+        response["Retry-After"] = str(math.ceil(wait))
+        return response
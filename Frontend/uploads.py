@@ -0,0 +1,233 @@
+# Frontend/uploads.py
+"""Resumable chunked uploads into a content-addressed store.
+
+A client creates an upload (declared name and size), then PATCHes the bytes
+in any number of chunks, each tagged with the ``Upload-Offset`` it starts
+at. After a dropped connection it asks for the current offset and carries
+on from there. Chunks are copied from the request stream to the partial
+file ``UPLOAD_READ_SIZE`` bytes at a time, so a worker's memory use does not
+grow with the file size.
+
+When the last byte arrives the file is hashed and moved to
+``MEDIA_ROOT/cas/<aa>/<bb>/<sha256>``. Identical content is stored once; a
+second upload of the same file is simply discarded. ``submit_project``
+references stored files by hash (``attachments``). ``purge_unreferenced``
+deletes stored files no project (live or archived) or spooled submission
+references once they are ``UPLOAD_TTL`` old, so uploads that were never
+attached do not pile up.
+"""
+import hashlib
+import json
+import os
+import re
+import secrets
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.core.files import locks
+
+from .models import ArchivedRecord, ProjectSubmission
+
+_UPLOAD_ID = re.compile(r"^[\w-]{20,64}$")
+_SHA256 = re.compile(r"^[0-9a-f]{64}$")
+_HASHES = re.compile(r"\b[0-9a-f]{64}\b")
+
+
+class UploadError(Exception):
+    """A request the upload protocol rejects; ``status`` is the HTTP status"""
+
+    def __init__(self, message, status=400, offset=None):
+        super().__init__(message)
+        self.status = status
+        self.offset = offset
+
+
+def cas_root():
+    return Path(settings.MEDIA_ROOT) / "cas"
+
+
+def partial_root():
+    return Path(settings.MEDIA_ROOT) / "uploads"
+
+
+def cas_path(sha256):
+    return cas_root() / sha256[:2] / sha256[2:4] / sha256
+
+
+def _paths(upload_id):
+    if not _UPLOAD_ID.match(upload_id):
+        raise UploadError("Unknown upload", status=404)
+    base = partial_root() / upload_id
+    return base.with_suffix(".json"), base.with_suffix(".part")
+
+
+def _read_meta(upload_id):
+    meta_path, part_path = _paths(upload_id)
+    try:
+        meta = json.loads(meta_path.read_text())
+    except FileNotFoundError:
+        raise UploadError("Unknown upload", status=404)
+    return meta, meta_path, part_path
+
+
+def create(name, size):
+    """Start an upload of ``size`` bytes; returns its status dict"""
+    try:
+        size = int(size)
+    except (TypeError, ValueError):
+        raise UploadError("size must be an integer")
+    if not 0 < size <= settings.UPLOAD_MAX_BYTES:
+        raise UploadError(f"size must be between 1 and {settings.UPLOAD_MAX_BYTES} bytes", status=413)
+    name = os.path.basename(str(name or "upload"))[:200]
+
+    upload_id = secrets.token_urlsafe(24)
+    meta_path, part_path = _paths(upload_id)
+    partial_root().mkdir(parents=True, exist_ok=True)
+    part_path.touch()
+    meta_path.write_text(json.dumps({"name": name, "size": size, "created": time.time()}))
+    return status(upload_id)
+
+
+def status(upload_id):
+    meta, meta_path, part_path = _read_meta(upload_id)
+    result = {"id": upload_id, "name": meta["name"], "size": meta["size"]}
+    if "sha256" in meta:
+        result.update(offset=meta["size"], sha256=meta["sha256"])
+    else:
+        result["offset"] = part_path.stat().st_size
+    return result
+
+
+def append(upload_id, offset, stream, length):
+    """Copy ``length`` bytes from ``stream`` to the upload, starting at ``offset``"""
+    meta, meta_path, part_path = _read_meta(upload_id)
+    if "sha256" in meta:
+        raise UploadError("Upload already complete", status=409, offset=meta["size"])
+    if offset is None or length is None:
+        raise UploadError("Upload-Offset and Content-Length are required", status=411)
+    if offset + length > meta["size"]:
+        raise UploadError("Chunk runs past the declared size", status=413)
+
+    with open(part_path, "ab") as f:
+        # One writer per upload; a second concurrent PATCH is told to retry.
+        if not locks.lock(f, locks.LOCK_EX | locks.LOCK_NB):
+            raise UploadError("Another chunk is being written", status=409)
+        try:
+            current = f.seek(0, os.SEEK_END)
+            if offset != current:
+                raise UploadError("Offset mismatch", status=409, offset=current)
+            remaining = length
+            while remaining:
+                chunk = stream.read(min(settings.UPLOAD_READ_SIZE, remaining))
+                if not chunk:
+                    break
+                f.write(chunk)
+                remaining -= len(chunk)
+            f.flush()
+            offset = f.tell()
+        finally:
+            locks.unlock(f)
+
+    if offset == meta["size"]:
+        meta["sha256"] = _store(part_path)
+        meta_path.write_text(json.dumps(meta))
+    return status(upload_id)
+
+
+def _store(part_path):
+    """Hash the finished file and move it into the content-addressed store"""
+    digest = hashlib.sha256()
+    with open(part_path, "rb") as f:
+        while chunk := f.read(settings.UPLOAD_READ_SIZE):
+            digest.update(chunk)
+    sha256 = digest.hexdigest()
+    target = cas_path(sha256)
+    if target.exists():
+        part_path.unlink()
+        # Restart its clock for purge_unreferenced: it is about to be attached.
+        os.utime(target)
+    else:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(part_path, target)
+    return sha256
+
+
+def attachments(value):
+    """Validate the ``attachments`` of a project payload; returns JSON text.
+
+    Accepts a list of hashes or of ``{"sha256": ..., "name": ...}`` objects
+    and checks each file is in the store.
+    """
+    if not value:
+        return ""
+    if not isinstance(value, list):
+        raise ValueError("attachments must be a list")
+    files = []
+    for item in value:
+        if isinstance(item, str):
+            item = {"sha256": item}
+        sha256 = str(item.get("sha256", "")).lower()
+        if not _SHA256.match(sha256):
+            raise ValueError(f"Invalid attachment hash {sha256!r}")
+        path = cas_path(sha256)
+        if not path.exists():
+            raise ValueError(f"Unknown attachment {sha256}")
+        name = os.path.basename(str(item.get("name") or sha256))[:200]
+        files.append({"sha256": sha256, "name": name, "size": path.stat().st_size})
+    return json.dumps(files)
+
+
+def purge_stale(max_age):
+    """Delete unfinished uploads idle for ``max_age`` seconds; returns the count"""
+    cutoff = time.time() - max_age
+    removed = 0
+    for meta_path in partial_root().glob("*.json"):
+        part_path = meta_path.with_suffix(".part")
+        last_activity = max(
+            meta_path.stat().st_mtime,
+            part_path.stat().st_mtime if part_path.exists() else 0,
+        )
+        if last_activity < cutoff:
+            part_path.unlink(missing_ok=True)
+            meta_path.unlink(missing_ok=True)
+            removed += 1
+    return removed
+
+
+def referenced_hashes():
+    """Every hash a project, archived project or spooled submission attaches"""
+    referenced = set()
+    live = ProjectSubmission.objects.exclude(attached_files="").exclude(attached_files=None)
+    for text in live.values_list("attached_files", flat=True).iterator():
+        referenced.update(_HASHES.findall(text))
+    archived = ArchivedRecord.objects.filter(source="project")
+    for payload in archived.values_list("payload", flat=True).iterator():
+        referenced.update(_HASHES.findall(str(payload.get("attached_files") or "")))
+    # Rows the write-behind queue spooled are inserted later by replay_ingest_spool.
+    spool = Path(settings.INGEST_SPOOL_PATH)
+    for path in (spool, spool.with_name(spool.name + ".replaying")):
+        if path.exists():
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    referenced.update(_HASHES.findall(line))
+    return referenced
+
+
+def purge_unreferenced(max_age):
+    """Delete stored files older than ``max_age`` seconds that nothing
+    references; returns the count"""
+    cutoff = time.time() - max_age
+    candidates = [
+        path for path in cas_root().glob("*/*/*")
+        if _SHA256.match(path.name) and path.stat().st_mtime < cutoff
+    ]
+    if not candidates:
+        return 0
+    referenced = referenced_hashes()
+    removed = 0
+    for path in candidates:
+        if path.name not in referenced:
+            path.unlink(missing_ok=True)
+            removed += 1
+    return removed
@@ -14,12 +14,16 @@ urlpatterns = [
     path("startproject/", views.startproject, name="startproject"),
     path("contact/", views.contact, name="contact"),
     path("admin_dashboard/", views.admin_dashboard, name="admin_dashboard"),
+    path("admin_dashboard/charts/", views.dashboard_charts, name="dashboard_charts"),
+    path("metrics/", views.metrics, name="metrics"),
     path("project-catalyst/", views.project_catalyst_view, name="project_catalyst"),
     path("submit-project/", views.submit_project, name="submit_project"),
+    # Resumable chunked uploads for project attachments
+    path("uploads/", views.create_upload, name="create_upload"),
+    path("uploads/<str:upload_id>/", views.upload, name="upload"),
     path("", views.index, name="home"),
-    # Contact form
-    path("contact/", views.contact_view, name="contact"),
-    # Project Catalyst form
-    path("project-catalyst/", views.project_catalyst_view, name="project_catalyst"),
     path('submit-contact/', views.submit_contact, name='submit_contact'), 
+    # Async endpoints with write-behind batching (serve through asgi.py)
+    path("submit-project/async/", views.submit_project_async, name="submit_project_async"),
+    path("submit-contact/async/", views.submit_contact_async, name="submit_contact_async"),
 ]
@@ -1,18 +1,28 @@
 from django.shortcuts import render, redirect
-from django.http import JsonResponse
-from django.views.decorators.http import require_POST
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden, HttpResponseNotModified, JsonResponse
+from django.urls import reverse
+from django.views.decorators.http import require_http_methods, require_POST
 from django.views.decorators.csrf import csrf_exempt
-from django.utils import timezone
-from django.db.models import Sum, Avg
+from django.core.exceptions import ValidationError
+from django.utils.cache import patch_cache_control
+from django.utils.crypto import constant_time_compare
+import asyncio
 import json
+from concurrent.futures import Future
 from .models import ProjectSubmission, ContactMessage
-from .forms import ContactMessageForm
+from .pagecache import cached_page, etag_matches
+from . import charts, dedupe, ingest, stats, uploads
+from .replicas import replica_reads
+from . import metrics as metrics_module
 
 
+@cached_page
 def index(request):
     return render(request, "index.html")
 
 
+@cached_page
 def about(request):
     return render(request, "about.html")
 
@@ -21,34 +31,43 @@ def contact(request):
     return render(request, "contact.html")
 
 
+@cached_page
 def services(request):
     return render(request, "services.html")
 
 
+@cached_page
 def portfolio(request):
     return render(request, "portfolio.html")
 
 
+@cached_page
 def webdev(request):
     return render(request, "webdev.html")
 
 
+@cached_page
 def uiux(request):
     return render(request, "uiux.html")
 
 
+@cached_page
 def graphicdesign(request):
     return render(request, "graphicdesign.html")
 
 
+@cached_page
 def brandidentity(request):
     return render(request, "brandidentity.html")
 
 
+# Its scripts post to submit-project/ and uploads/ with the CSRF cookie.
+@cached_page(csrf_cookie=True)
 def startproject(request):
     return render(request, "startproject.html")
 
 
+@cached_page
 def project_catalyst_view(request):
     return render(request, "project_catalyst.html")
 
@@ -58,64 +77,27 @@ def submit_project(request):
     try:
         data = json.loads(request.body)
 
-        # Create project submission
-        ProjectSubmission.objects.create(
-            project_type=data.get("project_type"),
-            client_name=data.get("client_name"),
-            email=data.get("email"),
-            company=data.get("company", ""),
-            phone=data.get("phone", ""),
-            project_title=data.get("project_title"),
-            project_description=data.get("project_description"),
-            budget=float(data.get("budget", 0).replace("$", "").replace(",", "")),
-            timeline=data.get("timeline"),
-            reference_links=data.get("reference_links", ""),
-            heard_from=data.get("heard_from", ""),
-            additional_notes=data.get("additional_notes", ""),
-        )
+        # Create project submission (a repeat returns the original's id)
+        project = ProjectSubmission(**ingest.project_fields(data))
+        pk = dedupe.save_once(project, dedupe.request_key(request, data))
 
         return JsonResponse(
-            {"success": True, "message": "Project submitted successfully!"}
+            {"success": True, "message": "Project submitted successfully!", "id": pk}
         )
+    except dedupe.KeyReused as e:
+        return JsonResponse({"success": False, "error": str(e)}, status=422)
     except Exception as e:
         return JsonResponse({"success": False, "error": str(e)}, status=400)
 
 
-def contact_view(request):
-    if request.method == "POST":
-        form = ContactMessageForm(request.POST)
-        if form.is_valid():
-            form.save()
-            return JsonResponse(
-                {"success": True, "message": "Message sent successfully!"}
-            )
-        return JsonResponse({"success": False, "errors": form.errors})
-    return render(request, "contact.html", {"form": ContactMessageForm()})
-
-
+@replica_reads()
 def admin_dashboard(request):
     if not request.user.is_staff:
         return redirect("admin:login")
 
-    # Get statistics for dashboard
-    project_stats = {
-        "total": ProjectSubmission.objects.count(),
-        "total_budget": ProjectSubmission.objects.aggregate(Sum("budget"))[
-            "budget__sum"
-        ]
-        or 0,
-        "avg_budget": ProjectSubmission.objects.aggregate(Avg("budget"))["budget__avg"]
-        or 0,
-        "pending": ProjectSubmission.objects.filter(status="pending").count(),
-    }
-
-    contact_stats = {
-        "total": ContactMessage.objects.count(),
-        "unread": ContactMessage.objects.filter(is_read=False).count(),
-        "today": ContactMessage.objects.filter(
-            submitted_at__date=timezone.now().date()
-        ).count(),
-    }
+    # One aggregate query per model (see Frontend/stats.py)
+    project_stats = stats.project_stats()
+    contact_stats = stats.contact_stats()
 
     recent_projects = ProjectSubmission.objects.all()[:5]
     recent_messages = ContactMessage.objects.all()[:5]
@@ -130,26 +112,110 @@ def admin_dashboard(request):
     return render(request, "admin_dashboard.html", context)
 
 
+@require_http_methods(["GET", "HEAD"])
+@replica_reads()
+def dashboard_charts(request):
+    """Chart series for the dashboard: ?period=day|week|month&start=&end="""
+    if not request.user.is_staff:
+        return JsonResponse({"success": False, "error": "Staff only"}, status=403)
+    try:
+        period, start, end = charts.date_range(
+            request.GET.get("period", "day"), request.GET.get("start"), request.GET.get("end")
+        )
+    except charts.ChartError as e:
+        return JsonResponse({"success": False, "error": str(e)}, status=400)
+
+    key = charts.cache_key(period, start, end)
+    etag = charts.etag(key)
+    if etag_matches(request, etag):
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(charts.payload(key, period, start, end), content_type="application/json")
+    response["ETag"] = etag
+    # Revalidated on every load; a 304 costs one cache lookup.
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+@require_POST
+def create_upload(request):
+    """Start a resumable upload: {"name", "size"} -> upload id and offset"""
+    try:
+        data = json.loads(request.body)
+        upload = uploads.create(data.get("name"), data.get("size"))
+    except uploads.UploadError as e:
+        return JsonResponse({"success": False, "error": str(e)}, status=e.status)
+    except Exception as e:
+        return JsonResponse({"success": False, "error": str(e)}, status=400)
+    response = JsonResponse({"success": True, **upload}, status=201)
+    response["Location"] = reverse("upload", args=[upload["id"]])
+    return response
+
+
+def _int_header(request, key):
+    try:
+        return int(request.META[key])
+    except (KeyError, ValueError):
+        return None
+
+
+@require_http_methods(["GET", "HEAD", "PATCH"])
+def upload(request, upload_id):
+    """Upload status (GET/HEAD) or the next chunk (PATCH with Upload-Offset)"""
+    try:
+        if request.method == "PATCH":
+            # Streams from the request; request.body is never read.
+            result = uploads.append(
+                upload_id,
+                _int_header(request, "HTTP_UPLOAD_OFFSET"),
+                request,
+                _int_header(request, "CONTENT_LENGTH"),
+            )
+        else:
+            result = uploads.status(upload_id)
+    except uploads.UploadError as e:
+        response = JsonResponse({"success": False, "error": str(e)}, status=e.status)
+        if e.offset is not None:
+            response["Upload-Offset"] = e.offset
+        return response
+    response = JsonResponse({"success": True, **result})
+    response["Upload-Offset"] = result["offset"]
+    response["Cache-Control"] = "no-store"
+    return response
+
+
+def metrics(request):
+    """Prometheus metrics for staff, or for a scraper holding METRICS_TOKEN"""
+    token = settings.METRICS_TOKEN
+    authorized = request.user.is_staff or (
+        token
+        and constant_time_compare(request.headers.get("Authorization", ""), f"Bearer {token}")
+    )
+    if not authorized:
+        return HttpResponseForbidden()
+    return HttpResponse(
+        metrics_module.render_prometheus(), content_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
 @csrf_exempt
 def submit_contact(request):
     if request.method == "POST":
         try:
             data = json.loads(request.body.decode('utf-8'))
             
-            # Save to database
-            contact = ContactMessage.objects.create(
-                name=data.get('name', '').strip(),
-                email=data.get('email', '').strip(),
-                subject=data.get('subject', '').strip(),
-                message=data.get('message', '').strip(),
-            )
+            # Save to database (a repeat returns the original's id)
+            contact = ContactMessage(**ingest.contact_fields(data))
+            pk = dedupe.save_once(contact, dedupe.request_key(request, data))
             
             return JsonResponse({
                 "success": True,
                 "message": "Message sent successfully!",
-                "id": contact.id  # Make sure it's contact.id, not contact
+                "id": pk
             })
             
+        except dedupe.KeyReused as e:
+            return JsonResponse({"success": False, "error": str(e)}, status=422)
         except Exception as e:
             return JsonResponse({
                 "success": False,
@@ -160,3 +226,71 @@ def submit_contact(request):
         "success": False,
         "error": "Method not allowed"
     }, status=405)
+
+
+async def _ingest(instance, key=None):
+    # validate_unique would query for idempotency_key; the write-behind
+    # batch checks it instead (see dedupe.resolve_batch).
+    instance.full_clean(validate_unique=False)
+    dedupe.prepare(instance, key)
+    pending = dedupe.lookup(instance)
+    if isinstance(pending, Future):
+        try:
+            return await _wait(pending)
+        except dedupe.KeyReused:
+            # Refused for the request that queued it, which may have
+            # carried another key; this one is queued and checked afresh.
+            pending = None
+    if pending is None:
+        pending = ingest.get_queue().submit(instance)
+        dedupe.remember(instance, pending)
+        return await _wait(pending)
+    return pending
+
+
+def _wait(future):
+    # Duplicates share one future: a client that disconnects must not
+    # cancel it for the others.
+    return asyncio.shield(asyncio.wrap_future(future))
+
+
+def _acknowledge(pk, message):
+    if pk is None:
+        # Spooled for replay_ingest_spool: accepted, but not stored yet.
+        return JsonResponse(
+            {"success": True, "status": "queued", "message": message, "id": None}, status=202
+        )
+    return JsonResponse({"success": True, "status": "stored", "message": message, "id": pk})
+
+
+@require_POST
+async def submit_project_async(request):
+    """Async submit_project: validates, then hands the row to the write-behind queue"""
+    try:
+        data = json.loads(request.body)
+        project = ProjectSubmission(**ingest.project_fields(data))
+        pk = await _ingest(project, dedupe.request_key(request, data))
+    except ValidationError as e:
+        return JsonResponse({"success": False, "errors": e.message_dict}, status=400)
+    except dedupe.KeyReused as e:
+        return JsonResponse({"success": False, "error": str(e)}, status=422)
+    except Exception as e:
+        return JsonResponse({"success": False, "error": str(e)}, status=400)
+    return _acknowledge(pk, "Project submitted successfully!")
+
+
+@csrf_exempt
+@require_POST
+async def submit_contact_async(request):
+    """Async submit_contact: validates, then hands the row to the write-behind queue"""
+    try:
+        data = json.loads(request.body.decode("utf-8"))
+        contact = ContactMessage(**ingest.contact_fields(data))
+        pk = await _ingest(contact, dedupe.request_key(request, data))
+    except ValidationError as e:
+        return JsonResponse({"success": False, "errors": e.message_dict}, status=400)
+    except dedupe.KeyReused as e:
+        return JsonResponse({"success": False, "error": str(e)}, status=422)
+    except Exception as e:
+        return JsonResponse({"success": False, "error": str(e)}, status=400)
+    return _acknowledge(pk, "Message sent successfully!")
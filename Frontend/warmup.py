@@ -0,0 +1,93 @@
+# Frontend/warmup.py
+"""Worker warm-up, run at boot from PortfolioWebsite/wsgi.py and asgi.py.
+
+A cold worker otherwise pays on its first requests for what every request
+after them gets for free: compiling templates into the cached loader,
+importing the URLconf (and with it the views and the admin) and building
+the resolver's reverse dictionary, and opening a database connection
+(plus the per-connection SQLite pragmas). ``run`` does all of that up
+front and returns the seconds each step took; ``manage.py profile_startup``
+reports them next to the import cost of each module.
+
+Set ``WARMUP_ON_BOOT=0`` to skip it. Under a preloading server (gunicorn
+``--preload``) the connection opened here must be closed before the workers
+fork, so they never share a socket: call ``pre_fork`` from the server's
+pre-fork hook. Its signature matches gunicorn's, so a gunicorn config can
+simply say ``from Frontend.warmup import pre_fork``.
+"""
+import logging
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.template import engines
+from django.urls import get_resolver, reverse
+
+logger = logging.getLogger(__name__)
+
+TEMPLATE_DIR = Path(__file__).resolve().parent / "templates"
+
+
+def template_names(directory=TEMPLATE_DIR):
+    return sorted(
+        path.relative_to(directory).as_posix() for path in directory.rglob("*.html") if path.is_file()
+    )
+
+
+def load_templates():
+    """Compile every template into the cached loader; returns the count"""
+    count = 0
+    for engine in engines.all():
+        for name in template_names():
+            try:
+                engine.get_template(name)
+            except Exception as e:
+                logger.warning("Warm-up could not load template %s: %s", name, e)
+                continue
+            count += 1
+    return count
+
+
+def load_urls():
+    resolver = get_resolver()
+    # reverse_dict populates the resolver, importing every view module.
+    resolver.reverse_dict
+    reverse("admin:index")
+    return len(resolver.reverse_dict)
+
+
+def connect():
+    connection = connections[DEFAULT_DB_ALIAS]
+    connection.ensure_connection()
+    return connection.vendor
+
+
+def pre_fork(server=None, worker=None):
+    """Close this process's database connections before a worker is forked"""
+    connections.close_all()
+
+
+def run(touch_db=True):
+    """Warm this process up; returns {step: seconds}"""
+    timings = {}
+    steps = [("templates", load_templates), ("urls", load_urls)]
+    if touch_db:
+        steps.append(("database", connect))
+    for name, step in steps:
+        started = time.perf_counter()
+        try:
+            step()
+        except Exception:
+            # A cold worker is slower, not broken: serve anyway.
+            logger.exception("Warm-up step %s failed", name)
+        timings[name] = time.perf_counter() - started
+    return timings
+
+
+def run_on_boot(touch_db=True):
+    if not settings.WARMUP_ON_BOOT:
+        return {}
+    timings = run(touch_db)
+    logger.info("Warm-up took %s", ", ".join(f"{k} {v * 1000:.0f} ms" for k, v in timings.items()))
+    return timings
@@ -14,3 +14,10 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'PortfolioWebsite.settings')
 
 application = get_asgi_application()
+
+# Compile templates and build the URL resolver before the first request
+# arrives (Frontend/warmup.py). Sync views run in a worker thread with its
+# own connection, so a connection opened here would go unused.
+from Frontend.warmup import run_on_boot  # noqa: E402
+
+run_on_boot(touch_db=False)
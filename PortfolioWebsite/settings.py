@@ -1,4 +1,5 @@
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -30,21 +31,27 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'Frontend.metrics.MetricsMiddleware',
     'corsheaders.middleware.CorsMiddleware', 
     'django.middleware.security.SecurityMiddleware',
+    'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    # Serves prerendered pages before sessions, auth and CSRF run.
+    'Frontend.prerender.PrerenderedPageMiddleware',
+    'Frontend.replicas.ReplicaPinMiddleware',
+    'Frontend.throttle.SubmissionThrottleMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
-    'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
 ROOT_URLCONF = 'PortfolioWebsite.urls'
 
 TEMPLATES = [
     {
-        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        # DjangoTemplates that reports render time to Frontend.metrics
+        'BACKEND': 'Frontend.metrics.TimedDjangoTemplates',
         'DIRS': [],
         'APP_DIRS': True,
         'OPTIONS': {
@@ -59,17 +66,215 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'PortfolioWebsite.wsgi.application'
 
+# Workers compile templates, build the URL resolver and connect to the
+# database at boot (Frontend/warmup.py). manage.py profile_startup fails
+# when importing the app takes longer than STARTUP_IMPORT_BUDGET_MS. A
+# preloading server must call Frontend.warmup.pre_fork before each fork.
+WARMUP_ON_BOOT = os.environ.get('WARMUP_ON_BOOT', '1') != '0'
+STARTUP_IMPORT_BUDGET_MS = int(os.environ.get('STARTUP_IMPORT_BUDGET_MS', 1500))
+
 
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+# DATABASE_PROFILE picks the backend: 'sqlite' (default) or 'postgresql'.
+# Both keep connections open between requests (CONN_MAX_AGE) and check them
+# before reuse instead of reconnecting on every request.
+DATABASE_PROFILE = os.environ.get('DATABASE_PROFILE', 'sqlite')
+CONN_MAX_AGE = int(os.environ.get('CONN_MAX_AGE', 600))
+
+if DATABASE_PROFILE == 'postgresql':
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': os.environ.get('POSTGRES_DB', 'portfolio'),
+            'USER': os.environ.get('POSTGRES_USER', 'portfolio'),
+            'PASSWORD': os.environ.get('POSTGRES_PASSWORD', ''),
+            'HOST': os.environ.get('POSTGRES_HOST', 'localhost'),
+            'PORT': os.environ.get('POSTGRES_PORT', '5432'),
+            'CONN_MAX_AGE': CONN_MAX_AGE,
+            'CONN_HEALTH_CHECKS': True,
+            'OPTIONS': {
+                'connect_timeout': 5,
+                'application_name': 'portfolio',
+            },
+        }
     }
+    # Behind PgBouncer in transaction pooling mode the pool lives in the
+    # bouncer: server-side cursors cannot survive across its transactions.
+    if os.environ.get('POSTGRES_PGBOUNCER') == '1':
+        DATABASES['default']['DISABLE_SERVER_SIDE_CURSORS'] = True
+    # A streaming-replication standby of the same database
+    if os.environ.get('POSTGRES_REPLICA_HOST'):
+        DATABASES['replica'] = {
+            **DATABASES['default'],
+            'HOST': os.environ['POSTGRES_REPLICA_HOST'],
+            'PORT': os.environ.get('POSTGRES_REPLICA_PORT', DATABASES['default']['PORT']),
+        }
+else:
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': BASE_DIR / 'db.sqlite3',
+            'CONN_MAX_AGE': CONN_MAX_AGE,
+            'CONN_HEALTH_CHECKS': True,
+            'OPTIONS': {'timeout': 5},
+        }
+    }
+    # A copy of the database file refreshed by manage.py sync_sqlite_replica;
+    # a local stand-in for a real replica.
+    if os.environ.get('SQLITE_REPLICA_PATH'):
+        DATABASES['replica'] = {**DATABASES['default'], 'NAME': os.environ['SQLITE_REPLICA_PATH']}
+
+# Staff and analytics reads (dashboard, charts, changelists, exports) go to
+# the replica through Frontend.replicas.ReplicaRouter; everything else, and
+# any client that wrote within REPLICA_PIN_SECONDS, stays on the primary, as
+# does every read while the replica lags more than REPLICA_MAX_LAG_SECONDS.
+if 'replica' in DATABASES:
+    # Tests run against the primary's test database.
+    DATABASES['replica']['TEST'] = {'MIRROR': 'default'}
+DATABASE_REPLICA_ALIAS = 'replica' if 'replica' in DATABASES else None
+DATABASE_ROUTERS = ['Frontend.replicas.ReplicaRouter']
+REPLICA_MAX_LAG_SECONDS = float(os.environ.get('REPLICA_MAX_LAG_SECONDS', 5))
+REPLICA_LAG_CHECK_SECONDS = 5
+REPLICA_PIN_SECONDS = 15
+REPLICA_PIN_COOKIE = 'db_pin'
+
+# Applied to every new SQLite connection (Frontend/signals.py). WAL lets
+# readers run alongside a writer; it needs a local disk, so set
+# SQLITE_JOURNAL_MODE=DELETE where the database lives on a network share.
+SQLITE_PRAGMAS = {
+    'journal_mode': os.environ.get('SQLITE_JOURNAL_MODE', 'WAL'),
+    'synchronous': 'NORMAL',
+    'busy_timeout': 5000,
+    'cache_size': -20000,  # KiB, i.e. 20 MB of page cache per connection
+    'mmap_size': 128 * 1024 * 1024,
+    'temp_store': 'MEMORY',
+}
+
+# Caches
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'pages': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'pages',
+    },
 }
 
+# Full-page cache for the marketing views (see Frontend/pagecache.py).
+# Bump PAGE_CACHE_VERSION on every deploy so stale pages are never served.
+PAGE_CACHE_ALIAS = 'pages'
+PAGE_CACHE_VERSION = os.environ.get('PAGE_CACHE_VERSION', '1')
+PAGE_CACHE_TIMEOUT = 60 * 60 * 24
+
+# Admin dashboard chart data (Frontend/charts.py): rendered payloads are
+# cached per rollup data version, read from the database. The timeout bounds
+# memory use and how long a change committed out of order can go unseen.
+CHART_CACHE_ALIAS = 'default'
+CHART_CACHE_TIMEOUT = 5 * 60
+CHART_MAX_BUCKETS = 400
+
+# Prerendered marketing pages (manage.py prerender_pages). When
+# PRERENDER_SERVE is on, snapshots for PAGE_CACHE_VERSION are served from disk.
+PRERENDER_ROOT = BASE_DIR / 'prerendered'
+PRERENDER_SERVE = os.environ.get('PRERENDER_SERVE', '') == '1'
+
+# Write-behind queue for the async submission endpoints (Frontend/ingest.py)
+INGEST_BATCH_SIZE = int(os.environ.get('INGEST_BATCH_SIZE', 100))
+INGEST_FLUSH_MS = int(os.environ.get('INGEST_FLUSH_MS', 20))
+INGEST_SPOOL_PATH = BASE_DIR / 'ingest-spool.ndjson'
+
+# User uploads: resumable chunked uploads land in a content-addressed store
+# under MEDIA_ROOT (Frontend/uploads.py). Bodies are copied UPLOAD_READ_SIZE
+# bytes at a time. manage.py purge_uploads removes unfinished uploads idle for
+# UPLOAD_TTL, and stored files that old which no submission references.
+MEDIA_URL = '/media/'
+MEDIA_ROOT = BASE_DIR / 'media'
+UPLOAD_MAX_BYTES = int(os.environ.get('UPLOAD_MAX_BYTES', 100 * 1024 * 1024))
+UPLOAD_READ_SIZE = 64 * 1024
+UPLOAD_TTL = 24 * 60 * 60
+
+# Repeated submissions within this many seconds return the original row
+# (Frontend/dedupe.py); the LRU remembers this many recent fingerprints.
+DEDUPE_WINDOW = int(os.environ.get('DEDUPE_WINDOW', 600))
+DEDUPE_CACHE_SIZE = 10000
+
+# Token-bucket throttling of the submission endpoints (Frontend/throttle.py).
+# Rates are tokens per second; bursts are bucket sizes. Set
+# THROTTLE_CACHE_ALIAS to a cache the workers share to pool their buckets.
+THROTTLE_IP_RATE = float(os.environ.get('THROTTLE_IP_RATE', 0.2))
+THROTTLE_IP_BURST = int(os.environ.get('THROTTLE_IP_BURST', 10))
+THROTTLE_GLOBAL_RATE = float(os.environ.get('THROTTLE_GLOBAL_RATE', 20))
+THROTTLE_GLOBAL_BURST = int(os.environ.get('THROTTLE_GLOBAL_BURST', 100))
+THROTTLE_TTL = 600
+THROTTLE_MAX_KEYS = 10000
+THROTTLE_CACHE_ALIAS = os.environ.get('THROTTLE_CACHE_ALIAS') or None
+# e.g. HTTP_X_REAL_IP behind a proxy that sets it; REMOTE_ADDR otherwise
+THROTTLE_CLIENT_IP_HEADER = os.environ.get('THROTTLE_CLIENT_IP_HEADER') or None
+
+# Rows fetched per round trip by the streaming exports (Frontend/exports.py)
+EXPORT_CHUNK_SIZE = 2000
+
+# manage.py archive_records moves accepted/rejected submissions and archived
+# messages older than ARCHIVE_RETENTION_DAYS into Frontend.ArchivedRecord,
+# ARCHIVE_CHUNK_SIZE rows per transaction (Frontend/archive.py).
+ARCHIVE_RETENTION_DAYS = int(os.environ.get('ARCHIVE_RETENTION_DAYS', 365))
+ARCHIVE_CHUNK_SIZE = 500
+
+# Outgoing mail. New submissions are announced to NOTIFY_RECIPIENTS by
+# manage.py send_notifications, which drains the outbox written alongside
+# each submission (Frontend/notifications.py): a burst arriving within
+# NOTIFY_COALESCE_SECONDS goes out as one digest of up to NOTIFY_BATCH_SIZE
+# rows; failed sends back off exponentially from NOTIFY_BACKOFF_SECONDS.
+EMAIL_BACKEND = os.environ.get('EMAIL_BACKEND', 'django.core.mail.backends.smtp.EmailBackend')
+EMAIL_HOST = os.environ.get('EMAIL_HOST', 'localhost')
+EMAIL_PORT = int(os.environ.get('EMAIL_PORT', 25))
+EMAIL_HOST_USER = os.environ.get('EMAIL_HOST_USER', '')
+EMAIL_HOST_PASSWORD = os.environ.get('EMAIL_HOST_PASSWORD', '')
+EMAIL_USE_TLS = os.environ.get('EMAIL_USE_TLS', '0') == '1'
+EMAIL_TIMEOUT = 10
+EMAIL_SUBJECT_PREFIX = '[Project Catalyst] '
+DEFAULT_FROM_EMAIL = os.environ.get('DEFAULT_FROM_EMAIL', 'webmaster@localhost')
+NOTIFY_RECIPIENTS = [e.strip() for e in os.environ.get('NOTIFY_RECIPIENTS', '').split(',') if e.strip()]
+NOTIFY_SITE_URL = os.environ.get('NOTIFY_SITE_URL', '')
+NOTIFY_BATCH_SIZE = 50
+NOTIFY_COALESCE_SECONDS = 30
+NOTIFY_LEASE_SECONDS = 300
+NOTIFY_MAX_ATTEMPTS = 8
+NOTIFY_BACKOFF_SECONDS = 30
+NOTIFY_BACKOFF_MAX = 3600
+
+# Admin bulk actions over more than BULK_JOB_INLINE_LIMIT rows run as
+# background jobs (Frontend/jobs.py): BULK_JOB_CHUNK_SIZE rows per
+# transaction, BULK_JOB_PAUSE_MS between chunks. BULK_JOB_RUNNER "thread"
+# runs them in the web process; "worker" leaves them to run_bulk_jobs. A
+# runner renews its lease on a job with every chunk; a job whose runner died
+# is picked up again once BULK_JOB_LEASE_SECONDS pass without a renewal.
+BULK_JOB_INLINE_LIMIT = 500
+BULK_JOB_CHUNK_SIZE = int(os.environ.get('BULK_JOB_CHUNK_SIZE', 1000))
+BULK_JOB_PAUSE_MS = int(os.environ.get('BULK_JOB_PAUSE_MS', 50))
+BULK_JOB_RUNNER = os.environ.get('BULK_JOB_RUNNER', 'thread')
+BULK_JOB_LEASE_SECONDS = 300
+
+# manage.py benchmark_routes compares its report against this baseline and
+# fails when a route is slower / allocates more by over the threshold.
+BENCHMARK_BASELINE_PATH = BASE_DIR / 'benchmarks' / 'baseline.json'
+BENCHMARK_THRESHOLD = 0.25
+
+# Per-view latency / query / template metrics (Frontend/metrics.py), served
+# to staff at /metrics/. METRICS_TOKEN, when set, also lets a scraper in with
+# "Authorization: Bearer <token>".
+METRICS_ENABLED = os.environ.get('METRICS_ENABLED', '1') == '1'
+METRICS_SERVER_TIMING = os.environ.get('METRICS_SERVER_TIMING', '1') == '1'
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN', '')
+
+# Admin changelists: how long a filtered COUNT(*) is reused
+APPROXIMATE_COUNT_TIMEOUT = 60
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -106,6 +311,40 @@ USE_TZ = True
 
 STATIC_URL = 'static/'
 STATICFILES_DIRS = [BASE_DIR / 'static']
+STATIC_ROOT = BASE_DIR / 'staticfiles'
+
+# Responsive image variants (manage.py build_image_derivatives), served
+# under STATIC_URL/derivatives/ once they have been built. The manifest the
+# {% responsive_image %} tag reads stays out of the collected files.
+IMAGE_DERIVATIVES_DIR = BASE_DIR / 'build' / 'derivatives'
+IMAGE_MANIFEST_PATH = BASE_DIR / 'build' / 'images.json'
+IMAGE_DERIVATIVE_WIDTHS = [320, 480, 640, 960, 1280]
+if IMAGE_DERIVATIVES_DIR.is_dir():
+    STATICFILES_DIRS.append(('derivatives', IMAGE_DERIVATIVES_DIR))
+
+# Per-page critical CSS and the purged stylesheet (manage.py
+# build_critical_css), served under STATIC_URL/critical/. The fold is the
+# first CRITICAL_FOLD_ELEMENTS elements of a page.
+CRITICAL_CSS_DIR = BASE_DIR / 'build' / 'critical'
+CRITICAL_CSS_SOURCE = 'style/main.css'
+CRITICAL_FOLD_ELEMENTS = int(os.environ.get('CRITICAL_FOLD_ELEMENTS', 120))
+if CRITICAL_CSS_DIR.is_dir():
+    STATICFILES_DIRS.append(('critical', CRITICAL_CSS_DIR))
+
+# collectstatic writes content-hashed, minified, precompressed copies
+# (see Frontend/assets.py) and {% static %} resolves to the hashed names.
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'Frontend.assets.OptimizedManifestStaticFilesStorage',
+    },
+}
+
+# Serve STATIC_ROOT through Frontend.assets.serve_static (picks .br/.gz by
+# Accept-Encoding) when the front-end server is not configured to do it.
+SERVE_STATIC = os.environ.get('SERVE_STATIC', '') == '1'
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
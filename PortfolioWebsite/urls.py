@@ -1,14 +1,21 @@
 # PortfolioWebsite/urls.py (or your_project_name/urls.py)
 from django.contrib import admin
-from django.urls import path, include
+from django.urls import path, include, re_path
 from django.conf import settings
 from django.conf.urls.static import static
+from Frontend.assets import serve_static
 
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('', include('Frontend.urls')),  # Include your app's URLs
 ]
 
+# Hashed, precompressed static assets from STATIC_ROOT
+if settings.SERVE_STATIC:
+    urlpatterns += [
+        re_path(r'^%s(?P<path>.*)$' % settings.STATIC_URL.lstrip('/'), serve_static),
+    ]
+
 # Serve static files during development
 # if settings.DEBUG:
 #     urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
@@ -14,3 +14,9 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'PortfolioWebsite.settings')
 
 application = get_wsgi_application()
+
+# Compile templates, build the URL resolver and connect before the first
+# request arrives (Frontend/warmup.py).
+from Frontend.warmup import run_on_boot  # noqa: E402
+
+run_on_boot()
@@ -0,0 +1,144 @@
+/**
+ * =============================================
+ * CORE: NAVIGATION & SCROLL FUNCTIONALITY
+ * =============================================
+ *
+ * Loaded on every page. Page-specific behaviour lives in Js/pages/ and is
+ * added by the templates that need it ({% module_script %}).
+ */
+
+const navbar = document.getElementById('navbar');
+const navMenu = document.getElementById('navMenu');
+const mobileToggle = document.getElementById('mobileToggle');
+
+// Navbar Scroll Effect
+window.addEventListener('scroll', () => {
+    if (navbar) navbar.classList.toggle('scrolled', window.scrollY > 50);
+});
+
+function setMenuOpen(open) {
+    navMenu.classList.toggle('show', open);
+    navbar.classList.toggle('mobile-open', open);
+
+    // Change icon
+    const icon = mobileToggle.querySelector('i');
+    if (icon) {
+        icon.classList.toggle('fa-bars', !open);
+        icon.classList.toggle('fa-times', open);
+    }
+}
+
+// Mobile Menu Toggle
+function initMobileMenu() {
+    if (!mobileToggle || !navMenu || !navbar) return;
+
+    mobileToggle.addEventListener('click', (e) => {
+        e.preventDefault();
+        e.stopPropagation();
+        setMenuOpen(!navMenu.classList.contains('show'));
+    });
+
+    // Close menu when clicking outside
+    document.addEventListener('click', (e) => {
+        if (!navMenu.contains(e.target) && !mobileToggle.contains(e.target)) {
+            setMenuOpen(false);
+        }
+    });
+
+    // Close menu when clicking a link
+    document.querySelectorAll('.nav-link').forEach(link => {
+        link.addEventListener('click', () => {
+            if (window.innerWidth <= 768) setMenuOpen(false);
+        });
+    });
+
+    // Handle dropdown menus for mobile
+    const dropdownToggle = document.querySelector('#servicesDropdown > .nav-link');
+    if (dropdownToggle) {
+        dropdownToggle.addEventListener('click', function(e) {
+            if (window.innerWidth <= 768) {
+                e.preventDefault();
+                this.parentElement.classList.toggle('dropdown-open');
+            }
+        });
+    }
+}
+
+// Smooth Scroll
+function initSmoothScroll() {
+    document.querySelectorAll('a[href^="#"]').forEach(anchor => {
+        anchor.addEventListener('click', function(e) {
+            if (this.getAttribute('href') === '#') return;
+
+            e.preventDefault();
+            const target = document.querySelector(this.getAttribute('href'));
+            if (target) {
+                // Close mobile menu if open
+                if (navMenu && navMenu.classList.contains('show')) setMenuOpen(false);
+
+                target.scrollIntoView({
+                    behavior: 'smooth',
+                    block: 'start'
+                });
+            }
+        });
+    });
+}
+
+// Back to Top Button
+function initBackToTop() {
+    const backToTop = document.getElementById('backToTop');
+    if (!backToTop) return;
+
+    window.addEventListener('scroll', () => {
+        backToTop.classList.toggle('visible', window.pageYOffset > 300);
+    });
+
+    backToTop.addEventListener('click', (e) => {
+        e.preventDefault();
+        window.scrollTo({
+            top: 0,
+            behavior: 'smooth'
+        });
+    });
+}
+
+function initNavigationActiveState() {
+    const currentPath = window.location.pathname;
+
+    document.querySelectorAll('.nav-link').forEach(link => {
+        link.classList.remove('active');
+        const href = link.getAttribute('href');
+
+        if (href && href !== '#') {
+            // Remove .html extension if present for comparison
+            const linkPage = href.replace('.html', '');
+
+            if (currentPath.includes(linkPage) ||
+                (currentPath === '/' && (href === 'index.html' || href === '/'))) {
+                link.classList.add('active');
+            }
+        }
+    });
+}
+
+// Set current year in footer
+function setCurrentYear() {
+    const yearElement = document.getElementById('current-year');
+    if (yearElement) {
+        yearElement.textContent = new Date().getFullYear();
+    }
+}
+
+/**
+ * =============================================
+ * INITIALIZATION
+ * =============================================
+ */
+
+// Module scripts run once the document has been parsed.
+initMobileMenu();
+initSmoothScroll();
+initBackToTop();
+setCurrentYear();
+initNavigationActiveState();
@@ -0,0 +1,63 @@
+/**
+ * =============================================
+ * FORM UTILITIES (shared by the page modules)
+ * =============================================
+ */
+
+// One key per logical submission: a retry or double-click reuses it, so the
+// server answers with the row it already stored instead of writing another.
+const idempotencyKeys = {};
+
+export function getIdempotencyKey(form) {
+    if (!idempotencyKeys[form]) {
+        idempotencyKeys[form] = window.crypto && crypto.randomUUID
+            ? crypto.randomUUID()
+            : `${Date.now().toString(36)}-${Math.random().toString(36).slice(2)}`;
+    }
+    return idempotencyKeys[form];
+}
+
+export function clearIdempotencyKey(form) {
+    delete idempotencyKeys[form];
+}
+
+// Get CSRF Token
+export function getCsrfToken() {
+    let cookieValue = null;
+    if (document.cookie && document.cookie !== '') {
+        const cookies = document.cookie.split(';');
+        for (let i = 0; i < cookies.length; i++) {
+            const cookie = cookies[i].trim();
+            if (cookie.substring(0, 10) === ('csrftoken=')) {
+                cookieValue = decodeURIComponent(cookie.substring(10));
+                break;
+            }
+        }
+    }
+    return cookieValue;
+}
+
+// Show message (used by both forms)
+export function showMessage(text, type) {
+    // Create message container if it doesn't exist
+    let messageContainer = document.getElementById('globalMessage');
+    if (!messageContainer) {
+        messageContainer = document.createElement('div');
+        messageContainer.id = 'globalMessage';
+        messageContainer.className = 'global-message';
+        document.body.appendChild(messageContainer);
+    }
+    
+    messageContainer.textContent = text;
+    messageContainer.className = `global-message global-message-${type}`;
+    messageContainer.style.display = 'block';
+    
+    // Auto-hide after 5 seconds
+    setTimeout(() => {
+        messageContainer.style.opacity = '0';
+        setTimeout(() => {
+            messageContainer.style.display = 'none';
+            messageContainer.style.opacity = '1';
+        }, 300);
+    }, 5000);
+}
@@ -0,0 +1,73 @@
+import { getCsrfToken } from './forms.js';
+
+/**
+ * Resumable chunked uploads: each file is sent in UPLOAD_CHUNK_SIZE pieces
+ * tagged with the offset they start at. After a failed chunk the server is
+ * asked where it got to and the upload carries on from there.
+ */
+const UPLOAD_CHUNK_SIZE = 1024 * 1024;
+const UPLOAD_RETRIES = 5;
+const finishedUploads = new Map();
+
+export async function uploadAttachments(button) {
+    const input = document.querySelector('#step4 input[type="file"]');
+    const files = input ? Array.from(input.files) : [];
+    const attachments = [];
+    for (const file of files) {
+        button.innerHTML = `<i class="fas fa-spinner fa-spin"></i> Uploading ${file.name}...`;
+        attachments.push({ sha256: await uploadFile(file), name: file.name });
+    }
+    return attachments;
+}
+
+export async function uploadFile(file) {
+    // Files already uploaded by an earlier, failed submission are not resent.
+    const fileKey = `${file.name}:${file.size}:${file.lastModified}`;
+    if (finishedUploads.has(fileKey)) return finishedUploads.get(fileKey);
+
+    const created = await fetch('/uploads/', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json', 'X-CSRFToken': getCsrfToken() },
+        body: JSON.stringify({ name: file.name, size: file.size })
+    });
+    let upload = await created.json();
+    if (!created.ok) throw new Error(upload.error || 'Upload failed');
+
+    let retries = 0;
+    while (!upload.sha256) {
+        const chunk = file.slice(upload.offset, upload.offset + UPLOAD_CHUNK_SIZE);
+        let response = null;
+        let failure = null;
+        try {
+            response = await fetch(`/uploads/${upload.id}/`, {
+                method: 'PATCH',
+                headers: {
+                    'Content-Type': 'application/offset+octet-stream',
+                    'Upload-Offset': String(upload.offset),
+                    'X-CSRFToken': getCsrfToken()
+                },
+                body: chunk
+            });
+        } catch (error) {
+            failure = error;
+        }
+        if (response && response.ok) {
+            upload = await response.json();
+            retries = 0;
+            continue;
+        }
+        // 409: another chunk landed first or the offset drifted.
+        if (response && response.status !== 409) {
+            throw new Error((await response.json()).error || 'Upload failed');
+        }
+        // Network errors and offset mismatches back off the same way, so an
+        // offset that keeps drifting cannot spin on the server.
+        if (++retries > UPLOAD_RETRIES) throw failure || new Error('Upload failed');
+        await new Promise(resolve => setTimeout(resolve, 500 * 2 ** retries));
+        // Resume from wherever the server got to.
+        const status = await fetch(`/uploads/${upload.id}/`).catch(() => null);
+        if (status && status.ok) upload = await status.json();
+    }
+    finishedUploads.set(fileKey, upload.sha256);
+    return upload.sha256;
+}
@@ -0,0 +1,100 @@
+import { clearIdempotencyKey, getIdempotencyKey } from '../lib/forms.js';
+
+/**
+ * =============================================
+ * CONTACT FORM - HTML MESSAGES ONLY
+ * =============================================
+ */
+
+function initContactForm() {
+    const contactForm = document.getElementById('contactForm');
+    if (!contactForm) return;
+    
+    contactForm.addEventListener('submit', async function(e) {
+        e.preventDefault();
+        
+        const submitBtn = this.querySelector('button[type="submit"]');
+        const originalText = submitBtn.innerHTML;
+        
+        // Create message container if it doesn't exist
+        let messageContainer = document.getElementById('formMessage');
+        if (!messageContainer) {
+            messageContainer = document.createElement('div');
+            messageContainer.id = 'formMessage';
+            messageContainer.className = 'form-message';
+            contactForm.appendChild(messageContainer);
+        }
+        
+        // Hide previous messages
+        messageContainer.style.display = 'none';
+        messageContainer.className = 'form-message';
+        messageContainer.textContent = '';
+        
+        // Show loading
+        submitBtn.innerHTML = '<i class="fas fa-spinner fa-spin"></i> Sending...';
+        submitBtn.disabled = true;
+        
+        try {
+            // Get form data
+            const formData = new FormData(this);
+            const data = Object.fromEntries(formData.entries());
+            
+            // Get CSRF token
+            const csrfToken = document.querySelector('[name=csrfmiddlewaretoken]')?.value;
+            
+            // Send to server
+            const response = await fetch('/submit-contact/', {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json',
+                    'X-CSRFToken': csrfToken,
+                    'Idempotency-Key': getIdempotencyKey('contact')
+                },
+                body: JSON.stringify(data)
+            });
+            
+            const result = await response.json();
+            
+            if (result.success) {
+                clearIdempotencyKey('contact');
+                // Show HTML success message
+                showMessage('✅ Message sent successfully! We\'ll get back to you soon.', 'success');
+                
+                // Clear form
+                this.reset();
+            } else {
+                // Show HTML error message
+                showMessage(`❌ ${result.error || 'Failed to send message. Please try again.'}`, 'error');
+            }
+            
+        } catch (error) {
+            console.error('Error:', error);
+            showMessage('❌ An error occurred. Please try again.', 'error');
+        } finally {
+            // Restore button
+            submitBtn.innerHTML = originalText;
+            submitBtn.disabled = false;
+        }
+    });
+    
+    // Function to show messages
+    function showMessage(text, type) {
+        const messageContainer = document.getElementById('formMessage');
+        if (!messageContainer) return;
+        
+        messageContainer.textContent = text;
+        messageContainer.className = `form-message form-message-${type}`;
+        messageContainer.style.display = 'block';
+        
+        // Auto-hide after 5 seconds (optional)
+        setTimeout(() => {
+            messageContainer.style.opacity = '0';
+            setTimeout(() => {
+                messageContainer.style.display = 'none';
+                messageContainer.style.opacity = '1';
+            }, 300);
+        }, 5000);
+    }
+}
+
+initContactForm();
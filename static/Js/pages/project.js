@@ -0,0 +1,216 @@
+import { clearIdempotencyKey, getCsrfToken, getIdempotencyKey, showMessage } from '../lib/forms.js';
+import { uploadAttachments } from '../lib/uploads.js';
+
+/**
+ * =============================================
+ * PROJECT CATALYST FORM
+ * =============================================
+ */
+
+function initProjectCatalyst() {
+    const projectForm = document.querySelector('.creative-wrapper');
+    if (!projectForm) return;
+    
+    let currentStep = 1;
+    const totalSteps = 4;
+    
+    // Initialize progress bar
+    const progressFill = document.getElementById('progressFill');
+    const steps = document.querySelectorAll('.progress-step');
+    
+    function updateProgress() {
+        const progress = ((currentStep - 1) / (totalSteps - 1)) * 100;
+        if (progressFill) progressFill.style.width = progress + '%';
+        
+        steps.forEach(step => {
+            const stepNum = parseInt(step.getAttribute('data-step'));
+            step.classList.remove('active', 'completed');
+            
+            if (stepNum === currentStep) {
+                step.classList.add('active');
+            } else if (stepNum < currentStep) {
+                step.classList.add('completed');
+            }
+        });
+    }
+    
+    // Project type selection
+    const projectCards = document.querySelectorAll('.inspiration-card');
+    projectCards.forEach(card => {
+        card.addEventListener('click', function() {
+            projectCards.forEach(c => c.classList.remove('selected'));
+            this.classList.add('selected');
+            
+            // Enable next button
+            const nextBtn = document.getElementById('nextBtn');
+            if (nextBtn) nextBtn.disabled = false;
+        });
+    });
+    
+    // Budget slider
+    const budgetSlider = document.getElementById('budgetSlider');
+    const budgetValue = document.getElementById('budgetValue');
+    
+    if (budgetSlider && budgetValue) {
+        budgetSlider.addEventListener('input', function() {
+            const value = parseInt(this.value).toLocaleString();
+            budgetValue.textContent = `$${value}`;
+        });
+    }
+    
+    // Navigation
+    const prevBtn = document.getElementById('prevBtn');
+    const nextBtn = document.getElementById('nextBtn');
+    const sections = document.querySelectorAll('.vision-section');
+    
+    function showStep(step) {
+        sections.forEach(section => {
+            section.classList.remove('active');
+        });
+        
+        const stepElement = document.getElementById(`step${step}`);
+        if (stepElement) stepElement.classList.add('active');
+        
+        // Update navigation buttons
+        if (prevBtn) prevBtn.style.display = step === 1 ? 'none' : 'flex';
+        
+        if (step === totalSteps) {
+            if (nextBtn) {
+                nextBtn.innerHTML = '<i class="fas fa-paper-plane"></i> Submit Project';
+                nextBtn.classList.add('btn-submit');
+                nextBtn.classList.remove('btn-next');
+            }
+        } else {
+            if (nextBtn) {
+                nextBtn.innerHTML = `Next Step <i class="fas fa-arrow-right"></i>`;
+                nextBtn.classList.remove('btn-submit');
+                nextBtn.classList.add('btn-next');
+            }
+        }
+        
+        currentStep = step;
+        updateProgress();
+        window.scrollTo({ top: 0, behavior: 'smooth' });
+    }
+    
+    if (prevBtn) {
+        prevBtn.addEventListener('click', () => {
+            if (currentStep > 1) showStep(currentStep - 1);
+        });
+    }
+    
+    if (nextBtn) {
+        nextBtn.addEventListener('click', () => {
+            if (currentStep < totalSteps) {
+                showStep(currentStep + 1);
+            } else {
+                submitProject();
+            }
+        });
+    }
+    
+    function validateStep(step) {
+        const stepElement = document.getElementById(`step${step}`);
+        if (!stepElement) return true;
+        
+        if (step === 1) {
+            const selected = document.querySelector('.inspiration-card.selected');
+            if (!selected) {
+                showMessage('Please select a project type to continue.', 'error');
+                return false;
+            }
+        } else if (step === 2) {
+            const requiredInputs = stepElement.querySelectorAll('[required]');
+            for (let input of requiredInputs) {
+                if (!input.value.trim()) {
+                    showMessage('Please fill in all required fields.', 'error');
+                    input.focus();
+                    return false;
+                }
+            }
+        }
+        return true;
+    }
+    
+    async function submitProject() {
+        if (!validateStep(currentStep)) return;
+        
+        const nextBtn = document.getElementById('nextBtn');
+        if (!nextBtn) return;
+        
+        // Show loading
+        const originalText = nextBtn.innerHTML;
+        nextBtn.innerHTML = '<i class="fas fa-spinner fa-spin"></i> Processing...';
+        nextBtn.disabled = true;
+        
+        try {
+            const projectData = collectProjectData();
+            projectData.attachments = await uploadAttachments(nextBtn);
+            
+            // Send to server
+            const response = await fetch('/submit-project/', {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json',
+                    'X-CSRFToken': getCsrfToken(),
+                    'Idempotency-Key': getIdempotencyKey('project')
+                },
+                body: JSON.stringify(projectData)
+            });
+            
+            const result = await response.json();
+            
+            if (result.success) {
+                clearIdempotencyKey('project');
+                // Show success screen
+                document.querySelector('.creative-navigation').style.display = 'none';
+                document.getElementById(`step${currentStep}`).classList.remove('active');
+                document.getElementById('successScreen').classList.add('active');
+            } else {
+                showMessage(result.error || 'Submission failed. Please try again.', 'error');
+                nextBtn.innerHTML = originalText;
+                nextBtn.disabled = false;
+            }
+        } catch (error) {
+            console.error('Error submitting project:', error);
+            showMessage('Failed to submit project. Please try again.', 'error');
+            nextBtn.innerHTML = originalText;
+            nextBtn.disabled = false;
+        }
+    }
+    
+    function collectProjectData() {
+        // Get project type
+        const selectedCard = document.querySelector('.inspiration-card.selected');
+        
+        return {
+            project_type: selectedCard ? selectedCard.dataset.type : '',
+            client_name: document.querySelector('#step2 input[placeholder*="name"]')?.value || '',
+            email: document.querySelector('#step2 input[type="email"]')?.value || '',
+            company: document.querySelector('#step2 input[placeholder*="business name"]')?.value || '',
+            phone: document.querySelector('#step2 input[type="tel"]')?.value || '',
+            project_title: document.querySelector('#step2 input[placeholder*="project a name"]')?.value || '',
+            project_description: document.querySelector('#step2 textarea')?.value || '',
+            budget: budgetValue?.textContent || '$0',
+            timeline: document.querySelector('input[name="timeline"]:checked')?.value || 'standard',
+            reference_links: document.querySelector('#step3 textarea')?.value || '',
+            heard_from: document.querySelector('.idea-select')?.value || '',
+            additional_notes: document.querySelector('#step4 textarea')?.value || ''
+        };
+    }
+    
+    // Initialize first step
+    updateProgress();
+    if (prevBtn) prevBtn.style.display = 'none';
+    
+    // Add animations to cards
+    setTimeout(() => {
+        projectCards.forEach((card, index) => {
+            card.style.animationDelay = `${index * 0.1}s`;
+            card.style.animation = 'fadeInUp 0.5s ease forwards';
+            card.style.opacity = '0';
+        });
+    }, 300);
+}
+
+initProjectCatalyst();